@@ -0,0 +1,7 @@
+"""Benchmarks for the export engine.
+
+Run individual benchmarks as modules from the repository root, e.g.
+``python -m benchmarks.startup``. ``benchmarks.suite`` runs the full
+matrix of formats and modes on trees from ``benchmarks.synthetic`` and
+compares the results with a saved JSON baseline.
+"""
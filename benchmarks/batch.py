@@ -0,0 +1,88 @@
+"""Compare a batch export with one main.py invocation per project.
+
+Generates ``--projects`` synthetic projects, exports them once with a
+separate interpreter per project (the old nightly loop), then with
+``run_batch`` on one process and on ``--processes`` processes. Two of
+the projects share a dotted name (``v1.2-api``), which must get distinct
+outputs with the suffix before the extension. A project listed several
+times must be planned once, and two explicit outputs to one path must be
+rejected. Exits 1 if any of that fails, or if any project fails.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.startup import REPO_ROOT  # noqa: E402
+from benchmarks.synthetic import TreeSpec, generate_tree  # noqa: E402
+from exporter import ExportOptions  # noqa: E402
+from exporter.batch import BatchJob, plan_jobs, run_batch  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=24)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--fanout", type=int, default=4)
+    args = parser.parse_args()
+
+    options = ExportOptions()
+    with tempfile.TemporaryDirectory() as tmp:
+        dirs = []
+        for i in range(args.projects):
+            path = os.path.join(tmp, f"service_{i:03d}")
+            generate_tree(path, TreeSpec(seed=i, depth=args.depth, fanout=args.fanout))
+            dirs.append(path)
+        for group in ("team_a", "team_b"):
+            path = os.path.join(tmp, group, "v1.2-api")
+            generate_tree(path, TreeSpec(depth=args.depth, fanout=args.fanout))
+            dirs.append(path)
+        out = os.path.join(tmp, "out")
+        os.makedirs(out)
+        jobs = plan_jobs([BatchJob(d, "") for d in dirs], options, out)
+        repeated = plan_jobs([BatchJob(dirs[0], "")] * 4, options)
+        try:
+            plan_jobs([BatchJob(d, os.path.join(out, "same.md")) for d in dirs[:2]], options)
+            collision_rejected = False
+        except ValueError:
+            collision_rejected = True
+        plan_ok = len(repeated) == 1 and collision_rejected
+        print(f"repeated project planned {len(repeated)} time(s), "
+              f"colliding outputs {'rejected' if collision_rejected else 'ACCEPTED'}")
+        dotted = sorted(os.path.basename(job.output_file) for job in jobs[-2:])
+        expected = ["v1.2-api_structure_and_content-2.md", "v1.2-api_structure_and_content.md"]
+        names_ok = dotted == expected
+        print(f"dotted project names: {', '.join(dotted)}{'' if names_ok else ' (WRONG)'}")
+
+        start = time.perf_counter()
+        for job in jobs:
+            subprocess.run(
+                [sys.executable, os.path.join(REPO_ROOT, "main.py"), job.directory,
+                 "-o", job.output_file],
+                check=True, stdout=subprocess.DEVNULL,
+            )
+        separate = time.perf_counter() - start
+        print(f"one process per project: {separate:7.2f} s")
+
+        failed = 0
+        for processes in sorted({1, args.processes}):
+            start = time.perf_counter()
+            results = list(run_batch(jobs, options, processes))
+            elapsed = time.perf_counter() - start
+            failed = sum(not r.ok for r in results)
+            print(f"batch, {processes:2d} process(es):  {elapsed:7.2f} s "
+                  f"({separate / elapsed:.1f}x){f', {failed} failed' if failed else ''}")
+        outputs = sorted(os.listdir(out))
+
+    if not names_ok or not plan_ok or failed or len(outputs) != len(jobs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
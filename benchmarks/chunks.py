@@ -0,0 +1,121 @@
+"""Check jsonl-chunks offsets and line ranges, and time the chunker.
+
+Exports files with awkward line endings (CRLF, lone CR, form feeds and
+Unicode line separators), an empty file, non-ASCII text and a file cut
+by --max-file-bytes as jsonl-chunks. Every chunk's ``byte_start`` and
+``byte_end`` must slice its text out of the exported content (UTF-8,
+newlines normalized to ``\\n``), its line range must select the same
+lines, and the chunks must cover the whole content. Then it times
+chunking a synthetic tree. Exits 1 if any check fails.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import TreeSpec, generate_tree  # noqa: E402
+from exporter import ExportOptions, export_directory, iter_export  # noqa: E402
+
+# name -> raw bytes written to disk
+CASES = {
+    "crlf.txt": b"one\r\ntwo\r\nthree\r\n",
+    "lone_cr.txt": b"a\rb\rc\nd",
+    "mixed.txt": b"a\r\nb\nc\rd\r\n\r\n",
+    "separators.txt": "page\x0cbreak same line\x85still\nnext\n".encode("utf-8"),
+    "empty.txt": b"",
+    "unicode.txt": "héllo wörld ✓\n".encode("utf-8") * 300,
+    "truncated.txt": b"".join(b"line %d\r\n" % i for i in range(5000)),
+}
+
+
+def chunk_records(output: str):
+    with open(output, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            if record["type"] == "chunk":
+                yield record
+
+
+def consistent(content: str, chunks) -> bool:
+    """True if every chunk's offsets and lines point at its text and they cover ``content``."""
+    data = content.encode("utf-8")
+    lines = [line + "\n" for line in content.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    covered = 0
+    for chunk in chunks:
+        text = chunk["content"]
+        if data[chunk["byte_start"]:chunk["byte_end"]] != text.encode("utf-8"):
+            return False
+        if "".join(lines[chunk["line_start"] - 1:chunk["line_end"]]) != text:
+            return False
+        if chunk["byte_start"] > covered:
+            return False
+        covered = max(covered, chunk["byte_end"])
+    return covered == len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(name: str, ok: bool):
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    options = ExportOptions(
+        export_format="jsonl-chunks", chunk_bytes=64, chunk_overlap=1, max_file_bytes=4096,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        os.makedirs(project)
+        for name, data in CASES.items():
+            with open(os.path.join(project, name), "wb") as f:
+                f.write(data)
+        output = os.path.join(tmp, "chunks.jsonl")
+        export_directory(project, output, options)
+        chunks = {}
+        for chunk in chunk_records(output):
+            chunks.setdefault(chunk["file_path"], []).append(chunk)
+        contents = {record.path: record.content for record in iter_export(project, options)}
+
+        for name in CASES:
+            check(f"{name}: offsets and lines match the exported text",
+                  name in chunks and consistent(contents[name], chunks[name]))
+        check("crlf.txt: offsets count one byte per line ending",
+              chunks["crlf.txt"][-1]["byte_end"] == len("one\ntwo\nthree\n"))
+        check("lone_cr.txt: a lone CR ends a line, as in text mode",
+              chunks["lone_cr.txt"][-1]["line_end"] == 4)
+        check("separators.txt: only \\n ends a line",
+              chunks["separators.txt"][-1]["line_end"] == 2)
+        check("empty.txt: one empty chunk",
+              [c["content"] for c in chunks["empty.txt"]] == [""])
+
+        tree = os.path.join(tmp, "tree")
+        stats = generate_tree(tree, TreeSpec(depth=args.depth, fanout=args.fanout))
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            export_directory(tree, output, ExportOptions(export_format="jsonl-chunks"))
+            timings.append(time.perf_counter() - start)
+        size = os.path.getsize(output)
+
+    best = min(timings)
+    print(f"\n{stats.files} files, {stats.bytes / 1e6:.1f} MB -> {size / 1e6:.1f} MB of "
+          f"chunks in {best * 1000:.0f} ms ({stats.bytes / 1e6 / best:.1f} MB/s)")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
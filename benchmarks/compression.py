@@ -0,0 +1,74 @@
+"""Throughput and ratio of the streaming output codecs.
+
+Exports a real source tree (by default the Python standard library this
+interpreter ships with, capped by --max-total-bytes) once uncompressed and
+then through every codec and level, reporting export time, throughput in
+uncompressed MB/s and compression ratio. zstd is skipped when the
+optional zstandard package is not installed.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exporter import ExportEngine, ExportOptions  # noqa: E402
+from exporter.compression import COMPRESSION_EXTENSIONS  # noqa: E402
+from exporter.options import parse_size  # noqa: E402
+
+DEFAULT_LEVELS = {"gzip": [1, 6, 9], "zstd": [1, 3, 9, 19], "xz": [0, 6]}
+
+
+def export(project: str, output: str, options: ExportOptions) -> float:
+    start = time.perf_counter()
+    ExportEngine(options).generate_file_structure(project, output)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--project", default=os.path.dirname(os.__file__))
+    parser.add_argument("--format", default="markdown")
+    parser.add_argument("--max-total-bytes", type=parse_size, default=parse_size("32M"))
+    parser.add_argument("--codecs", nargs="+", default=list(DEFAULT_LEVELS))
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    options = ExportOptions(
+        export_format=args.format, max_total_bytes=args.max_total_bytes
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "export")
+        # Warm the page cache so every run reads the tree from memory
+        export(args.project, plain, options)
+        elapsed = min(export(args.project, plain, options) for _ in range(args.repeat))
+        size = os.path.getsize(plain)
+        print(f"{args.project}: {size / 1e6:.1f} MB of {args.format}")
+        print(f"{'codec':>6} {'level':>5} {'time':>8} {'MB/s':>8} {'size MB':>8} {'ratio':>6}")
+        print(f"{'none':>6} {'-':>5} {elapsed:7.2f}s {size / 1e6 / elapsed:8.1f} "
+              f"{size / 1e6:8.2f} {1.0:6.2f}")
+
+        for codec in args.codecs:
+            output = plain + COMPRESSION_EXTENSIONS[codec]
+            for level in DEFAULT_LEVELS[codec]:
+                codec_options = ExportOptions(**{
+                    **vars(options), "compress": codec, "compress_level": level,
+                })
+                try:
+                    elapsed = min(
+                        export(args.project, output, codec_options)
+                        for _ in range(args.repeat)
+                    )
+                except ImportError as e:
+                    print(f"{codec:>6} skipped: {e}")
+                    break
+                compressed = os.path.getsize(output)
+                print(f"{codec:>6} {level:>5} {elapsed:7.2f}s {size / 1e6 / elapsed:8.1f} "
+                      f"{compressed / 1e6:8.2f} {size / compressed:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Test harness and latency benchmark for the export daemon.
+
+Starts ``main.py --serve`` on a Unix socket next to a synthetic project
+and checks that what the daemon streams back is byte-identical to a
+direct export (ignoring the JSON/YAML export date):
+
+* in several formats, and gzip-compressed;
+* for concurrent requests, and for a subdirectory of a warm project;
+* after files are edited, added and removed and a .gitignore changes,
+  so the warm listing and content cache never serve stale data;
+* that a bad request is rejected without stopping the daemon;
+* and that requests without the token, with a wrong token, for a
+  non-loopback Host or as text/plain (what a web page can send) are
+  refused, that the token file is private, and that starting a second
+  daemon on the same address leaves the running one untouched.
+
+Then it compares the latency of a cold ``main.py`` run with the first
+(cold) and later (warm) daemon requests. Exits 1 if any check fails.
+"""
+
+import argparse
+import gzip
+import io
+import json
+import os
+import stat
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.incremental import normalized  # noqa: E402
+from benchmarks.startup import REPO_ROOT  # noqa: E402
+from benchmarks.synthetic import TreeSpec, generate_tree  # noqa: E402
+from exporter import ExportOptions, export_directory  # noqa: E402
+from exporter.daemon import (  # noqa: E402
+    TOKEN_HEADER, DaemonError, _connect, daemon_status, read_token, request_export, token_path,
+)
+
+MAIN = os.path.join(REPO_ROOT, "main.py")
+FORMATS = {"markdown": "md", "text": "txt", "json": "json", "jsonl-chunks": "jsonl"}
+
+
+def fetch(address: str, argv) -> bytes:
+    out = io.BytesIO()
+    request_export(address, argv, out)
+    return out.getvalue()
+
+
+def direct(project: str, tmp: str, export_format: str) -> bytes:
+    path = os.path.join(tmp, f"direct.{FORMATS[export_format]}")
+    export_directory(project, path, ExportOptions(export_format=export_format))
+    return normalized(path)
+
+
+def same(data: bytes, expected: bytes) -> bool:
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(data)
+    try:
+        return normalized(f.name) == expected
+    finally:
+        os.remove(f.name)
+
+
+def raw_status(address: str, method: str, path: str, headers) -> int:
+    """The status of a hand-made request, as a browser might send it."""
+    conn = _connect(address, timeout=10)
+    try:
+        body = json.dumps({"argv": ["."]}).encode() if method == "POST" else None
+        conn.request(method, path, body, headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def wait_for(address: str, proc: subprocess.Popen):
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("the daemon exited during startup")
+        try:
+            return daemon_status(address, timeout=1)
+        except (OSError, DaemonError):
+            time.sleep(0.05)
+    raise RuntimeError("the daemon did not start")
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(name: str, ok: bool):
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        stats = generate_tree(project, TreeSpec(depth=args.depth, fanout=args.fanout))
+        print(f"project: {stats.files} files in {stats.dirs} dirs")
+        address = f"unix:{os.path.join(tmp, 'export.sock')}"
+        proc = subprocess.Popen(
+            [sys.executable, MAIN, "--serve", address, "--concurrency", "4"],
+            cwd=REPO_ROOT, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for(address, proc)
+
+            cold_daemon = timed(lambda: fetch(address, [project]))
+            for export_format in FORMATS:
+                data = fetch(address, [project, "--format", export_format])
+                check(f"{export_format} matches a direct export",
+                      same(data, direct(project, tmp, export_format)))
+            expected = direct(project, tmp, "markdown")
+            data = gzip.decompress(fetch(address, [project, "-o", "export.md.gz"]))
+            check("gzip response decompresses to the export", same(data, expected))
+
+            results = [None] * args.clients
+
+            def client(i):
+                try:
+                    results[i] = fetch(address, [project])
+                except Exception as e:
+                    results[i] = e
+
+            threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            check(f"{args.clients} concurrent requests match",
+                  all(isinstance(r, bytes) and same(r, expected) for r in results))
+
+            # The parent's files are cached now; a subdirectory must get its own paths
+            subdir = next(
+                os.path.join(project, name) for name in sorted(os.listdir(project))
+                if os.path.isdir(os.path.join(project, name)) and not name.startswith(".")
+            )
+            check("a subdirectory of a warm project gets its own paths",
+                  same(fetch(address, [subdir]), direct(subdir, tmp, "markdown")))
+
+            first = None
+            for dirpath, _, names in sorted(os.walk(project)):
+                py = [n for n in sorted(names) if n.endswith(".py")]
+                if py and "node_modules" not in dirpath and ".git" not in dirpath:
+                    first = os.path.join(dirpath, py[0])
+                    break
+            with open(first, "a", encoding="utf-8") as f:
+                f.write("# edited while the daemon was warm\n")
+            check("an edited file is exported fresh",
+                  same(fetch(address, [project]), direct(project, tmp, "markdown")))
+            with open(os.path.join(project, "added.txt"), "w", encoding="utf-8") as f:
+                f.write("added while the daemon was warm\n")
+            os.remove(first)
+            check("added and removed files show up",
+                  same(fetch(address, [project]), direct(project, tmp, "markdown")))
+            with open(os.path.join(project, ".gitignore"), "a", encoding="utf-8") as f:
+                f.write("\nadded.txt\n")
+            data = fetch(address, [project])
+            check("a .gitignore change is applied",
+                  same(data, direct(project, tmp, "markdown")) and b"added.txt" not in data)
+
+            try:
+                fetch(address, [os.path.join(tmp, "missing")])
+                rejected = False
+            except DaemonError:
+                rejected = True
+            check("a bad request is rejected", rejected and proc.poll() is None)
+
+            token = read_token(address)
+            mode = stat.S_IMODE(os.stat(token_path(address)).st_mode)
+            check("the token file is private", mode == 0o600)
+            json_type = {"Content-Type": "application/json"}
+            for name, method, path, headers, expected_status in (
+                ("an export without the token", "POST", "/export", json_type, 403),
+                ("status without the token", "GET", "/status", {}, 403),
+                ("a wrong token", "POST", "/export",
+                 {**json_type, TOKEN_HEADER: "x" * len(token)}, 403),
+                ("a non-loopback Host", "GET", "/status",
+                 {"Host": "attacker.example:8765", TOKEN_HEADER: token}, 403),
+                ("a text/plain export", "POST", "/export",
+                 {"Content-Type": "text/plain", TOKEN_HEADER: token}, 415),
+            ):
+                status_code = raw_status(address, method, path, headers)
+                check(f"{name} is refused ({status_code})", status_code == expected_status)
+
+            second = subprocess.run(
+                [sys.executable, MAIN, "--serve", address], cwd=REPO_ROOT,
+                stderr=subprocess.DEVNULL, timeout=30,
+            )
+            check("a second daemon on the same address fails to start",
+                  second.returncode != 0 and read_token(address) == token
+                  and same(fetch(address, [project]), direct(project, tmp, "markdown")))
+
+            cli = statistics.median(
+                timed(lambda: subprocess.run(
+                    [sys.executable, MAIN, project, "-o", os.path.join(tmp, "cli.md")],
+                    check=True, stdout=subprocess.DEVNULL,
+                ))
+                for _ in range(args.runs)
+            )
+            warm = statistics.median(
+                timed(lambda: fetch(address, [project])) for _ in range(args.runs)
+            )
+            status = daemon_status(address)
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    cache = status["content_cache"]
+    print()
+    print(f"main.py run:          {cli * 1000:8.1f} ms")
+    print(f"first daemon request: {cold_daemon * 1000:8.1f} ms")
+    print(f"warm daemon request:  {warm * 1000:8.1f} ms ({cli / warm:.1f}x faster)")
+    print(f"content cache: {cache['hits']} hits, {cache['misses']} misses")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare listing files from the git index with walking the working tree.
+
+Generates a synthetic tree, commits it to a fresh git repository (with
+the ignored directories in .gitignore, as a real project would have
+them) and times ``scan`` with ``file_source="walk"`` and ``"git"``,
+with and without untracked files. Both must find the same files and
+render the same tree; exits 1 if they differ.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import IGNORED_DIR_NAMES, TreeSpec, generate_tree  # noqa: E402
+from exporter import ExportEngine, ExportOptions  # noqa: E402
+
+
+def git(root: str, *args: str):
+    subprocess.run(
+        ["git", "-C", root, "-c", "user.name=bench", "-c", "user.email=bench@example.com",
+         *args],
+        check=True, stdout=subprocess.DEVNULL,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=5)
+    parser.add_argument("--files-per-dir", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    spec = TreeSpec(
+        depth=args.depth, fanout=args.fanout, files_per_dir=args.files_per_dir,
+        median_size=256, max_size=1024, ignored_ratio=0.3, ignored_files=50,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = generate_tree(tmp, spec)
+        with open(os.path.join(tmp, ".gitignore"), "w", encoding="utf-8") as f:
+            f.write("".join(f"{name}/\n" for name in IGNORED_DIR_NAMES))
+        git(tmp, "init", "-q")
+        git(tmp, "add", "-A")
+        git(tmp, "commit", "-q", "-m", "synthetic tree")
+        print(f"{stats.files} files in {stats.dirs} dirs, "
+              f"{stats.ignored_files} more in ignored directories")
+
+        scans = {}
+        for name, options in (
+            ("walk", ExportOptions()),
+            ("git", ExportOptions(file_source="git")),
+            ("git --untracked", ExportOptions(file_source="git", git_untracked=True)),
+        ):
+            engine = ExportEngine(options)
+            timings = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                scans[name] = engine.scan(tmp)
+                timings.append(time.perf_counter() - start)
+            print(f"{name:>16}: {statistics.median(timings) * 1000:8.1f} ms "
+                  f"({len(scans[name].files)} files)")
+
+    walk = scans["walk"]
+    failed = False
+    for name in ("git", "git --untracked"):
+        same = (
+            scans[name].tree == walk.tree
+            and [e.rel_path for e in scans[name].files] == [e.rel_path for e in walk.files]
+        )
+        failed |= not same
+        print(f"{name} {'matches' if same else 'DIFFERS FROM'} the walk")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measure GUI cold start: time from process launch to the window's first paint.
+
+Each run starts a fresh interpreter that imports the GUI, builds the main
+window and shows it; the time is taken when the first paint event
+reaches the window. Runs headless on the offscreen Qt platform unless a
+display is available.
+
+    python -m benchmarks.gui_startup --runs 10
+    python -m benchmarks.gui_startup --budget-ms 800
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.startup import REPO_ROOT  # noqa: E402
+
+# Wall-clock times, so they compare with the parent's launch time
+PROBE = """
+import json, sys, time
+start = time.time()
+sys.path.insert(0, {repo!r})
+from PyQt5.QtWidgets import QApplication
+from exporter.gui import FirstPaintHook, ProjectExportTool
+imported = time.time()
+app = QApplication(sys.argv)
+app.setStyle("Fusion")
+window = ProjectExportTool()
+built = time.time()
+
+def painted():
+    print(json.dumps({{"start": start, "imported": imported, "built": built,
+                      "painted": time.time()}}))
+    app.quit()
+
+FirstPaintHook(window, painted)
+window.show()
+app.exec_()
+"""
+
+
+def measure(runs: int) -> List[Dict[str, float]]:
+    env = dict(os.environ)
+    if not (env.get("DISPLAY") or env.get("WAYLAND_DISPLAY")) and sys.platform.startswith("linux"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    code = PROBE.format(repo=REPO_ROOT)
+    results = []
+    for _ in range(runs):
+        launched = time.time()
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, env=env,
+            check=True, capture_output=True, text=True, timeout=60,
+        )
+        t = json.loads(proc.stdout.strip().splitlines()[-1])
+        results.append({
+            "interpreter_ms": (t["start"] - launched) * 1000,
+            "import_ms": (t["imported"] - t["start"]) * 1000,
+            "window_ms": (t["built"] - t["imported"]) * 1000,
+            "paint_ms": (t["painted"] - t["built"]) * 1000,
+            "first_paint_ms": (t["painted"] - launched) * 1000,
+        })
+    return results
+
+
+def summarize(results: List[Dict[str, float]]) -> Dict[str, float]:
+    return {key: statistics.median(r[key] for r in results) for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms", type=float, help="fail if the median time to first paint exceeds this"
+    )
+    args = parser.parse_args()
+
+    summary = summarize(measure(args.runs))
+    print(f"interpreter start: {summary['interpreter_ms']:8.1f} ms")
+    print(f"import exporter.gui: {summary['import_ms']:6.1f} ms")
+    print(f"build window:      {summary['window_ms']:8.1f} ms")
+    print(f"show to paint:     {summary['paint_ms']:8.1f} ms")
+    print(f"time to first paint: {summary['first_paint_ms']:6.1f} ms (median of {args.runs})")
+    if args.budget_ms is not None and summary["first_paint_ms"] > args.budget_ms:
+        print(f"FAIL: over the {args.budget_ms:.0f} ms cold-start budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
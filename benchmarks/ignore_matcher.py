@@ -0,0 +1,92 @@
+"""Compare the compiled IgnoreMatcher against the original per-file fnmatch loop."""
+
+import argparse
+import os
+import random
+import sys
+import time
+from fnmatch import fnmatch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exporter.ignore import IgnoreMatcher  # noqa: E402
+from exporter.options import DEFAULT_IGNORE_PATTERNS  # noqa: E402
+
+EXTENSIONS = [".py", ".js", ".ts", ".md", ".json", ".yaml", ".txt", ".c", ".h", ".go"]
+
+
+def legacy_should_ignore(path, patterns):
+    """The pre-compiled implementation: fnmatch every pattern against the basename."""
+    name = os.path.basename(path)
+    return any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def make_patterns(count: int, rng: random.Random):
+    """Defaults plus a realistic mix of literal names, extensions and globs."""
+    patterns = list(DEFAULT_IGNORE_PATTERNS)
+    i = 0
+    while len(patterns) < count:
+        kind = i % 3
+        if kind == 0:
+            patterns.append(f"generated_{i}")
+        elif kind == 1:
+            patterns.append(f"*.x{i}")
+        else:
+            patterns.append(f"tmp_{i}_*.dat")
+        i += 1
+    rng.shuffle(patterns)
+    return patterns[:count]
+
+
+def make_paths(count: int, rng: random.Random):
+    paths = []
+    for i in range(count):
+        depth = rng.randint(0, 4)
+        parts = [f"dir{rng.randint(0, 20)}" for _ in range(depth)]
+        parts.append(f"file_{i}{rng.choice(EXTENSIONS)}")
+        paths.append("/".join(parts))
+    return paths
+
+
+def bench(fn, paths, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in paths:
+            fn(p)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[15, 100, 1000])
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    paths = make_paths(args.paths, rng)
+
+    print(f"{'patterns':>8} {'fnmatch (ms)':>14} {'compiled (ms)':>14} {'speedup':>8}")
+    for size in args.sizes:
+        patterns = make_patterns(size, rng)
+        matcher = IgnoreMatcher(patterns)
+
+        mismatches = sum(
+            legacy_should_ignore(p, patterns) != matcher.matches(p) for p in paths
+        )
+        if mismatches:
+            print(f"FAIL: {mismatches} paths disagree with fnmatch at {size} patterns")
+            sys.exit(1)
+
+        legacy = bench(lambda p: legacy_should_ignore(p, patterns), paths, args.repeat)
+        compiled = bench(matcher.matches, paths, args.repeat)
+        print(
+            f"{size:>8} {legacy * 1000:>14.1f} {compiled * 1000:>14.1f} "
+            f"{legacy / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
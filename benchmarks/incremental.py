@@ -0,0 +1,110 @@
+"""Verify and time incremental re-exports against full exports.
+
+Builds a synthetic tree, exports it with a manifest, then edits, touches,
+adds and deletes a fraction of the files. The incremental re-export must be
+byte-identical to a fresh full export (ignoring the JSON/YAML export date).
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exporter import ExportEngine, ExportOptions  # noqa: E402
+
+EXTENSIONS = {"text": "txt", "markdown": "md", "json": "json", "yaml": "yaml"}
+
+
+def make_tree(root: str, files: int, file_size: int):
+    line = "value = compute(previous, delta)  # incremental benchmark\n"
+    body = (line * (file_size // len(line) + 1))[:file_size]
+    paths = []
+    for i in range(files):
+        d = os.path.join(root, f"pkg{i % 20}")
+        os.makedirs(d, exist_ok=True)
+        path = os.path.join(d, f"mod_{i}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+        paths.append(path)
+    return paths
+
+
+def mutate(paths, fraction: float, rng: random.Random):
+    count = max(1, int(len(paths) * fraction))
+    for path in rng.sample(paths, count):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("# edited\n")
+    for path in rng.sample(paths, count):
+        os.utime(path, None)
+    for path in rng.sample(paths, count):
+        if os.path.exists(path):
+            os.remove(path)
+    new_file = os.path.join(os.path.dirname(paths[0]), "added_module.py")
+    with open(new_file, "w", encoding="utf-8") as f:
+        f.write("ADDED = True\n")
+    return count
+
+
+def normalized(path: str) -> bytes:
+    with open(path, "rb") as f:
+        data = f.read()
+    return re.sub(rb"export_date\W+[\d\-T:.]+", b"export_date", data)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--file-size", type=int, default=16 * 1024)
+    parser.add_argument("--changed", type=float, default=0.02,
+                        help="fraction of files edited, touched and deleted")
+    parser.add_argument("--formats", nargs="+", default=["text", "markdown", "json"])
+    parser.add_argument("--llm-optimize", action="store_true")
+    args = parser.parse_args()
+
+    failed = False
+    for export_format in args.formats:
+        rng = random.Random(7)
+        with tempfile.TemporaryDirectory() as tmp:
+            project = os.path.join(tmp, "project")
+            paths = make_tree(project, args.files, args.file_size)
+            ext = EXTENSIONS[export_format]
+            inc_out = os.path.join(tmp, f"incremental.{ext}")
+            full_out = os.path.join(tmp, f"full.{ext}")
+
+            def engine(incremental):
+                return ExportEngine(ExportOptions(
+                    export_format=export_format,
+                    llm_optimize=args.llm_optimize,
+                    incremental=incremental,
+                ))
+
+            first = timed(lambda: engine(True).generate_file_structure(project, inc_out))
+            changed = mutate(paths, args.changed, rng)
+            again = timed(lambda: engine(True).generate_file_structure(project, inc_out))
+            full = timed(lambda: engine(False).generate_file_structure(project, full_out))
+
+            identical = normalized(inc_out) == normalized(full_out)
+            failed |= not identical
+            print(
+                f"{export_format:>8}: initial {first:6.3f} s  full {full:6.3f} s  "
+                f"incremental {again:6.3f} s ({full / again:4.1f}x)  "
+                f"{changed} edited/touched/deleted  "
+                f"{'identical' if identical else 'MISMATCH'}"
+            )
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Scaling curve of --jobs against the serial read path.
+
+Exports the same synthetic tree with increasing thread counts, checks the
+output is byte-identical to the serial export, and reports the speedup.
+``--latency-ms`` adds a per-file delay to model network filesystems or
+cold caches, where reads are bound by latency rather than bandwidth.
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from exporter import ExportEngine, ExportOptions, records  # noqa: E402
+
+EXTENSIONS = {"text": "txt", "markdown": "md", "json": "json", "yaml": "yaml"}
+
+
+def make_tree(root: str, files: int, file_size: int):
+    line = "def handler(request):  # parallel read benchmark\n"
+    body = (line * (file_size // len(line) + 1))[:file_size]
+    for i in range(files):
+        d = os.path.join(root, f"pkg{i % 16}", f"sub{i % 3}")
+        os.makedirs(d, exist_ok=True)
+        with open(os.path.join(d, f"mod_{i}.py"), "w", encoding="utf-8") as f:
+            f.write(body)
+
+
+def add_latency(delay: float):
+    read_file = records.read_file
+
+    def slow_read_file(entry, *args):
+        time.sleep(delay)
+        return read_file(entry, *args)
+
+    records.read_file = slow_read_file
+
+
+def export(project: str, output: str, export_format: str, jobs: int) -> float:
+    engine = ExportEngine(ExportOptions(export_format=export_format, jobs=jobs))
+    start = time.perf_counter()
+    engine.generate_file_structure(project, output)
+    return time.perf_counter() - start
+
+
+def normalized(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return re.sub(r"export_date\W+[\d\-T:.]+", "export_date", text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--file-size", type=int, default=8 * 1024)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--formats", nargs="+", default=["text", "markdown", "json"])
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.latency_ms:
+        add_latency(args.latency_ms / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        make_tree(project, args.files, args.file_size)
+
+        for export_format in args.formats:
+            ext = EXTENSIONS[export_format]
+            serial_out = os.path.join(tmp, f"serial.{ext}")
+            serial = export(project, serial_out, export_format, 1)
+            expected = normalized(serial_out)
+            print(f"{export_format}: {args.files} files, latency {args.latency_ms} ms")
+            print(f"  {'jobs':>4} {'seconds':>8} {'files/s':>9} {'speedup':>8}")
+            for jobs in args.jobs:
+                out = os.path.join(tmp, f"jobs{jobs}.{ext}")
+                elapsed = serial if jobs == 1 else export(project, out, export_format, jobs)
+                if jobs != 1 and normalized(out) != expected:
+                    print(f"FAIL: output with --jobs {jobs} differs from the serial export")
+                    sys.exit(1)
+                print(
+                    f"  {jobs:>4} {elapsed:>8.3f} {args.files / elapsed:>9.0f} "
+                    f"{serial / elapsed:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Search-as-you-type latency of the GUI's path index.
+
+Builds a PathIndex over a synthetic tree, then times an unchanged
+refresh and every prefix of each query, the way the search box issues
+them while the user types.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import TreeSpec, generate_tree  # noqa: E402
+from exporter.ignore import compile_ignore_patterns  # noqa: E402
+from exporter.options import DEFAULT_IGNORE_PATTERNS  # noqa: E402
+from exporter.pathindex import PathIndex  # noqa: E402
+
+QUERIES = ["file_007.py", "d43f7", "dir_2_3/readme", "zzz"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--fanout", type=int, default=6)
+    parser.add_argument("--files-per-dir", type=int, default=20)
+    args = parser.parse_args()
+
+    spec = TreeSpec(
+        depth=args.depth, fanout=args.fanout, files_per_dir=args.files_per_dir,
+        median_size=64, max_size=256,
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = generate_tree(tmp, spec)
+        matcher = compile_ignore_patterns(DEFAULT_IGNORE_PATTERNS)
+
+        start = time.perf_counter()
+        index = PathIndex.build(tmp, matcher.matches)
+        print(f"build:    {time.perf_counter() - start:8.3f} s for {len(index)} files "
+              f"in {stats.dirs} dirs")
+        start = time.perf_counter()
+        index = index.refreshed()
+        print(f"refresh:  {time.perf_counter() - start:8.3f} s (nothing changed)")
+
+        for query in QUERIES:
+            timings = []
+            for end in range(1, len(query) + 1):
+                start = time.perf_counter()
+                results = index.search(query[:end])
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{query!r:>18}: first key {timings[0] * 1000:6.1f} ms, "
+                f"median {statistics.median(timings) * 1000:6.1f} ms, "
+                f"max {max(timings) * 1000:6.1f} ms, {len(results)} result(s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure CLI startup time and verify the CLI path never imports PyQt5."""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs the real CLI entry point in-process, then reports any Qt modules it pulled in.
+PROBE = """
+import sys
+sys.argv = ["main.py", {directory!r}, "--format", "text", "--structure-only", "-o", {output!r}]
+import main
+try:
+    main.main()
+finally:
+    qt = sorted(m for m in sys.modules if m.split(".")[0] == "PyQt5")
+    print("QT_MODULES=" + ",".join(qt))
+"""
+
+
+def make_project(root: str):
+    """Create a tiny project so the measurement is dominated by startup cost."""
+    os.makedirs(os.path.join(root, "pkg"), exist_ok=True)
+    for i in range(5):
+        with open(os.path.join(root, "pkg", f"mod_{i}.py"), "w", encoding="utf-8") as f:
+            f.write(f"VALUE = {i}\n")
+
+
+def time_command(cmd, runs: int):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO_ROOT, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        output = os.path.join(tmp, "out.txt")
+        make_project(project)
+
+        probe = subprocess.run(
+            [sys.executable, "-c", PROBE.format(directory=project, output=output)],
+            cwd=REPO_ROOT, check=True, capture_output=True, text=True,
+        )
+        qt_line = [l for l in probe.stdout.splitlines() if l.startswith("QT_MODULES=")]
+        qt_modules = qt_line[-1].split("=", 1)[1] if qt_line else "?"
+
+        baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+        cli = time_command(
+            [sys.executable, "main.py", project, "--format", "text",
+             "--structure-only", "-o", output],
+            args.runs,
+        )
+
+    interp = statistics.median(baseline) * 1000
+    total = statistics.median(cli) * 1000
+    print(f"interpreter startup: {interp:8.1f} ms (median of {args.runs})")
+    print(f"CLI export:          {total:8.1f} ms (median of {args.runs})")
+    print(f"CLI overhead:        {total - interp:8.1f} ms")
+    if qt_modules:
+        print(f"FAIL: CLI path imported Qt modules: {qt_modules}")
+        sys.exit(1)
+    print("OK: CLI path imported no PyQt5 modules")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Check that JSON/YAML/JSONL-chunks export peak memory stays flat as the project grows.
+
+Exports trees of increasing file counts (same per-file size) under
+tracemalloc and fails if the peak grows with the total project size
+instead of staying bounded by the largest single file.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yaml  # noqa: E402,F401  imported up front so it is not counted in the first peak
+
+from exporter import FORMAT_EXTENSIONS, ExportEngine, ExportOptions  # noqa: E402
+
+
+def make_tree(root: str, files: int, file_size: int):
+    line = "x = 'streaming export benchmark line'\n"
+    body = (line * (file_size // len(line) + 1))[:file_size]
+    for i in range(files):
+        d = os.path.join(root, f"pkg{i % 10}")
+        os.makedirs(d, exist_ok=True)
+        with open(os.path.join(d, f"mod_{i}.py"), "w", encoding="utf-8") as f:
+            f.write(body)
+
+
+def measure(export_format: str, files: int, file_size: int, llm: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        make_tree(project, files, file_size)
+        output = os.path.join(tmp, "out" + FORMAT_EXTENSIONS[export_format])
+        engine = ExportEngine(ExportOptions(export_format=export_format, llm_optimize=llm))
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        engine.generate_file_structure(project, output)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak, elapsed, os.path.getsize(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--file-size", type=int, default=4 * 1024)
+    parser.add_argument("--counts", type=int, nargs="+", default=[20, 80, 320])
+    parser.add_argument("--formats", nargs="+", default=["json", "yaml", "jsonl-chunks"])
+    parser.add_argument("--llm-optimize", action="store_true")
+    parser.add_argument(
+        "--tolerance", type=float, default=2.0,
+        help="allowed peak growth factor between the smallest and largest tree",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for export_format in args.formats:
+        peaks = []
+        for count in args.counts:
+            peak, elapsed, size = measure(export_format, count, args.file_size, args.llm_optimize)
+            peaks.append(peak)
+            print(
+                f"{export_format:>12} {count:>6} files  output {size / 1e6:8.1f} MB  "
+                f"peak {peak / 1e6:7.2f} MB  {elapsed:6.2f} s"
+            )
+        # Allow a fixed slack for the per-file entry list and the tree string
+        limit = peaks[0] * args.tolerance + 1_000_000
+        if peaks[-1] > limit:
+            print(f"FAIL: {export_format} peak grew from {peaks[0]} to {peaks[-1]} bytes")
+            failed = True
+    if failed:
+        sys.exit(1)
+    print("OK: peak memory is bounded by file size, not project size")
+
+
+if __name__ == "__main__":
+    main()
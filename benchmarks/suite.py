@@ -0,0 +1,230 @@
+"""Export benchmark suite with JSON baselines and regression checks.
+
+``run`` generates the synthetic trees, exports them once per scenario
+(every format, structure-only versus content, LLM mode, an ignore-heavy
+tree) in a fresh subprocess so peak RSS is per scenario, and writes the
+results as JSON. ``compare`` checks a result file against a baseline and
+exits non-zero when anything got slower or bigger beyond the threshold.
+
+    python -m benchmarks.suite run -o baseline.json
+    python -m benchmarks.suite run -o current.json --compare baseline.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.1
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.startup import REPO_ROOT, make_project, time_command  # noqa: E402
+from benchmarks.synthetic import TreeSpec, generate_tree, spec_from_dict  # noqa: E402
+
+RESULTS_VERSION = 1
+
+TREES: Dict[str, TreeSpec] = {
+    "default": TreeSpec(),
+    "ignore-heavy": TreeSpec(
+        seed=1, files_per_dir=4, ignored_ratio=0.8, ignored_files=150,
+    ),
+}
+
+FORMATS = ["text", "markdown", "json", "yaml", "jsonl-chunks"]
+
+# Metrics compared against a baseline. Seconds and MB/s are recorded too,
+# but move in lockstep with files/s, so checking them would triple-report.
+HIGHER_IS_WORSE = ("peak_rss_kb", "startup_ms")
+LOWER_IS_WORSE = ("files_per_sec",)
+
+
+def scenarios() -> List[Tuple[str, str, Dict]]:
+    """(name, tree, ExportOptions keyword arguments) for every scenario."""
+    result = []
+    for fmt in FORMATS:
+        result.append((f"{fmt}", "default", {"export_format": fmt}))
+        result.append((f"{fmt}-structure", "default",
+                       {"export_format": fmt, "structure_only": True}))
+        result.append((f"{fmt}-llm", "default",
+                       {"export_format": fmt, "llm_optimize": True}))
+    result.append(("markdown-ignore-heavy", "ignore-heavy", {"export_format": "markdown"}))
+    result.append(("markdown-ignore-heavy-structure", "ignore-heavy",
+                   {"export_format": "markdown", "structure_only": True}))
+    return result
+
+
+# Runs in a fresh interpreter so ru_maxrss only covers one export
+WORKER = """
+import json, os, resource, sys, time
+sys.path.insert(0, {repo!r})
+from exporter import ExportEngine, ExportOptions
+engine = ExportEngine(ExportOptions(**{options!r}))
+start = time.perf_counter()
+engine.generate_file_structure({project!r}, {output!r})
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+print(json.dumps({{"seconds": elapsed, "peak_rss_kb": rss,
+                  "output_bytes": os.path.getsize({output!r})}}))
+"""
+
+
+def run_scenario(project: str, output: str, options: Dict, repeat: int) -> Dict:
+    runs = []
+    for _ in range(repeat):
+        code = WORKER.format(repo=REPO_ROOT, options=options, project=project, output=output)
+        proc = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        )
+        runs.append(json.loads(proc.stdout.splitlines()[-1]))
+    return {
+        "seconds": statistics.median(r["seconds"] for r in runs),
+        "peak_rss_kb": max(r["peak_rss_kb"] for r in runs),
+        "output_bytes": runs[-1]["output_bytes"],
+    }
+
+
+def measure_startup(runs: int) -> Dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        output = os.path.join(tmp, "out.txt")
+        make_project(project)
+        interpreter = time_command([sys.executable, "-c", "pass"], runs)
+        cli = time_command(
+            [sys.executable, "main.py", project, "--format", "text",
+             "--structure-only", "-o", output],
+            runs,
+        )
+    return {
+        "interpreter_ms": statistics.median(interpreter) * 1000,
+        "startup_ms": statistics.median(cli) * 1000,
+    }
+
+
+def run(args) -> Dict:
+    results = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "trees": {},
+        "startup": measure_startup(args.startup_runs),
+        "scenarios": {},
+    }
+    print(f"startup: {results['startup']['startup_ms']:.1f} ms")
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = {}
+        for name, spec in TREES.items():
+            stats[name] = generate_tree(os.path.join(tmp, name), spec)
+            results["trees"][name] = {"spec": asdict(spec), "stats": asdict(stats[name])}
+
+        for name, tree, options in scenarios():
+            if args.only and not any(fnmatch.fnmatch(name, p) for p in args.only):
+                continue
+            project = os.path.join(tmp, tree)
+            output = os.path.join(tmp, "export.out")
+            metrics = run_scenario(project, output, options, args.repeat)
+            tree_stats = stats[tree]
+            metrics["files_per_sec"] = tree_stats.files / metrics["seconds"]
+            metrics["mb_per_sec"] = tree_stats.bytes / 1e6 / metrics["seconds"]
+            results["scenarios"][name] = metrics
+            print(
+                f"{name:>32} {metrics['seconds']:7.3f} s {metrics['files_per_sec']:9.0f} files/s "
+                f"{metrics['mb_per_sec']:7.1f} MB/s  rss {metrics['peak_rss_kb'] / 1024:6.1f} MB"
+            )
+    return results
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """Print every shared metric and return the regressions beyond ``threshold``."""
+    regressions = []
+
+    def check(label: str, metric: str, old: float, new: float):
+        if not old:
+            return
+        change = (new - old) / old
+        worse = change > threshold if metric in HIGHER_IS_WORSE else change < -threshold
+        flag = "REGRESSION" if worse else ""
+        print(f"{label:>32} {metric:>14} {old:12.2f} -> {new:12.2f} {change:+7.1%} {flag}")
+        if worse:
+            regressions.append(f"{label} {metric} {change:+.1%}")
+
+    for metric in ("startup_ms",):
+        check("startup", metric, baseline["startup"][metric], current["startup"][metric])
+    for name, old in baseline["scenarios"].items():
+        new = current["scenarios"].get(name)
+        if new is None:
+            continue
+        for metric in HIGHER_IS_WORSE + LOWER_IS_WORSE:
+            if metric in old and metric in new:
+                check(name, metric, old[metric], new[metric])
+    for name in TREES:
+        old_spec = baseline.get("trees", {}).get(name, {}).get("spec")
+        if old_spec and spec_from_dict(old_spec) != TREES[name]:
+            print(f"note: tree {name!r} spec differs from the baseline's")
+    return regressions
+
+
+def load(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{path}: unsupported results version {data.get('version')}")
+    return data
+
+
+def report(regressions: List[str], threshold: float):
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s) beyond {threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"OK: no regressions beyond {threshold:.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="run the suite and save results")
+    run_parser.add_argument("-o", "--output", help="write results JSON here")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--startup-runs", type=int, default=10)
+    run_parser.add_argument("--only", nargs="+", help="scenario name globs to run")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare against this baseline")
+    run_parser.add_argument("--threshold", type=float, default=0.15)
+
+    compare_parser = sub.add_parser("compare", help="compare results with a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        results = run(args)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {args.output}")
+        if args.compare:
+            report(compare(load(args.compare), results, args.threshold), args.threshold)
+    else:
+        report(
+            compare(load(args.baseline), load(args.current), args.threshold),
+            args.threshold,
+        )
+
+
+if __name__ == "__main__":
+    main()
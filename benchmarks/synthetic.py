@@ -0,0 +1,154 @@
+"""Deterministic synthetic project trees for benchmarks.
+
+The same TreeSpec always produces byte-identical trees, so timings from
+different checkouts are comparable. Run as a module to generate one:
+
+    python -m benchmarks.synthetic /tmp/tree --depth 4 --fanout 3
+"""
+
+import argparse
+import math
+import os
+import random
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Tuple
+
+# Extension, relative weight, line template
+TEXT_KINDS: List[Tuple[str, int, str]] = [
+    (".py", 40, "def {a}_{b}({c}):\n    return {c} + {n}  # {a} {b}\n"),
+    (".js", 15, "export function {a}{n}({c}) {{ return {c}.{b}; }}\n"),
+    (".md", 15, "The {a} {b} handles {c} in {n} steps.\n"),
+    (".json", 10, '  "{a}_{b}": {n},\n'),
+    (".yaml", 10, "{a}_{b}: {c}-{n}\n"),
+    (".txt", 10, "{a} {b} {c} {n}\n"),
+]
+WORDS = (
+    "alpha beta gamma delta export tree node walker record writer buffer "
+    "stream index cache token chunk parse render scan manifest digest"
+).split()
+BINARY_KINDS = [(".png", b"\x89PNG\r\n\x1a\n"), (".zip", b"PK\x03\x04"), (".bin", b"\x00\x01")]
+# Directory names the default ignore patterns prune
+IGNORED_DIR_NAMES = ["node_modules", "__pycache__", ".git"]
+
+
+@dataclass
+class TreeSpec:
+    """Shape of a synthetic project.
+
+    ``depth`` levels below the root, ``fanout`` subdirectories per
+    directory and ``files_per_dir`` files in each. File sizes follow a
+    log-normal distribution around ``median_size``, capped at ``max_size``.
+    ``binary_ratio`` of the files are binary. Each directory contains an
+    ignored directory (node_modules, __pycache__ or .git) with
+    ``ignored_files`` files with probability ``ignored_ratio``.
+    """
+
+    seed: int = 0
+    depth: int = 3
+    fanout: int = 4
+    files_per_dir: int = 8
+    median_size: int = 4096
+    size_sigma: float = 1.0
+    max_size: int = 1024 * 1024
+    binary_ratio: float = 0.05
+    ignored_ratio: float = 0.0
+    ignored_files: int = 50
+
+
+@dataclass
+class TreeStats:
+    """What was generated; ``files`` and ``bytes`` exclude ignored directories."""
+
+    dirs: int = 0
+    files: int = 0
+    bytes: int = 0
+    binary_files: int = 0
+    ignored_files: int = 0
+    ignored_bytes: int = 0
+
+
+def _text(rng: random.Random, template: str, size: int) -> bytes:
+    lines = []
+    total = 0
+    while total < size:
+        line = template.format(
+            a=rng.choice(WORDS), b=rng.choice(WORDS), c=rng.choice(WORDS),
+            n=rng.randrange(1000),
+        )
+        lines.append(line)
+        total += len(line)
+    return "".join(lines).encode("utf-8")[:size]
+
+
+def _file_size(rng: random.Random, spec: TreeSpec) -> int:
+    size = rng.lognormvariate(math.log(spec.median_size), spec.size_sigma)
+    return max(1, min(spec.max_size, int(size)))
+
+
+def _write_file(rng: random.Random, spec: TreeSpec, dirpath: str, index: int) -> Tuple[int, bool]:
+    size = _file_size(rng, spec)
+    if rng.random() < spec.binary_ratio:
+        ext, magic = rng.choice(BINARY_KINDS)
+        data = magic + rng.randbytes(max(0, size - len(magic)))
+        binary = True
+    else:
+        exts, weights, templates = zip(*TEXT_KINDS)
+        choice = rng.choices(range(len(exts)), weights)[0]
+        ext = exts[choice]
+        data = _text(rng, templates[choice], size)
+        binary = False
+    with open(os.path.join(dirpath, f"file_{index:03d}{ext}"), "wb") as f:
+        f.write(data)
+    return len(data), binary
+
+
+def generate_tree(root: str, spec: TreeSpec) -> TreeStats:
+    """Create the tree described by ``spec`` under ``root`` and return its totals."""
+    rng = random.Random(spec.seed)
+    stats = TreeStats()
+    pending = [(root, 0)]
+    while pending:
+        dirpath, level = pending.pop()
+        os.makedirs(dirpath, exist_ok=True)
+        stats.dirs += 1
+        for i in range(spec.files_per_dir):
+            size, binary = _write_file(rng, spec, dirpath, i)
+            stats.files += 1
+            stats.bytes += size
+            stats.binary_files += binary
+        if rng.random() < spec.ignored_ratio:
+            ignored = os.path.join(dirpath, rng.choice(IGNORED_DIR_NAMES), "pkg")
+            os.makedirs(ignored, exist_ok=True)
+            for i in range(spec.ignored_files):
+                size, _ = _write_file(rng, spec, ignored, i)
+                stats.ignored_files += 1
+                stats.ignored_bytes += size
+        if level < spec.depth:
+            for i in reversed(range(spec.fanout)):
+                pending.append((os.path.join(dirpath, f"dir_{level}_{i}"), level + 1))
+    return stats
+
+
+def spec_from_dict(data: Dict) -> TreeSpec:
+    names = {f.name for f in fields(TreeSpec)}
+    return TreeSpec(**{k: v for k, v in data.items() if k in names})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("root")
+    defaults = TreeSpec()
+    for f in fields(TreeSpec):
+        parser.add_argument(
+            f"--{f.name.replace('_', '-')}", type=type(getattr(defaults, f.name)),
+            default=getattr(defaults, f.name),
+        )
+    args = vars(parser.parse_args())
+    root = args.pop("root")
+    stats = generate_tree(root, spec_from_dict(args))
+    for name, value in asdict(stats).items():
+        print(f"{name:>14}: {value}")
+
+
+if __name__ == "__main__":
+    main()
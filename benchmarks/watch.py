@@ -0,0 +1,131 @@
+"""Check that ``--watch`` re-exports when files or ignore rules change.
+
+Runs ``watch_project`` on a small project in a background thread and
+makes one change at a time: editing a file, then editing only a
+.gitignore, then only .git/info/exclude. Each change must trigger a
+re-export that is byte-identical to a fresh export (ignoring the
+JSON/YAML export date), and the newly ignored files must be gone. The
+same rule-file edits are then fed to the default and the polling
+watcher directly, so both backends are covered on Linux. Exits 1 if any
+check fails.
+"""
+
+import argparse
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.incremental import normalized  # noqa: E402
+from exporter import ExportEngine, ExportOptions, export_directory  # noqa: E402
+from exporter.watch import PollingWatcher, create_watcher, watch_project  # noqa: E402
+
+
+def write(path: str, text: str, mode: str = "w"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(text)
+
+
+def make_project(root: str):
+    for i in range(20):
+        write(os.path.join(root, f"pkg{i % 4}", f"mod_{i}.py"), f"VALUE = {i}\n")
+    write(os.path.join(root, "notes", "draft.txt"), "draft notes\n")
+    write(os.path.join(root, "scratch.log.txt"), "scratch output\n")
+    write(os.path.join(root, ".gitignore"), "*.pyc\n")
+    os.makedirs(os.path.join(root, ".git", "info"))
+    write(os.path.join(root, ".git", "info", "exclude"), "")
+
+
+def changed_paths(watcher, timeout: float):
+    """Everything the watcher reports within ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    changed = set()
+    while time.monotonic() < deadline:
+        changed |= watcher.wait(min(0.2, max(0.0, deadline - time.monotonic())))
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="seconds to wait for each re-export")
+    args = parser.parse_args()
+
+    failures = []
+
+    def check(name: str, ok: bool):
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures.append(name)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = os.path.join(tmp, "project")
+        make_project(project)
+        output = os.path.join(tmp, "watched.md")
+        expected_path = os.path.join(tmp, "expected.md")
+
+        def fresh() -> bytes:
+            export_directory(project, expected_path, ExportOptions())
+            return normalized(expected_path)
+
+        exports: "queue.Queue[set]" = queue.Queue()
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=watch_project, args=(project, output, ExportOptions()),
+            kwargs={"debounce": 0.2, "poll_interval": 0.2, "stop": stop,
+                    "on_export": lambda _, changed: exports.put(changed)},
+            daemon=True,
+        )
+        thread.start()
+        exports.get(timeout=args.timeout)
+        # The watcher is set up right after the first export
+        time.sleep(0.5)
+
+        def after(name: str, change, gone=None):
+            change()
+            try:
+                changed = exports.get(timeout=args.timeout)
+            except queue.Empty:
+                check(f"{name} triggers a re-export", False)
+                return
+            data = normalized(output)
+            ok = data == fresh() and (gone is None or gone.encode() not in data)
+            check(f"{name} triggers a re-export ({', '.join(sorted(changed))})", ok)
+
+        after("editing a file",
+              lambda: write(os.path.join(project, "pkg0", "mod_0.py"), "# edited\n", "a"))
+        after("editing only .gitignore",
+              lambda: write(os.path.join(project, ".gitignore"), "notes/\n", "a"),
+              gone="draft.txt")
+        after("editing only .git/info/exclude",
+              lambda: write(os.path.join(project, ".git", "info", "exclude"), "scratch.*\n"),
+              gone="scratch.log.txt")
+        stop.set()
+        thread.join(timeout=args.timeout)
+
+        engine = ExportEngine(ExportOptions())
+        for name, make in (
+            ("default watcher", lambda: create_watcher(engine, project, output)),
+            ("polling watcher", lambda: PollingWatcher(engine, project, output, 0.2)),
+        ):
+            watcher = make()
+            try:
+                for rel_path in (".gitignore", ".git/info/exclude"):
+                    time.sleep(0.05)
+                    write(os.path.join(project, rel_path), "# comment\n", "a")
+                    check(f"{name} reports {rel_path}",
+                          rel_path in changed_paths(watcher, 1.0))
+            finally:
+                watcher.close()
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Qt-free export engine used by the CLI, the GUI and library callers.
+
+Nothing in this package imports PyQt5 except ``exporter.gui``, which is only
+loaded when the graphical interface is requested.
+"""
+
+from .engine import ExportEngine, export_directory, should_ignore
+from .options import (
+    DEFAULT_IGNORE_PATTERNS,
+    FORMAT_EXTENSIONS,
+    ExportOptions,
+    default_output_path,
+)
+from .progress import ExportCancelled, ProgressReporter
+from .stats import ExportStats
+from .stream import FileRecord, ProjectExport, RecordWriter, iter_export
+
+__all__ = [
+    "DEFAULT_IGNORE_PATTERNS",
+    "FORMAT_EXTENSIONS",
+    "ExportCancelled",
+    "ExportEngine",
+    "ExportOptions",
+    "ExportStats",
+    "FileRecord",
+    "ProgressReporter",
+    "ProjectExport",
+    "RecordWriter",
+    "default_output_path",
+    "export_directory",
+    "iter_export",
+    "should_ignore",
+]
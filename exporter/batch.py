@@ -0,0 +1,259 @@
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .compression import COMPRESSION_EXTENSIONS
+from .engine import ExportEngine
+from .ignore import compile_ignore_patterns
+from .options import FORMAT_EXTENSIONS, ExportOptions, default_output_path
+from .progress import ProgressReporter
+
+
+class BatchJob(NamedTuple):
+    """One project of a batch and where its export goes."""
+
+    directory: str
+    output_file: str
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one project; ``error`` is None when the export succeeded."""
+
+    directory: str
+    output_file: str
+    seconds: float
+    files: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def read_batch_file(path: str) -> List[BatchJob]:
+    """Parse a batch file: one project directory per line.
+
+    A tab after the directory may be followed by that project's output
+    path. Blank lines and lines starting with ``#`` are skipped, and
+    relative paths are resolved against the batch file's directory.
+    Projects without an output path get an empty ``output_file``, filled
+    in by ``plan_jobs``.
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            directory, _, output_file = line.partition("\t")
+            directory = os.path.join(base, directory.strip())
+            output_file = output_file.strip()
+            if output_file:
+                output_file = os.path.join(base, output_file)
+            jobs.append(BatchJob(os.path.normpath(directory), output_file))
+    return jobs
+
+
+def split_export_name(name: str) -> Tuple[str, str]:
+    """Split an export file name into its stem and its format and compression extensions.
+
+    Only known extensions are split off, from the right, so dots in a
+    project name stay in the stem: ``v1.2-api.md.gz`` -> ``("v1.2-api", ".md.gz")``.
+    """
+    ext = ""
+    for extensions in (COMPRESSION_EXTENSIONS.values(), FORMAT_EXTENSIONS.values()):
+        for candidate in extensions:
+            if name.endswith(candidate) and len(name) > len(candidate):
+                name = name[:-len(candidate)]
+                ext = candidate + ext
+                break
+    return name, ext
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+def plan_jobs(
+    jobs: Iterable[BatchJob],
+    options: ExportOptions,
+    output_dir: Optional[str] = None,
+) -> List[BatchJob]:
+    """Fill in missing output paths and make sure no two jobs share one.
+
+    Without ``output_dir`` each export goes to its default path inside
+    the project. With it, all exports go to that directory. A project
+    listed again with the same output is exported once. Derived paths
+    that collide with another job's get a numbered suffix; two explicit
+    output paths that collide raise ValueError, since two workers would
+    otherwise race on the same file.
+    """
+    unique: List[BatchJob] = []
+    seen = set()
+    # Output path key -> the project exported there
+    taken: Dict[str, str] = {}
+    for directory, output_file in jobs:
+        job_key = (_path_key(directory), _path_key(output_file) if output_file else "")
+        if job_key in seen:
+            continue
+        seen.add(job_key)
+        unique.append(BatchJob(directory, output_file))
+        if output_file:
+            if job_key[1] in taken:
+                raise ValueError(
+                    f"{taken[job_key[1]]} and {directory} are both exported to {output_file}"
+                )
+            taken[job_key[1]] = directory
+
+    planned = []
+    for directory, output_file in unique:
+        if not output_file:
+            output_file = default_output_path(directory, options)
+            if output_dir is not None:
+                output_file = os.path.join(output_dir, os.path.basename(output_file))
+            folder, name = os.path.split(output_file)
+            stem, ext = split_export_name(name)
+            n = 1
+            while _path_key(output_file) in taken:
+                n += 1
+                output_file = os.path.join(folder, f"{stem}-{n}{ext}")
+            taken[_path_key(output_file)] = directory
+        planned.append(BatchJob(directory, output_file))
+    return planned
+
+
+# Per worker process: one engine, so the ignore patterns are compiled once
+_engine: Optional[ExportEngine] = None
+
+
+def _init_worker(options: ExportOptions):
+    global _engine
+    _engine = ExportEngine(options)
+    compile_ignore_patterns(options.ignore_patterns)
+
+
+def export_job(job: BatchJob, engine: Optional[ExportEngine] = None) -> BatchResult:
+    """Export one project, turning any error into a failed BatchResult."""
+    engine = engine or _engine
+    progress = ProgressReporter()
+    start = perf_counter()
+    try:
+        if not os.path.isdir(job.directory):
+            raise NotADirectoryError(f"not a directory: {job.directory}")
+        output_dir = os.path.dirname(job.output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        engine.generate_file_structure(job.directory, job.output_file, progress=progress)
+        bytes_written = os.path.getsize(job.output_file)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        if not isinstance(e, OSError):
+            # Unexpected failures keep the innermost frame for the report
+            frame = traceback.extract_tb(e.__traceback__)[-1]
+            error += f" ({os.path.basename(frame.filename)}:{frame.lineno})"
+        return BatchResult(
+            job.directory, job.output_file, perf_counter() - start,
+            progress.files_done, progress.bytes_done, error=error,
+        )
+    return BatchResult(
+        job.directory, job.output_file, perf_counter() - start,
+        progress.files_done, progress.bytes_done, bytes_written,
+    )
+
+
+def _run_pool(
+    jobs: List[BatchJob], options: ExportOptions, processes: int, broken: List[BatchJob]
+) -> Iterator[BatchResult]:
+    """Run jobs on one pool, collecting those lost to a crashed worker in ``broken``."""
+    with ProcessPoolExecutor(
+        max_workers=min(processes, len(jobs)),
+        initializer=_init_worker,
+        initargs=(options,),
+    ) as pool:
+        futures = {pool.submit(export_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    options: Optional[ExportOptions] = None,
+    processes: Optional[int] = None,
+) -> Iterator[BatchResult]:
+    """Export many projects on a process pool, yielding results as they finish.
+
+    ``processes`` defaults to the number of CPUs. Every worker builds its
+    engine and compiles the shared ignore patterns once, then exports
+    project after project. A project that raises is reported as failed
+    and the batch goes on. A worker that dies outright (a crash or the
+    OOM killer) breaks the whole pool; the projects it took down are run
+    again on a fresh pool, then one at a time, so only the project that
+    crashes on its own is reported as failed.
+    """
+    options = options or ExportOptions()
+    jobs = list(jobs)
+    processes = processes or os.cpu_count() or 1
+    if processes <= 1:
+        engine = ExportEngine(options)
+        for job in jobs:
+            yield export_job(job, engine)
+        return
+
+    broken: List[BatchJob] = []
+    yield from _run_pool(jobs, options, processes, broken)
+    if broken:
+        retry, broken = broken, []
+        yield from _run_pool(retry, options, processes, broken)
+    for job in broken:
+        crashed: List[BatchJob] = []
+        yield from _run_pool([job], options, 1, crashed)
+        if crashed:
+            yield BatchResult(
+                job.directory, job.output_file, 0.0,
+                error="worker process died during the export",
+            )
+
+
+def format_report(results: List[BatchResult], wall_seconds: float) -> str:
+    """Summary table of a batch: per-project timings, then totals and failures."""
+    lines = []
+    width = max((len(r.directory) for r in results), default=7)
+    lines.append(f"{'project':<{width}}  {'status':<6}  {'time':>8}  {'files':>7}  {'read':>10}")
+    for r in sorted(results, key=lambda r: r.seconds, reverse=True):
+        status = "ok" if r.ok else "FAILED"
+        lines.append(
+            f"{r.directory:<{width}}  {status:<6}  {r.seconds:7.2f}s  "
+            f"{r.files:>7}  {r.bytes_read / 1e6:8.1f}MB"
+        )
+    failed = [r for r in results if not r.ok]
+    busy = sum(r.seconds for r in results)
+    lines.append("")
+    lines.append(
+        f"{len(results) - len(failed)} of {len(results)} project(s) exported in "
+        f"{wall_seconds:.2f}s ({busy:.2f}s of export time)"
+    )
+    for r in failed:
+        lines.append(f"FAILED {r.directory}: {r.error}")
+    return "\n".join(lines)
+
+
+def report_dict(results: List[BatchResult], wall_seconds: float) -> Dict:
+    """The batch summary as JSON-ready data."""
+    return {
+        "wall_seconds": round(wall_seconds, 3),
+        "succeeded": sum(r.ok for r in results),
+        "failed": sum(not r.ok for r in results),
+        "projects": [
+            {**r._asdict(), "seconds": round(r.seconds, 3), "ok": r.ok}
+            for r in results
+        ],
+    }
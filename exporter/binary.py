@@ -0,0 +1,101 @@
+from typing import Optional, Tuple
+
+# Bytes read from the start of a file to decide whether it is binary
+SNIFF_BYTES = 8192
+
+# Share of control characters above which a NUL-free head is still binary
+CONTROL_RATIO = 0.30
+
+# (offset, signature, type) - checked in order, first match wins
+MAGIC_NUMBERS: Tuple[Tuple[int, bytes, str], ...] = (
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpeg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (0, b"\x00\x00\x01\x00", "ico"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+    (0, b"%PDF-", "pdf"),
+    (0, b"PK\x03\x04", "zip"),
+    (0, b"PK\x05\x06", "zip"),
+    (0, b"\x1f\x8b", "gzip"),
+    (0, b"\xfd7zXZ\x00", "xz"),
+    (0, b"\x28\xb5\x2f\xfd", "zstd"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+    (0, b"Rar!\x1a\x07", "rar"),
+    (257, b"ustar", "tar"),
+    (0, b"\x7fELF", "elf"),
+    (0, b"\xca\xfe\xba\xbe", "java-class"),
+    (0, b"\xfe\xed\xfa\xce", "mach-o"),
+    (0, b"\xfe\xed\xfa\xcf", "mach-o"),
+    (0, b"\xcf\xfa\xed\xfe", "mach-o"),
+    (0, b"\xce\xfa\xed\xfe", "mach-o"),
+    (0, b"\x00asm", "wasm"),
+    (0, b"SQLite format 3\x00", "sqlite"),
+    (0, b"\x89HDF\r\n\x1a\n", "hdf5"),
+    (0, b"\x93NUMPY", "npy"),
+    (0, b"\x80\x02", "pickle"),
+    (0, b"\x80\x03", "pickle"),
+    (0, b"\x80\x04", "pickle"),
+    (0, b"\x80\x05", "pickle"),
+    (4, b"ftyp", "mp4"),
+    (0, b"\x1aE\xdf\xa3", "matroska"),
+    (0, b"wOFF", "woff"),
+    (0, b"wOF2", "woff2"),
+    (0, b"\x00\x01\x00\x00\x00", "ttf"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "ole2"),
+)
+
+# Short signatures that plain text can also start with; only trusted
+# when the head contains a NUL byte as well
+WEAK_MAGIC_NUMBERS: Tuple[Tuple[int, bytes, str], ...] = (
+    (0, b"BM", "bmp"),
+    (0, b"MZ", "exe"),
+    (0, b"ID3", "mp3"),
+    (0, b"BZh", "bzip2"),
+    (0, b"OggS", "ogg"),
+    (0, b"fLaC", "flac"),
+    (0, b"OTTO", "otf"),
+)
+
+_RIFF_TYPES = {b"WAVE": "wav", b"AVI ": "avi", b"WEBP": "webp"}
+
+# Control characters that legitimately appear in text files
+_TEXT_CONTROLS = frozenset(b"\t\n\r\f\b\x1b")
+_CONTROL_BYTES = bytes(c for c in range(32) if c not in _TEXT_CONTROLS) + b"\x7f"
+
+
+def detect_magic(head: bytes) -> Optional[str]:
+    """Return the file type named by a known signature at the start of ``head``."""
+    for offset, signature, file_type in MAGIC_NUMBERS:
+        if head.startswith(signature, offset):
+            return file_type
+    if head.startswith(b"RIFF") and len(head) >= 12:
+        return _RIFF_TYPES.get(head[8:12], "riff")
+    if b"\x00" in head:
+        for offset, signature, file_type in WEAK_MAGIC_NUMBERS:
+            if head.startswith(signature, offset):
+                return file_type
+    return None
+
+
+def sniff_binary(head: bytes) -> Optional[str]:
+    """Classify the first bytes of a file.
+
+    Returns None for text, otherwise a short type label: the magic-number
+    type when one matches, else ``"binary"`` for content with NUL bytes or
+    a high share of control characters.
+    """
+    if not head:
+        return None
+    file_type = detect_magic(head)
+    if file_type is not None:
+        return file_type
+    if b"\x00" in head:
+        return "binary"
+    # Deleting the control bytes is much faster than counting them one by one
+    controls = len(head) - len(head.translate(None, _CONTROL_BYTES))
+    if controls / len(head) > CONTROL_RATIO:
+        return "binary"
+    return None
+
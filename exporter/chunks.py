@@ -0,0 +1,87 @@
+import hashlib
+from typing import Iterator, NamedTuple, Optional
+
+
+class Chunk(NamedTuple):
+    """A run of whole lines from one file.
+
+    Offsets and line numbers refer to the exported content, not the
+    bytes on disk: UTF-8 with ``\\r\\n`` and lone ``\\r`` turned into
+    ``\\n`` (as Python's text mode reads it), and for truncated files the
+    kept ends around the elision marker. Byte offsets are end exclusive;
+    line numbers are 1-based and inclusive.
+    """
+
+    index: int
+    byte_start: int
+    byte_end: int
+    line_start: int
+    line_end: int
+    text: str
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+
+def check_chunk_limits(max_bytes: int, max_lines: Optional[int], overlap: int):
+    """Raise ValueError unless the chunk sizes are positive and the overlap is not negative."""
+    if max_bytes <= 0:
+        raise ValueError(f"chunk size must be a positive number of bytes, not {max_bytes}")
+    if max_lines is not None and max_lines <= 0:
+        raise ValueError(f"chunk line limit must be positive, not {max_lines}")
+    if overlap < 0:
+        raise ValueError(f"chunk overlap cannot be negative, not {overlap}")
+
+
+def iter_chunks(
+    content: str,
+    max_bytes: int = 2048,
+    max_lines: Optional[int] = None,
+    overlap: int = 2,
+) -> Iterator[Chunk]:
+    """Split ``content`` into chunks of at most ``max_bytes`` and ``max_lines``.
+
+    Chunks always end on a line boundary; a single line longer than
+    ``max_bytes`` becomes a chunk of its own. Each chunk after the first
+    repeats the last ``overlap`` lines of the previous one, but always
+    advances by at least one line. Only ``\\n`` ends a line, so form
+    feeds and Unicode line separators stay inside their line; empty
+    content gives one empty chunk.
+    Chunks are produced one at a time.
+    """
+    check_chunk_limits(max_bytes, max_lines, overlap)
+    if not content:
+        yield Chunk(0, 0, 0, 1, 0, "")
+        return
+    lines = [line + "\n" for line in content.split("\n")]
+    # The last piece is what follows the final line break, if anything
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    if content.isascii():
+        sizes = [len(line) for line in lines]
+    else:
+        sizes = [len(line.encode("utf-8")) for line in lines]
+    # offsets[i] is the byte offset where line i starts
+    offsets = [0]
+    for size in sizes:
+        offsets.append(offsets[-1] + size)
+
+    index = start = 0
+    while start < len(lines):
+        end = start + 1
+        while end < len(lines):
+            if max_lines is not None and end - start >= max_lines:
+                break
+            if offsets[end + 1] - offsets[start] > max_bytes:
+                break
+            end += 1
+        yield Chunk(
+            index, offsets[start], offsets[end], start + 1, end,
+            "".join(lines[start:end]),
+        )
+        if end == len(lines):
+            return
+        index += 1
+        start = max(start + 1, end - overlap)
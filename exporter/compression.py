@@ -0,0 +1,70 @@
+import io
+import os
+from typing import BinaryIO, Dict, Optional, Union
+
+# Codec name -> file extension it is selected by
+COMPRESSION_EXTENSIONS: Dict[str, str] = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+    "xz": ".xz",
+}
+_EXTENSION_CODECS = {ext: codec for codec, ext in COMPRESSION_EXTENSIONS.items()}
+
+# Writes are gathered into blocks this large before reaching the compressor
+BUFFER_SIZE = 1024 * 1024
+
+
+def compression_for_output(output_file: str, default: Optional[str] = None) -> Optional[str]:
+    """Pick the codec from the output extension, falling back to ``default``."""
+    ext = os.path.splitext(output_file)[1].lower()
+    return _EXTENSION_CODECS.get(ext) or default
+
+
+def strip_compression_extension(output_file: str) -> str:
+    """``export.json.gz`` -> ``export.json``; other names are returned as is."""
+    root, ext = os.path.splitext(output_file)
+    return root if ext.lower() in _EXTENSION_CODECS else output_file
+
+
+def _zstd_compressor(level: Optional[int]):
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd output needs the zstandard package (pip install zstandard)"
+        ) from None
+    return zstandard.ZstdCompressor(level=3 if level is None else level)
+
+
+def open_compressed(
+    path: Union[str, BinaryIO], codec: str, level: Optional[int] = None
+) -> BinaryIO:
+    """Open ``path`` for writing through a streaming compressor.
+
+    ``path`` may also be a binary file object, such as a socket stream.
+    The returned object is a buffered binary file; closing it flushes the
+    compressor and closes ``path`` (a file object is left open). ``level`` uses each codec's own scale
+    (gzip 0-9, xz 0-9, zstd 1-22); the defaults are gzip 6, xz 6, zstd 3.
+    """
+    if codec == "gzip":
+        import gzip
+
+        level = 6 if level is None else level
+        if isinstance(path, str):
+            stream = gzip.GzipFile(path, "wb", compresslevel=level)
+        else:
+            stream = gzip.GzipFile(fileobj=path, mode="wb", compresslevel=level)
+    elif codec == "xz":
+        import lzma
+
+        stream = lzma.LZMAFile(path, "wb", preset=level)
+    elif codec == "zstd":
+        # Import (and fail) before the output file is created
+        compressor = _zstd_compressor(level)
+        if isinstance(path, str):
+            stream = compressor.stream_writer(open(path, "wb"), closefd=True)
+        else:
+            stream = compressor.stream_writer(path, closefd=False)
+    else:
+        raise ValueError(f"unknown compression: {codec!r}")
+    return io.BufferedWriter(stream, BUFFER_SIZE)
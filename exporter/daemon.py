@@ -0,0 +1,624 @@
+import errno
+import hmac
+import http.client
+import io
+import json
+import os
+import secrets
+import socket
+import socketserver
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import BinaryIO, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .compression import compression_for_output, open_compressed
+from .engine import ExportEngine
+from .gitignore import IGNORE_FILES
+from .options import ExportOptions
+from .progress import ProgressReporter
+from .records import ReadResult
+from .stats import ExportStats
+from .walker import FileEntry, ProjectScan
+from .writers import format_for_output
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+# Exports running at once; further requests wait for a slot
+DEFAULT_CONCURRENCY = 4
+# Total decoded content kept across all projects
+CONTENT_CACHE_CHARS = 256 * 1024 * 1024
+# Projects whose directory listings are kept warm
+MAX_PROJECTS = 64
+# Size of each chunk of a streamed response
+STREAM_CHUNK_BYTES = 64 * 1024
+# Every request must carry the daemon's token in this header
+TOKEN_HEADER = "X-Export-Token"
+# Largest body read off a refused request before closing the connection
+REFUSED_BODY_BYTES = 64 * 1024
+
+CONTENT_TYPES = {
+    "text": "text/plain; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+    "json": "application/json",
+    "yaml": "application/yaml",
+    "jsonl-chunks": "application/x-ndjson",
+}
+
+# Parses a request's command line into (directory, output name, options);
+# raises ValueError for invalid arguments
+RequestParser = Callable[[List[str]], Tuple[Optional[str], Optional[str], ExportOptions]]
+
+
+class DaemonError(Exception):
+    """A request the daemon rejected, or an export that failed while streaming."""
+
+
+def parse_address(address: str) -> Tuple[int, object]:
+    """``unix:/path``, a path containing ``/``, ``host:port`` or a bare port.
+
+    TCP addresses must be loopback: the daemon reads any directory it is
+    asked for, so it never listens on other interfaces.
+    """
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[5:]
+    if "/" in address:
+        return socket.AF_UNIX, address
+    host, _, port = address.rpartition(":")
+    host = host.strip("[]") or "127.0.0.1"
+    if not _is_loopback(host):
+        raise ValueError(f"the daemon only listens on localhost, not {host!r}")
+    try:
+        return socket.AF_INET6 if ":" in host else socket.AF_INET, (host, int(port))
+    except ValueError:
+        raise ValueError(f"invalid address: {address!r}") from None
+
+
+def _is_loopback(host: str) -> bool:
+    return host == "localhost" or host.startswith("127.") or host == "::1"
+
+
+def token_path(address: str) -> str:
+    """Where the daemon on ``address`` keeps its access token.
+
+    Next to a Unix socket; for a TCP port, in a private directory under
+    $XDG_RUNTIME_DIR or ~/.cache. Only the daemon's user can read it.
+    """
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX:
+        return addr + ".token"
+    state_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    host, port = addr
+    return os.path.join(state_dir, "project-exporter", f"daemon-{host}-{port}.token")
+
+
+def write_token(address: str, token: str):
+    """Store a daemon's token with mode 0600, replacing a stale one.
+
+    Only call this once the daemon has bound ``address``, so a daemon
+    that fails to start never replaces the token of one that is running.
+    """
+    path = token_path(address)
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w", encoding="ascii") as f:
+        f.write(token)
+
+
+def read_token(address: str) -> str:
+    try:
+        with open(token_path(address), encoding="ascii") as f:
+            return f.read().strip()
+    except OSError as e:
+        raise DaemonError(f"cannot read the daemon's token ({e}); is it running?") from None
+
+
+class ContentCache:
+    """Size-bounded LRU cache of read file records shared by all projects.
+
+    Keyed by the file's path, its path relative to the exported root
+    (records carry it), size and mtime plus the options that shape its
+    record, so an edited file misses and is read again, and a project
+    exported from a parent or a subdirectory never gets the other's paths. Records with
+    read errors are not cached.
+    """
+
+    def __init__(self, max_chars: int = CONTENT_CACHE_CHARS):
+        self.max_chars = max_chars
+        self.chars = 0
+        self.hits = 0
+        self.misses = 0
+        self._results: "OrderedDict[Tuple, Tuple[Optional[ReadResult], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: Tuple) -> Tuple[bool, Optional[ReadResult]]:
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is None:
+                self.misses += 1
+                return False, None
+            self._results.move_to_end(key)
+            self.hits += 1
+            return True, cached[0]
+
+    def put(self, key: Tuple, result: Optional[ReadResult]):
+        if result is not None and "error" in result.record:
+            return
+        content = result.record.get("content") if result is not None else None
+        size = len(content) if isinstance(content, str) else 0
+        # Rough per-entry overhead of the key, record dict and metadata
+        size += 256
+        if size > self.max_chars:
+            return
+        with self._lock:
+            old = self._results.pop(key, None)
+            if old is not None:
+                self.chars -= old[1]
+            self._results[key] = (result, size)
+            self.chars += size
+            while self.chars > self.max_chars:
+                _, (_, dropped) = self._results.popitem(last=False)
+                self.chars -= dropped
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._results), "chars": self.chars,
+                "hits": self.hits, "misses": self.misses,
+            }
+
+
+class _CachedScan(NamedTuple):
+    scan: ProjectScan
+    # (mtime_ns of each walked directory, then of its ignore files), in scan.dirs order
+    stamps: List[Tuple[int, ...]]
+
+
+class ProjectState:
+    """Directory listings of one project kept between requests.
+
+    A listing is reused while every walked directory and every ignore
+    file in it has the mtime it had when it was listed: adding, removing
+    or renaming an entry changes its directory's mtime. File sizes and
+    mtimes are re-read with one stat per file, so edited files are seen
+    without walking the tree again.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self.requests = 0
+        self.rescans = 0
+        self._scans: Dict[Tuple, _CachedScan] = {}
+        self._lock = threading.Lock()
+
+    def _stamps(self, dirs: List[str]) -> Optional[List[Tuple[int, ...]]]:
+        stamps = []
+        for rel_dir in dirs:
+            path = os.path.join(self.root_dir, rel_dir)
+            try:
+                stamp = [os.stat(path).st_mtime_ns]
+            except OSError:
+                return None
+            for name in IGNORE_FILES:
+                try:
+                    stamp.append(os.stat(os.path.join(path, name)).st_mtime_ns)
+                except OSError:
+                    stamp.append(0)
+            stamps.append(tuple(stamp))
+        # Exclude rules, and the index that --source git lists files from
+        for name in (os.path.join("info", "exclude"), "index"):
+            try:
+                stamps.append((os.stat(os.path.join(self.root_dir, ".git", name)).st_mtime_ns,))
+            except OSError:
+                stamps.append((0,))
+        return stamps
+
+    def _refresh_files(self, scan: ProjectScan, sizes_matter: bool) -> Optional[ProjectScan]:
+        """Re-stat every file of a reused listing; None if it must be walked again."""
+        files = []
+        changed = False
+        for entry in scan.files:
+            try:
+                st = os.stat(entry.path)
+            except OSError:
+                return None
+            if st.st_size != entry.size or st.st_mtime != entry.mtime:
+                if sizes_matter and st.st_size != entry.size:
+                    # The size budget may now cut the walk somewhere else
+                    return None
+                entry = FileEntry(entry.path, entry.rel_path, st.st_size, st.st_mtime)
+                changed = True
+            files.append(entry)
+        return scan._replace(files=files) if changed else scan
+
+    def scan(self, engine: ExportEngine, stats: Optional[ExportStats] = None,
+             progress: Optional[ProgressReporter] = None) -> ProjectScan:
+        options = engine.options
+        key = (
+            frozenset(options.ignore_patterns), options.use_gitignore,
+            options.file_source, options.git_untracked,
+            options.max_total_bytes, options.max_file_bytes,
+        )
+        with self._lock:
+            self.requests += 1
+            cached = self._scans.get(key)
+        if cached is not None and self._stamps(cached.scan.dirs) == cached.stamps:
+            scan = self._refresh_files(cached.scan, options.max_total_bytes is not None)
+            if scan is not None:
+                if scan is not cached.scan:
+                    with self._lock:
+                        self._scans[key] = cached._replace(scan=scan)
+                return scan
+
+        # Taken before the walk, so a change made during it is seen next time
+        scan = ExportEngine.scan(engine, self.root_dir, None, stats, progress)
+        stamps = self._stamps(scan.dirs)
+        with self._lock:
+            self.rescans += 1
+            if stamps is not None:
+                self._scans[key] = _CachedScan(scan, stamps)
+        return scan
+
+
+class WarmEngine(ExportEngine):
+    """ExportEngine that reuses a project's warm listing and the shared content cache."""
+
+    def __init__(self, options: ExportOptions, project: ProjectState, cache: ContentCache):
+        super().__init__(options)
+        self.project = project
+        self.cache = cache
+
+    def scan(self, root_dir, output_file=None, stats=None, progress=None) -> ProjectScan:
+        return self.project.scan(self, stats, progress)
+
+    def _read(self, entry, hash_content, stats=None):
+        options = self.options
+        tokenizer = options.tokenizer if self.tokenizer is not None else None
+        key = (
+            entry.path, entry.rel_path, entry.size, entry.mtime, hash_content,
+            options.llm_optimize, options.binary_policy, options.max_file_bytes,
+            options.truncate_mode, tokenizer,
+        )
+        found, result = self.cache.get(key)
+        if found:
+            return result
+        result = super()._read(entry, hash_content, stats)
+        self.cache.put(key, result)
+        return result
+
+
+class _ChunkedWriter(io.RawIOBase):
+    """Writes each block it is given as one HTTP/1.1 chunk."""
+
+    def __init__(self, wfile: BinaryIO):
+        self.wfile = wfile
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        size = len(data)
+        if size:
+            self.wfile.write(b"%x\r\n%s\r\n" % (size, bytes(data)))
+        return size
+
+
+class ExportDaemon:
+    """Warm state and request handling shared by all connections of one server."""
+
+    def __init__(
+        self,
+        parse_request: RequestParser,
+        token: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        cache_chars: int = CONTENT_CACHE_CHARS,
+    ):
+        self.parse_request = parse_request
+        self.token = token
+        self.concurrency = concurrency
+        self.cache = ContentCache(cache_chars)
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self._projects: "OrderedDict[str, ProjectState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def project(self, root_dir: str) -> ProjectState:
+        with self._lock:
+            state = self._projects.get(root_dir)
+            if state is None:
+                state = self._projects[root_dir] = ProjectState(root_dir)
+                if len(self._projects) > MAX_PROJECTS:
+                    self._projects.popitem(last=False)
+            self._projects.move_to_end(root_dir)
+            return state
+
+    def status(self) -> Dict:
+        with self._lock:
+            projects = {
+                root: {"requests": p.requests, "rescans": p.rescans}
+                for root, p in self._projects.items()
+            }
+        return {
+            "concurrency": self.concurrency,
+            "projects": projects,
+            "content_cache": self.cache.status(),
+        }
+
+    def prepare(self, argv: List[str], cwd: str) -> Tuple[WarmEngine, str, str, Optional[str]]:
+        """Validate a request; returns the engine, project root, format and codec."""
+        directory, output_name, options = self.parse_request(argv)
+        if not directory:
+            raise ValueError("no directory given")
+        root_dir = os.path.normpath(os.path.join(cwd, directory))
+        if not os.path.isdir(root_dir):
+            raise ValueError(f"not a directory: {root_dir}")
+        export_format = options.export_format
+        codec = options.compress
+        if output_name:
+            export_format = format_for_output(output_name, export_format)
+            codec = compression_for_output(output_name, codec)
+        engine = WarmEngine(options, self.project(root_dir), self.cache)
+        return engine, root_dir, export_format, codec
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ProjectExporter"
+
+    @property
+    def daemon(self) -> ExportDaemon:
+        return self.server.daemon
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/plain; charset=utf-8"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reject(self, status: int, message: bytes):
+        """Answer without handling the request, and close the connection.
+
+        A small unread body is drained first, so the client is not cut
+        off while it is still sending and sees the answer.
+        """
+        self.close_connection = True
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = 0
+        if 0 < length <= REFUSED_BODY_BYTES:
+            self.rfile.read(length)
+        self._send(status, message)
+
+    def _refuse(self) -> bool:
+        """Answer requests that may come from a web page; True if refused.
+
+        Binding to loopback does not stop a browser from posting to it,
+        or a DNS-rebinding page from reading it, so the Host must be a
+        loopback name and the request must carry the token, which only
+        processes of the daemon's user can read.
+        """
+        host = self.headers.get("Host", "")
+        if host.startswith("["):
+            host = host[1:host.find("]")]
+        else:
+            host = host.rpartition(":")[0] if ":" in host else host
+        if not _is_loopback(host):
+            self._reject(403, b"requests must be addressed to localhost\n")
+            return True
+        token = self.headers.get(TOKEN_HEADER, "")
+        if not hmac.compare_digest(token.encode(), self.daemon.token.encode()):
+            self._reject(403, b"missing or wrong daemon token\n")
+            return True
+        return False
+
+    def do_GET(self):
+        if self._refuse():
+            return
+        if self.path != "/status":
+            self._send(404, b"unknown path\n")
+            return
+        body = json.dumps(self.daemon.status(), indent=2).encode()
+        self._send(200, body, "application/json")
+
+    def do_POST(self):
+        if self._refuse():
+            return
+        if self.path != "/export":
+            self._reject(404, b"unknown path\n")
+            return
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            self._reject(415, b"requests must be application/json\n")
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            engine, root_dir, export_format, codec = self.daemon.prepare(
+                [str(arg) for arg in request["argv"]], request.get("cwd") or os.getcwd()
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, f"{e}\n".encode())
+            return
+
+        with self.daemon.slots:
+            self.send_response(200)
+            self.send_header(
+                "Content-Type",
+                "application/octet-stream" if codec else CONTENT_TYPES[export_format],
+            )
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                buffered = io.BufferedWriter(_ChunkedWriter(self.wfile), STREAM_CHUNK_BYTES)
+                stream = buffered
+                if codec is not None:
+                    stream = open_compressed(buffered, codec, engine.options.compress_level)
+                engine.export_to_stream(root_dir, stream, export_format)
+                stream.close()
+                buffered.close()
+                self.wfile.write(b"0\r\n\r\n")
+            except Exception as e:
+                # Without the final chunk the client sees a truncated response
+                self.close_connection = True
+                self.log_error("export of %s failed: %s", root_dir, e)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler logs client_address[0]
+        return request, ("local", 0)
+
+
+class _TCPHTTPServer(ThreadingHTTPServer):
+    def __init__(self, address, handler, family):
+        self.address_family = family
+        super().__init__(address, handler)
+
+
+def _socket_in_use(path: str) -> bool:
+    """True if something accepts connections on the Unix socket at ``path``."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+    return True
+
+
+def make_server(address: str, daemon: ExportDaemon) -> socketserver.BaseServer:
+    """Bind a threading HTTP server for ``daemon``; call serve_forever() to run it.
+
+    A Unix socket left behind by a daemon that died is replaced, but one
+    that still answers raises EADDRINUSE, as a TCP port in use does.
+    """
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX:
+        if os.path.exists(addr):
+            if _socket_in_use(addr):
+                raise OSError(errno.EADDRINUSE, f"a daemon is already serving on {address}")
+            os.remove(addr)
+        server = _UnixHTTPServer(addr, _RequestHandler)
+        os.chmod(addr, 0o600)
+    else:
+        server = _TCPHTTPServer(addr, _RequestHandler, family)
+    server.daemon = daemon
+    return server
+
+
+def serve(
+    address: str,
+    parse_request: RequestParser,
+    concurrency: int = DEFAULT_CONCURRENCY,
+):
+    """Serve export requests on ``address`` until interrupted.
+
+    ``POST /export`` takes ``{"argv": [...], "cwd": "..."}``, the command
+    line of an export relative to ``cwd``, and streams the export back
+    with chunked transfer encoding; nothing is written to the project.
+    ``GET /status`` reports the warm projects and the content cache.
+    Every request needs the token written to ``token_path(address)``.
+    """
+    token = secrets.token_urlsafe(32)
+    server = make_server(address, ExportDaemon(parse_request, token, concurrency))
+    try:
+        write_token(address, token)
+        print(f"Serving exports on {address}, press Ctrl+C to stop", file=sys.stderr)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        family, addr = parse_address(address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.remove(addr)
+        if os.path.exists(token_path(address)):
+            os.remove(token_path(address))
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+
+def _connect(address: str, timeout: Optional[float] = None) -> http.client.HTTPConnection:
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX:
+        return _UnixHTTPConnection(addr, timeout)
+    host, port = addr
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def request_export(
+    address: str,
+    argv: List[str],
+    out: BinaryIO,
+    cwd: Optional[str] = None,
+    timeout: Optional[float] = None,
+    token: Optional[str] = None,
+) -> int:
+    """Ask the daemon at ``address`` for an export and copy it to ``out``.
+
+    ``argv`` is an export command line as main.py takes it; relative
+    paths in it are resolved against ``cwd`` (default: the current
+    directory). Returns the number of bytes received. Raises DaemonError
+    when the request is rejected or the export fails part way. ``token``
+    defaults to the one the daemon wrote to ``token_path(address)``.
+    """
+    headers = {
+        "Content-Type": "application/json",
+        TOKEN_HEADER: token if token is not None else read_token(address),
+    }
+    conn = _connect(address, timeout)
+    try:
+        body = json.dumps({"argv": argv, "cwd": cwd or os.getcwd()}).encode()
+        conn.request("POST", "/export", body, headers)
+        response = conn.getresponse()
+        if response.status != 200:
+            raise DaemonError(response.read().decode("utf-8", "replace").strip())
+        received = 0
+        try:
+            while True:
+                data = response.read(STREAM_CHUNK_BYTES)
+                if not data:
+                    break
+                out.write(data)
+                received += len(data)
+        except http.client.IncompleteRead:
+            raise DaemonError("the export failed on the daemon; see its log") from None
+        return received
+    finally:
+        conn.close()
+
+
+def daemon_status(
+    address: str, timeout: Optional[float] = None, token: Optional[str] = None
+) -> Dict:
+    """The daemon's warm projects and content cache counters."""
+    headers = {TOKEN_HEADER: token if token is not None else read_token(address)}
+    conn = _connect(address, timeout)
+    try:
+        conn.request("GET", "/status", headers=headers)
+        response = conn.getresponse()
+        if response.status != 200:
+            raise DaemonError(response.read().decode("utf-8", "replace").strip())
+        return json.loads(response.read())
+    finally:
+        conn.close()
@@ -0,0 +1,492 @@
+import mmap
+import os
+from contextlib import ExitStack, closing
+from time import perf_counter
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+from .compression import compression_for_output, open_compressed
+from .gitfiles import git_file_list, scan_paths
+from .gitignore import GitIgnoreRules
+from .ignore import IgnoreMatcher, compile_ignore_patterns
+from .manifest import Manifest, export_fingerprint, manifest_path
+from .options import ExportOptions, default_output_path
+from .output import OutputStream
+from .parallel import ordered_map
+from .progress import ProgressReporter
+from .binary import SNIFF_BYTES, sniff_binary
+from .records import ReadResult, build_duplicate_record, placeholder_text, read_entry
+from .stats import ExportStats
+from .tokens import (
+    BudgetSelection,
+    Tokenizer,
+    count_bytes,
+    count_bytes_of_size,
+    record_tokens,
+    resolve_tokenizer,
+    select_within_budget,
+)
+from .walker import FileEntry, ProjectScan, scan_project
+from .writers import WRITERS, format_for_output
+
+# UTF-8 bytes of content the token budget pass keeps for the write pass;
+# files beyond this are read again instead
+BUDGET_CACHE_BYTES = 4 * 1024 * 1024
+
+
+def output_artifacts(output_file: str) -> Tuple[str, ...]:
+    """The output file and everything the engine keeps beside it."""
+    manifest = manifest_path(output_file)
+    return (output_file, output_file + ".partial", manifest, manifest + ".tmp")
+
+
+def should_ignore(path: str, patterns: Iterable[str]) -> bool:
+    """Check if a path should be ignored based on patterns."""
+    name = os.path.basename(path)
+    return compile_ignore_patterns(patterns).matches(name)
+
+
+class ExportEngine:
+    """Qt-free export logic driven by an ExportOptions instance."""
+
+    def __init__(self, options: Optional[ExportOptions] = None):
+        self.options = options or ExportOptions()
+        # Files kept and dropped by the token budget in the most recent export
+        self.selection: Optional[BudgetSelection] = None
+        # Records read while applying the budget, taken by the write pass
+        self._selected: Dict[str, ReadResult] = {}
+
+    @property
+    def matcher(self) -> IgnoreMatcher:
+        """Compiled ignore patterns, rebuilt only when the pattern set changes."""
+        return compile_ignore_patterns(self.options.ignore_patterns)
+
+    def should_ignore(self, path: str, is_dir: bool = False) -> bool:
+        """Check if a path relative to the project root should be ignored."""
+        return self.matcher.matches(path.replace(os.sep, "/"), is_dir)
+
+    def scan(
+        self,
+        root_dir: str,
+        output_file: Optional[str] = None,
+        stats: Optional[ExportStats] = None,
+        progress: Optional[ProgressReporter] = None,
+    ) -> ProjectScan:
+        """Walk the project once, returning the tree and the files to export.
+
+        With ``options.file_source == "git"`` the files come from the git
+        index instead (tracked files, plus untracked ones that are not
+        ignored with ``options.git_untracked``), so git's own ignore
+        rules apply and ignored directories are never read; outside a
+        git work tree the project is walked as usual.
+        """
+        # Never export the output itself or the files kept beside it
+        exclude = output_artifacts(output_file) if output_file else ()
+        if self.options.file_source == "git":
+            paths = git_file_list(root_dir, self.options.git_untracked)
+            if paths is not None:
+                return scan_paths(
+                    root_dir, paths, self.matcher.matches, exclude,
+                    self.options.max_total_bytes, self.options.max_file_bytes, stats,
+                    progress.scanning if progress is not None else None,
+                )
+        return scan_project(
+            root_dir, self.matcher.matches, exclude, self.ignore_rules(root_dir),
+            self.options.max_total_bytes, self.options.max_file_bytes, stats,
+            progress.scanning if progress is not None else None,
+        )
+
+    @property
+    def tokenizer(self) -> Optional[Tokenizer]:
+        """Token counter for LLM exports and token budgets, None when unused."""
+        if not (self.options.llm_optimize or self.options.token_budget is not None):
+            return None
+        return resolve_tokenizer(self.options.tokenizer)
+
+    def ignore_rules(self, root_dir: str) -> Optional[GitIgnoreRules]:
+        """Fresh per-export cache of the project's .gitignore rules, if enabled."""
+        if not self.options.use_gitignore:
+            return None
+        return GitIgnoreRules(root_dir)
+
+    def _read(
+        self,
+        entry: FileEntry,
+        hash_content: bool,
+        stats: Optional[ExportStats] = None,
+    ) -> Optional[ReadResult]:
+        """Read one file with the engine's options and count its tokens."""
+        options = self.options
+        if stats is not None:
+            start = perf_counter()
+        result = read_entry(
+            entry, options.llm_optimize, hash_content, options.binary_policy,
+            options.max_file_bytes, options.truncate_mode, stats,
+        )
+        if result is not None:
+            result = self._count_tokens(result, stats)
+        if stats is not None:
+            stats.file_done(entry.rel_path, perf_counter() - start)
+        return result
+
+    def _count_tokens(
+        self, result: ReadResult, stats: Optional[ExportStats] = None
+    ) -> ReadResult:
+        tokenizer = self.tokenizer
+        if tokenizer is None:
+            return result
+        if stats is not None:
+            start = perf_counter()
+        tokens = record_tokens(result.record, tokenizer)
+        if "metadata" in result.record:
+            result.record["metadata"]["token_estimate"] = tokens
+        if stats is not None:
+            stats.lap("tokens", start)
+        return result._replace(tokens=tokens)
+
+    def _iter_results(
+        self,
+        scan: ProjectScan,
+        previous: Optional[Manifest] = None,
+        hash_content: bool = False,
+        dedup: bool = True,
+        stats: Optional[ExportStats] = None,
+    ) -> Iterator[ReadResult]:
+        """Yield a ReadResult per exported file.
+
+        ``record`` is None when the body can be reused from ``previous``.
+        Token estimates are taken here, on the reading threads, and added
+        to the LLM metadata. With ``options.dedup``, repeated content is
+        replaced by a reference to its first occurrence in walk order.
+        """
+        if self.options.structure_only:
+            return
+        options = self.options
+        llm_optimize = options.llm_optimize
+        dedup = dedup and options.dedup
+        # LLM metadata carries the hash, and dedup is keyed on it
+        hash_content = hash_content or llm_optimize or dedup
+
+        def read(entry):
+            old = previous.unchanged(entry) if previous is not None else None
+            if old is not None:
+                return ReadResult(entry, None, old.digest)
+            result = self._selected.pop(entry.rel_path, None)
+            if result is None or result.entry != entry:
+                result = self._read(entry, hash_content, stats)
+            if result is None:
+                return None
+            if previous is not None and not llm_optimize and result.digest is not None:
+                # Touched but identical: the plain record depends only on path and content
+                old = previous.files.get(entry.rel_path)
+                if old is not None and old.digest == result.digest:
+                    return ReadResult(entry, None, old.digest)
+            return result
+
+        first_paths: Dict[str, str] = {}
+        for result in ordered_map(read, scan.files, options.jobs):
+            # None means a binary file skipped by policy
+            if result is None:
+                continue
+            if dedup and result.digest is not None:
+                result = self._dedup(result, first_paths, previous, hash_content, stats)
+            yield result
+
+    def _dedup(
+        self,
+        result: ReadResult,
+        first_paths: Dict[str, str],
+        previous: Optional[Manifest],
+        hash_content: bool,
+        stats: Optional[ExportStats] = None,
+    ) -> ReadResult:
+        """Turn a repeat of already exported content into a reference record.
+
+        Files no longer than the reference line (empty ``__init__.py``
+        files and the like) are exported as they are, since the reference
+        would only make the output bigger.
+        """
+        entry = result.entry
+        first = first_paths.setdefault(result.digest, entry.rel_path)
+        duplicate_of = first if first != entry.rel_path else None
+        if duplicate_of is not None and entry.size <= len(
+            placeholder_text({"duplicate_of": duplicate_of})
+        ):
+            duplicate_of = None
+        if result.record is None:
+            if previous.files[entry.rel_path].duplicate_of == duplicate_of:
+                return result
+            if duplicate_of is None:
+                # Was a reference to a file that is gone or changed: read it again
+                return self._read(entry, hash_content, stats)
+        if duplicate_of is None:
+            return result
+        if stats is not None:
+            stats.count("duplicates")
+        record = build_duplicate_record(
+            entry, duplicate_of, result.digest, self.options.llm_optimize
+        )
+        return self._count_tokens(ReadResult(entry, record, result.digest), stats)
+
+    def _size_tokens(self, entry: FileEntry) -> Optional[int]:
+        """The bytes tokenizer's count for a file, from its size and head alone.
+
+        None for a binary file the export will skip.
+        """
+        try:
+            with open(entry.path, "rb") as f:
+                binary_type = sniff_binary(f.read(SNIFF_BYTES))
+        except OSError:
+            binary_type = None
+        if binary_type is not None:
+            if self.options.binary_policy == "skip":
+                return None
+            return count_bytes(placeholder_text(
+                {"binary_type": binary_type, "size_bytes": entry.size}
+            ))
+        max_bytes = self.options.max_file_bytes
+        return count_bytes_of_size(entry.size if max_bytes is None else min(entry.size, max_bytes))
+
+    def select_files(
+        self, scan: ProjectScan, stats: Optional[ExportStats] = None
+    ) -> Tuple[ProjectScan, BudgetSelection]:
+        """Drop files until the export fits ``options.token_budget``.
+
+        With the default ``bytes`` tokenizer, tokens are estimated from
+        the file sizes the walk already has; only each file's head is read,
+        so binary files are charged for their placeholder, or left out
+        under the "skip" policy, as the export will do. Other tokenizers
+        need the text, so files are read and counted, and the records of
+        files that are kept (up to BUDGET_CACHE_BYTES of content) are
+        handed to the write pass instead of being read twice. The returned scan keeps the full tree
+        but only the selected files, in walk order.
+        """
+        tokenizer = self.tokenizer
+        self._selected = {}
+        results: Dict[str, ReadResult] = {}
+        if tokenizer is count_bytes:
+            costs = ordered_map(self._size_tokens, scan.files, self.options.jobs)
+            candidates = [
+                (entry, tokens) for entry, tokens in zip(scan.files, costs)
+                if tokens is not None
+            ]
+        else:
+            # Counted before dedup: a kept copy may become the first occurrence
+            # if the original is dropped, so budget for its full content.
+            # Hashed whenever the write pass will need the digest
+            cached = 0
+            candidates = []
+            for result in self._iter_results(
+                scan, hash_content=self.options.incremental, dedup=False, stats=stats
+            ):
+                candidates.append((result.entry, result.tokens))
+                content = result.record.get("content") or ""
+                size = len(content) if content.isascii() else len(content.encode("utf-8"))
+                if cached + size <= BUDGET_CACHE_BYTES:
+                    cached += size
+                    results[result.entry.rel_path] = result
+        selection = select_within_budget(
+            candidates, self.options.token_budget, tokenizer(scan.tree)
+        )
+        kept = {path for path, _ in selection.kept}
+        files = [entry for entry in scan.files if entry.rel_path in kept]
+        self._selected = {path: results[path] for path in kept if path in results}
+        return scan._replace(files=files), selection
+
+    def generate_file_structure(
+        self,
+        root_dir: str,
+        output_file: str,
+        stats: Optional[ExportStats] = None,
+        progress: Optional[ProgressReporter] = None,
+    ):
+        """Generate the file structure and content output.
+
+        The tree is built in one walk, then file records are read and
+        written one at a time, so memory stays bounded by the largest file.
+        In incremental mode, records of files unchanged since the previous
+        export are copied byte-for-byte from it instead of being re-read.
+        A ``.gz``, ``.zst`` or ``.xz`` output (or ``options.compress``) is
+        written through a streaming compressor.
+        With a token budget, only the files chosen by select_files are
+        exported and the choice is left in ``self.selection``.
+        When ``stats`` is given it is filled with phase timings, counters
+        and the slowest and largest files.
+        ``progress`` is told about every directory walked and file written,
+        and can cancel the export: ExportCancelled is raised and the output
+        file is left as it was before the export started.
+        """
+        if stats is not None:
+            started = perf_counter()
+        root_dir = os.path.normpath(root_dir)
+        export_format = format_for_output(output_file, self.options.export_format)
+        codec = compression_for_output(output_file, self.options.compress)
+        scan = self._prepare(root_dir, output_file, stats, progress)
+
+        manifest = previous = None
+        # Byte spans inside a compressed stream cannot be spliced, so
+        # compressed exports are always written in full
+        if self.options.incremental and not self.options.structure_only and codec is None:
+            fingerprint = export_fingerprint(root_dir, export_format, self.options)
+            previous = Manifest.load(output_file, fingerprint)
+            manifest = Manifest(fingerprint)
+
+        # Write beside the output and replace it at the end, so a failed or
+        # cancelled export never leaves a half-written file, and the previous
+        # output can be read while the new one is written
+        target = output_file + ".partial"
+        try:
+            if codec is not None:
+                raw = open_compressed(target, codec, self.options.compress_level)
+            else:
+                raw = open(target, "wb")
+            with raw, ExitStack() as stack:
+                source = None
+                if previous is not None:
+                    f = stack.enter_context(open(output_file, "rb"))
+                    mm = stack.enter_context(
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    )
+                    source = stack.enter_context(memoryview(mm))
+                self._write(
+                    raw, root_dir, scan, export_format, previous, manifest, source,
+                    stats, progress,
+                )
+            os.replace(target, output_file)
+        except BaseException:
+            if os.path.exists(target):
+                os.remove(target)
+            raise
+
+        if manifest is not None:
+            manifest.save(output_file)
+        if stats is not None:
+            stats.total_seconds = perf_counter() - started
+
+    def export_to_stream(
+        self,
+        root_dir: str,
+        raw: BinaryIO,
+        export_format: Optional[str] = None,
+        stats: Optional[ExportStats] = None,
+        progress: Optional[ProgressReporter] = None,
+    ):
+        """Write a complete export to an open binary stream.
+
+        Nothing is written to disk: there is no output file to exclude,
+        replace or keep a manifest beside, so ``options.incremental`` and
+        ``options.compress`` are not applied (wrap ``raw`` with
+        ``open_compressed`` for compression). ``export_format`` defaults to
+        ``options.export_format``. Records are written as they are read,
+        so a socket or pipe receives the export while it is produced.
+        """
+        if stats is not None:
+            started = perf_counter()
+        root_dir = os.path.normpath(root_dir)
+        scan = self._prepare(root_dir, None, stats, progress)
+        self._write(
+            raw, root_dir, scan, export_format or self.options.export_format,
+            stats=stats, progress=progress,
+        )
+        if stats is not None:
+            stats.total_seconds = perf_counter() - started
+
+    def _prepare(
+        self,
+        root_dir: str,
+        output_file: Optional[str],
+        stats: Optional[ExportStats],
+        progress: Optional[ProgressReporter],
+    ) -> ProjectScan:
+        """Walk the project, apply the token budget and announce the file count."""
+        if stats is not None:
+            start = perf_counter()
+        scan = self.scan(root_dir, output_file, stats, progress)
+        if stats is not None:
+            stats.lap("walk", start)
+            stats.count("dirs", len(scan.dirs))
+            stats.count("files", len(scan.files))
+            stats.set_files(scan.files)
+        self.selection = None
+        self._selected = {}
+        if self.options.token_budget is not None and not self.options.structure_only:
+            if stats is not None:
+                start = perf_counter()
+            scan, self.selection = self.select_files(scan, stats)
+            if stats is not None:
+                stats.lap("select", start)
+
+        if progress is not None:
+            files = () if self.options.structure_only else scan.files
+            progress.started(len(files), sum(entry.size for entry in files))
+        return scan
+
+    def _write(
+        self,
+        raw: BinaryIO,
+        root_dir: str,
+        scan: ProjectScan,
+        export_format: str,
+        previous: Optional[Manifest] = None,
+        manifest: Optional[Manifest] = None,
+        source: Optional[memoryview] = None,
+        stats: Optional[ExportStats] = None,
+        progress: Optional[ProgressReporter] = None,
+    ):
+        """Render the tree and every record of ``scan`` to ``raw``.
+
+        Records unchanged since ``previous`` are spliced from ``source``,
+        the previous output; ``manifest`` collects the new byte spans.
+        """
+        writer = WRITERS[export_format](OutputStream(raw), root_dir, self.options)
+        if stats is not None:
+            start = perf_counter()
+        writer.begin(scan.tree)
+        if stats is not None:
+            stats.lap("render", start)
+        # Closed on the way out, so an abandoned export stops its readers
+        with closing(self._iter_results(
+            scan, previous, manifest is not None, stats=stats
+        )) as results:
+            for result in results:
+                if stats is not None:
+                    start = perf_counter()
+                if result.record is None:
+                    old = previous.files[result.entry.rel_path]
+                    span = writer.copy_record(source, old.offset, old.length)
+                    duplicate_of = old.duplicate_of
+                    if stats is not None:
+                        stats.lap("splice", start)
+                        stats.count("reused")
+                else:
+                    span = writer.write_record(result.record)
+                    duplicate_of = result.record.get("duplicate_of")
+                    if stats is not None:
+                        stats.lap("render", start)
+                if manifest is not None:
+                    manifest.add(result.entry, result.digest, span, duplicate_of)
+                if progress is not None:
+                    progress.file_done(result.entry.rel_path, result.entry.size)
+        writer.finish()
+        if stats is not None:
+            stats.count("exported", writer.count)
+            stats.bytes_written = writer.f.tell()
+
+    def get_directory_tree(self, root_dir, output_file=None):
+        """Generate a tree view of the directory structure."""
+        return self.scan(root_dir, output_file).tree
+
+
+def export_directory(
+    directory: str,
+    output_file: Optional[str] = None,
+    options: Optional[ExportOptions] = None,
+    stats: Optional[ExportStats] = None,
+    progress: Optional[ProgressReporter] = None,
+) -> str:
+    """Export a directory without any GUI involvement and return the output path."""
+    options = options or ExportOptions()
+    if not output_file:
+        output_file = default_output_path(directory, options)
+
+    ExportEngine(options).generate_file_structure(directory, output_file, stats, progress)
+    return output_file
@@ -0,0 +1,161 @@
+import os
+import stat
+import subprocess
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .walker import FileEntry, IgnoreCheck, ProjectScan, _never_ignore
+
+if TYPE_CHECKING:
+    from .stats import ExportStats
+
+# Seconds to wait for git before falling back to the walk
+GIT_TIMEOUT = 60
+
+
+def git_file_list(root_dir: str, untracked: bool = False) -> Optional[List[str]]:
+    """Files git knows about under ``root_dir``, "/"-separated and relative to it.
+
+    Lists the index with ``git ls-files -z``, plus untracked files that
+    no .gitignore or exclude file ignores when ``untracked`` is set.
+    Ignored directories are never read, since git answers from its
+    index. Returns None when ``root_dir`` is not inside a git work tree
+    or git cannot be run, so callers can fall back to the walk.
+    """
+    args = ["git", "-C", root_dir, "ls-files", "-z", "--cached"]
+    if untracked:
+        args += ["--others", "--exclude-standard"]
+    try:
+        proc = subprocess.run(
+            args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    paths = os.fsdecode(proc.stdout).split("\0")
+    # Unmerged paths are listed once per conflict stage
+    return list(dict.fromkeys(path for path in paths if path))
+
+
+class _Dir:
+    __slots__ = ("files", "subdirs")
+
+    def __init__(self):
+        # (name, entry) pairs, sorted by name before rendering
+        self.files: List[Tuple[str, FileEntry]] = []
+        self.subdirs: Dict[str, "_Dir"] = {}
+
+
+def scan_paths(
+    root_dir: str,
+    paths: Iterable[str],
+    is_ignored: Optional[IgnoreCheck] = None,
+    exclude: Iterable[str] = (),
+    max_total_bytes: Optional[int] = None,
+    max_file_bytes: Optional[int] = None,
+    stats: Optional["ExportStats"] = None,
+    on_dir: Optional[Callable[[str], None]] = None,
+) -> ProjectScan:
+    """Build a ProjectScan from a list of relative file paths, such as git's.
+
+    The result matches what scan_project renders for the same files:
+    the same tree lines, depth-first with each directory's files before
+    its subdirectories, and the same size budget cut-off. ``is_ignored``
+    still applies, to every directory on a path and to the file itself.
+    Only files are stat'ed; directories are implied by the paths, so a
+    directory with no listed files does not appear. Paths that are gone
+    from disk or are not regular files (submodules, links to
+    directories) are skipped.
+    """
+    root_dir = os.path.normpath(root_dir)
+    is_ignored = is_ignored or _never_ignore
+    excluded = {os.path.abspath(p) for p in exclude}
+
+    root = _Dir()
+    # Relative directory prefix -> node, or None when the directory is ignored
+    nodes: Dict[str, Optional[_Dir]] = {"": root}
+    prefix = os.path.join(root_dir, "")
+    for rel_path in paths:
+        slash = rel_path.rfind("/") + 1
+        rel_dir = rel_path[:slash]
+        node = nodes[rel_dir] if rel_dir in nodes else _dir_node(
+            nodes, rel_dir, is_ignored, stats
+        )
+        if node is None:
+            continue
+        if stats is not None:
+            start = perf_counter()
+        ignored = is_ignored(rel_path, False)
+        if stats is not None:
+            stats.ignore_check(start, ignored)
+        if ignored:
+            continue
+        path = prefix + (rel_path if os.sep == "/" else rel_path.replace("/", os.sep))
+        if excluded and os.path.abspath(path) in excluded:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        node.files.append((rel_path[slash:], FileEntry(path, rel_path, st.st_size, st.st_mtime)))
+
+    tree: List[str] = []
+    files: List[FileEntry] = []
+    dirs: List[str] = []
+    remaining = max_total_bytes
+    stack = [(root, root_dir, "", 0)]
+    while stack:
+        node, dirpath, rel_dir, level = stack.pop()
+        tree.append(f"{'│   ' * level}├── {os.path.basename(dirpath)}/")
+        dirs.append(rel_dir)
+        if on_dir is not None:
+            on_dir(rel_dir)
+
+        subindent = "│   " * (level + 1)
+        node.files.sort()
+        for name, file_entry in node.files:
+            if remaining is not None:
+                cost = file_entry.size
+                if max_file_bytes is not None:
+                    cost = min(cost, max_file_bytes)
+                if cost > remaining:
+                    tree.append(f"{subindent}├── ... (total size budget reached)")
+                    return ProjectScan("\n".join(tree) + "\n", files, dirs, True)
+                remaining -= cost
+            tree.append(f"{subindent}├── {name}")
+            files.append(file_entry)
+
+        for name in sorted(node.subdirs, reverse=True):
+            stack.append((
+                node.subdirs[name], os.path.join(dirpath, name), f"{rel_dir}{name}/",
+                level + 1,
+            ))
+
+    return ProjectScan("\n".join(tree) + "\n", files, dirs)
+
+
+def _dir_node(
+    nodes: Dict[str, Optional[_Dir]],
+    rel_dir: str,
+    is_ignored: IgnoreCheck,
+    stats: Optional["ExportStats"],
+) -> Optional[_Dir]:
+    """The node for ``rel_dir`` ("a/b/"), creating it and its parents on first use."""
+    node = nodes.get(rel_dir)
+    if node is not None or rel_dir in nodes:
+        return node
+    parent_dir, _, name = rel_dir[:-1].rpartition("/")
+    parent = _dir_node(nodes, parent_dir + "/" if parent_dir else "", is_ignored, stats)
+    if parent is not None:
+        if stats is not None:
+            start = perf_counter()
+        ignored = is_ignored(rel_dir[:-1], True)
+        if stats is not None:
+            stats.ignore_check(start, ignored)
+        if not ignored:
+            node = parent.subdirs[name] = _Dir()
+    nodes[rel_dir] = node
+    return node
@@ -0,0 +1,143 @@
+import os
+import re
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .ignore import translate_path_glob
+
+# Per-directory ignore files, lowest precedence first: .ignore overrides .gitignore
+IGNORE_FILES = (".gitignore", ".ignore")
+
+
+class IgnoreRule(NamedTuple):
+    match: Callable
+    negated: bool
+    dir_only: bool
+    anchored: bool
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> List[IgnoreRule]:
+    """Parse gitignore-format lines into compiled rules, in file order."""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        # Trailing spaces are ignored unless escaped with a backslash
+        while line.endswith(" ") and not line.endswith("\\ "):
+            line = line[:-1]
+        if not line or line.startswith("#"):
+            continue
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+
+        # A slash at the start or in the middle anchors the pattern to the
+        # directory holding the ignore file; otherwise it matches any basename.
+        anchored = "/" in line
+        line = line.lstrip("/")
+        regex = re.compile(translate_path_glob(line) + r"\Z", re.S)
+        rules.append(IgnoreRule(regex.match, negated, dir_only, anchored))
+    return rules
+
+
+def read_ignore_file(path: str) -> List[IgnoreRule]:
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return parse_ignore_lines(f)
+    except OSError:
+        return []
+
+
+class RuleNode:
+    """Rules declared in one directory, linked to the nearest ancestor with rules."""
+
+    __slots__ = ("parent", "base", "rules")
+
+    def __init__(self, parent: Optional["RuleNode"], base: str, rules: List[IgnoreRule]):
+        self.parent = parent
+        self.base = base
+        self.rules = rules
+
+    def check(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Return True/False for an explicit ignore/re-include, None if no rule applies.
+
+        Deeper directories take precedence over their ancestors, and within a
+        directory the last matching rule wins, as in git.
+        """
+        node = self
+        while node is not None:
+            sub = rel_path[len(node.base):]
+            name = sub[sub.rfind("/") + 1:]
+            for rule in reversed(node.rules):
+                if rule.dir_only and not is_dir:
+                    continue
+                if rule.match(sub if rule.anchored else name):
+                    return not rule.negated
+            node = node.parent
+        return None
+
+
+class GitIgnoreRules:
+    """Per-export cache of .gitignore, .ignore and .git/info/exclude rules.
+
+    Each directory's ignore files are read and compiled once; directories
+    without ignore files share their parent's node, so the rule chain only
+    grows where a project actually declares rules.
+    """
+
+    def __init__(self, root_dir: str, filenames: Iterable[str] = IGNORE_FILES):
+        self.root_dir = os.path.normpath(root_dir)
+        self.filenames = tuple(filenames)
+        self._nodes: Dict[str, Optional[RuleNode]] = {}
+
+    def enter(
+        self,
+        rel_dir: str,
+        parent: Optional[RuleNode],
+        names: Optional[Iterable[str]] = None,
+    ) -> Optional[RuleNode]:
+        """Return the rule node for ``rel_dir`` ("" or "a/b/"), building it once.
+
+        ``names`` are the directory's entries when the caller has already
+        listed it, which avoids probing for ignore files that do not exist.
+        """
+        if rel_dir in self._nodes:
+            return self._nodes[rel_dir]
+
+        dirpath = os.path.join(self.root_dir, rel_dir) if rel_dir else self.root_dir
+        candidates = self.filenames
+        if names is not None:
+            present = set(names)
+            candidates = [n for n in candidates if n in present]
+
+        rules: List[IgnoreRule] = []
+        if not rel_dir:
+            rules.extend(
+                read_ignore_file(os.path.join(self.root_dir, ".git", "info", "exclude"))
+            )
+        for filename in candidates:
+            rules.extend(read_ignore_file(os.path.join(dirpath, filename)))
+
+        node = RuleNode(parent, rel_dir, rules) if rules else parent
+        self._nodes[rel_dir] = node
+        return node
+
+    def node_for(self, rel_dir: str) -> Optional[RuleNode]:
+        """Resolve the node for ``rel_dir``, entering any uncached ancestors first."""
+        if rel_dir in self._nodes:
+            return self._nodes[rel_dir]
+        parent = None
+        if rel_dir:
+            head = rel_dir[:-1]
+            cut = head.rfind("/")
+            parent = self.node_for(head[:cut + 1] if cut != -1 else "")
+        return self.enter(rel_dir, parent)
+
+    def matches(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Return True if git would ignore ``rel_path`` (``/``-separated, relative)."""
+        cut = rel_path.rfind("/")
+        node = self.node_for(rel_path[:cut + 1] if cut != -1 else "")
+        return bool(node is not None and node.check(rel_path, is_dir))
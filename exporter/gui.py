@@ -0,0 +1,1073 @@
+import os
+import sys
+from collections import deque
+from time import perf_counter
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import (
+    QAbstractItemModel,
+    QEvent,
+    QFile,
+    QModelIndex,
+    QObject,
+    QThread,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
+from PyQt5.QtGui import (
+    QFont,
+    QFontDatabase,
+    QIcon,
+    QTextCursor,
+)
+from PyQt5.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QComboBox,
+    QFileDialog,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QMainWindow,
+    QPlainTextEdit,
+    QProgressBar,
+    QPushButton,
+    QSplitter,
+    QTextEdit,
+    QTreeView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .engine import ExportEngine, export_directory
+from .gitignore import GitIgnoreRules
+from .ignore import compile_ignore_patterns
+from .options import DEFAULT_IGNORE_PATTERNS, ExportOptions, default_output_path
+from .pathindex import PathIndex
+from .preview import PageCache, PreviewFile, open_preview
+from .progress import ExportCancelled, ProgressReporter
+from .stats import ExportStats
+
+# The font and the window icon live next to main.py, one level above the package.
+RESOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FileIcons:
+    """VSCode-style icons for the tree view, shared by every row."""
+
+    # Icons are created on first use and shared by every item
+    ICONS: Dict[str, QIcon] = {}
+    # icons/*.svg compiled into resources_rc.py; regenerate after changing them with
+    #   pyrcc5 exporter/resources.qrc -o exporter/resources_rc.py
+    ICON_PREFIX = ":/icons/"
+    _resources_loaded = False
+
+    # Language-specific icons
+    LANGUAGE_ICONS = {
+        # Programming Languages
+        ".py": "python",
+        ".js": "javascript",
+        ".ts": "typescript",
+        ".html": "html",
+        ".css": "css",
+        ".java": "java",
+        ".cpp": "cpp",
+        ".h": "h",
+        ".cs": "csharp",
+        ".go": "go",
+        ".rs": "rust",
+        # Documentation
+        ".md": "markdown",
+        ".txt": "text",
+        ".pdf": "pdf",
+        ".doc": "word",
+        ".docx": "word",
+        # Data formats
+        ".json": "json",
+        ".xml": "xml",
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".csv": "csv",
+        # Images
+        ".jpg": "image",
+        ".jpeg": "image",
+        ".png": "image",
+        ".gif": "image",
+        ".svg": "svg",
+        # Config files
+        ".conf": "config",
+        ".ini": "config",
+        ".env": "config",
+        ".cfg": "config",
+    }
+
+    @classmethod
+    def setup_icons(cls):
+        """Register the compiled icon resources; no icon is decoded until shown."""
+        if not cls._resources_loaded:
+            from . import resources_rc  # noqa: F401  registers ":/icons/" on import
+
+            cls._resources_loaded = True
+
+    @classmethod
+    def icon_for(cls, name: str, is_dir: bool = False) -> QIcon:
+        """Shared icon for a file name, loaded from the compiled resources on first use."""
+        if is_dir:
+            icon_name = "folder"
+        else:
+            ext = os.path.splitext(name)[1].lower()
+            icon_name = cls.LANGUAGE_ICONS.get(ext, "file")
+        icon = cls.ICONS.get(icon_name)
+        if icon is None:
+            cls.setup_icons()
+            path = f"{cls.ICON_PREFIX}{icon_name}.svg"
+            if QFile.exists(path):
+                icon = QIcon(path)
+            else:
+                icon = cls.icon_for("") if icon_name != "file" else QIcon()
+            cls.ICONS[icon_name] = icon
+        return icon
+
+
+class TreeNode:
+    """One entry of a LazyFileModel; children are listed on first expansion."""
+
+    __slots__ = ("name", "parent", "row", "is_dir", "children", "pending")
+
+    def __init__(self, name: str, parent: Optional["TreeNode"], row: int, is_dir: bool):
+        self.name = name
+        self.parent = parent
+        self.row = row
+        self.is_dir = is_dir
+        # None until the directory is scanned
+        self.children: Optional[List["TreeNode"]] = None
+        # Scanned (name, is_dir) pairs not yet handed to the view
+        self.pending: List[Tuple[str, bool]] = []
+
+    @property
+    def rel_path(self) -> str:
+        parts = []
+        node = self
+        while node.parent is not None:
+            parts.append(node.name)
+            node = node.parent
+        return "/".join(reversed(parts))
+
+
+class LazyFileModel(QAbstractItemModel):
+    """File tree that scans a directory only when the view expands it.
+
+    Nodes are small slotted objects and icons are shared per extension, so
+    memory grows with what has been browsed, not with the project. Huge
+    directories are handed to the view ``FETCH_BATCH`` rows at a time.
+    """
+
+    FETCH_BATCH = 1000
+
+    def __init__(self, should_ignore: Callable[[str, bool], bool], parent=None):
+        super().__init__(parent)
+        self.should_ignore = should_ignore
+        self.root_dir: Optional[str] = None
+        self.root = TreeNode("", None, 0, True)
+        # True while showing a flat list of search results
+        self.flat = False
+
+    def set_root(self, directory: Optional[str]):
+        self.beginResetModel()
+        self.root_dir = directory
+        self.root = TreeNode("", None, 0, directory is not None)
+        self.flat = False
+        self.endResetModel()
+
+    def show_paths(self, rel_paths: List[str]):
+        """Replace the tree with a flat list of files under the same root."""
+        self.beginResetModel()
+        self.root = TreeNode("", None, 0, True)
+        self.root.children = [
+            TreeNode(path, self.root, row, False) for row, path in enumerate(rel_paths)
+        ]
+        self.flat = True
+        self.endResetModel()
+
+    def node(self, index: QModelIndex) -> TreeNode:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def file_path(self, index: QModelIndex) -> str:
+        return os.path.join(self.root_dir, *self.node(index).rel_path.split("/"))
+
+    def is_dir(self, index: QModelIndex) -> bool:
+        return self.node(index).is_dir
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self.node(parent)
+        if column != 0 or node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, 0, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        children = self.node(parent).children
+        return len(children) if children is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if not node.is_dir:
+            return False
+        # Unscanned directories get an expander; scanning happens on expand
+        return node.children is None or bool(node.children) or bool(node.pending)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            return node.name
+        if role == Qt.DecorationRole:
+            return FileIcons.icon_for(node.name, node.is_dir)
+        if role == Qt.ToolTipRole:
+            return node.rel_path
+        return None
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return node.is_dir and (node.children is None or bool(node.pending))
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if node.children is None:
+            node.children = []
+            node.pending = self.scan(node)
+        batch = node.pending[:self.FETCH_BATCH]
+        del node.pending[:self.FETCH_BATCH]
+        if not batch:
+            return
+        first = len(node.children)
+        self.beginInsertRows(parent, first, first + len(batch) - 1)
+        node.children.extend(
+            TreeNode(name, node, first + i, is_dir) for i, (name, is_dir) in enumerate(batch)
+        )
+        self.endInsertRows()
+
+    def scan(self, node: TreeNode) -> List[Tuple[str, bool]]:
+        """List a directory's visible entries, directories first, each group sorted."""
+        rel_dir = node.rel_path
+        prefix = rel_dir + "/" if rel_dir else ""
+        path = os.path.join(self.root_dir, *rel_dir.split("/")) if rel_dir else self.root_dir
+        items = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if self.should_ignore(prefix + entry.name, is_dir):
+                        continue
+                    items.append((not is_dir, entry.name))
+        except OSError as e:
+            print(f"Error reading directory: {e}")
+        items.sort()
+        return [(name, not is_file) for is_file, name in items]
+
+
+_app_font: Optional[QFont] = None
+
+
+def load_app_font() -> Optional[QFont]:
+    """Register the bundled font once and return it, or None if it is missing."""
+    global _app_font
+    if _app_font is None:
+        font_id = QFontDatabase.addApplicationFont(ProjectExportTool.FONT_PATH)
+        if font_id == -1:
+            print("Font loading failed, using system default")
+            return None
+        font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+        _app_font = QFont(font_family, 12)
+    return _app_font
+
+
+class FirstPaintHook(QObject):
+    """Runs a callback once, right after ``widget`` is first painted."""
+
+    def __init__(self, widget: QWidget, callback: Callable[[], None]):
+        super().__init__(widget)
+        self.callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            # Queued, so the paint in progress reaches the screen first
+            QTimer.singleShot(0, self.callback)
+        return False
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "--:--"
+    minutes, seconds = divmod(int(seconds + 0.5), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+class SignalProgress(ProgressReporter):
+    """Forwards export progress to a Qt signal, at most every ``interval`` seconds."""
+
+    def __init__(self, signal, interval: float = 0.1):
+        super().__init__()
+        self.signal = signal
+        self.interval = interval
+        self._last = 0.0
+
+    def update(self):
+        now = perf_counter()
+        if now - self._last < self.interval and self.files_done < self.total_files:
+            return
+        self._last = now
+        eta = self.eta
+        self.signal.emit(
+            self.files_done, self.total_files, self.bytes_done, self.current_path,
+            -1.0 if eta is None else eta,
+        )
+
+
+class ExportWorker(QThread):
+    """Runs one export off the GUI thread.
+
+    Signals are delivered to the GUI thread through queued connections,
+    so the window stays responsive while the export runs.
+    """
+
+    # files done, total files, bytes done, current path, ETA in seconds (-1 if unknown)
+    progress = pyqtSignal(int, int, int, str, float)
+    completed = pyqtSignal(str, object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, directory: str, output_file: str, options: ExportOptions, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.output_file = output_file
+        self.options = options
+        self.reporter = SignalProgress(self.progress)
+
+    def cancel(self):
+        """Ask the export to stop; safe to call from any thread."""
+        self.reporter.cancel()
+
+    def run(self):
+        stats = ExportStats()
+        try:
+            ExportEngine(self.options).generate_file_structure(
+                self.directory, self.output_file, stats, self.reporter
+            )
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.completed.emit(self.output_file, stats)
+
+
+class PagedPreview:
+    """Shows a file in a QPlainTextEdit a few pages at a time.
+
+    Pages are loaded from a PageCache as the user scrolls towards either
+    end, at most PAGES_PER_STEP per scroll event or timer tick, so a file
+    whose pages hold only a few lines (minified code) fills the viewport
+    gradually instead of being read in one go. Pages scrolled out of view
+    are removed again once more than MAX_PAGES are held; a page that is
+    still on screen never is.
+    """
+
+    MAX_PAGES = 4
+    PAGES_PER_STEP = 2
+
+    def __init__(self, editor: QPlainTextEdit, cache: PageCache):
+        self.editor = editor
+        self.cache = cache
+        self.preview: Optional[PreviewFile] = None
+        # Shown pages are [first, last); lines holds each one's line count
+        self.first = self.last = 0
+        self.lines: Deque[int] = deque()
+        self._loading = False
+        self._fill_pending = False
+        editor.setReadOnly(True)
+        editor.setUndoRedoEnabled(False)
+        # Without wrapping the scroll bar counts lines, which keeps paging exact
+        editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        editor.verticalScrollBar().valueChanged.connect(self.on_scroll)
+
+    def show(self, preview: PreviewFile):
+        self.preview = None
+        self.editor.clear()
+        self.lines.clear()
+        self.first = self.last = 0
+        self.preview = preview
+        self._append()
+        bar = self.editor.verticalScrollBar()
+        bar.setValue(0)
+        self.on_scroll(bar.value())
+
+    def show_message(self, text: str):
+        self.preview = None
+        self.editor.setPlainText(text)
+
+    def _page_text(self, page: int) -> str:
+        text = self.cache.get(self.preview, page)
+        # Pages end on a line break unless a line is too long to snap
+        if not text.endswith("\n"):
+            text += "\n"
+        return text
+
+    def _append(self):
+        text = self._page_text(self.last)
+        cursor = QTextCursor(self.editor.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.lines.append(text.count("\n"))
+        self.last += 1
+        bar = self.editor.verticalScrollBar()
+        value = bar.value()
+        # Only a page that ends a full screen above the viewport may go
+        if len(self.lines) > self.MAX_PAGES and self.lines[0] + bar.pageStep() <= value:
+            removed = self.lines.popleft()
+            cursor.movePosition(QTextCursor.Start)
+            cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor, removed)
+            cursor.removeSelectedText()
+            self.first += 1
+            bar.setValue(value - removed)
+
+    def _prepend(self):
+        text = self._page_text(self.first - 1)
+        bar = self.editor.verticalScrollBar()
+        value = bar.value()
+        cursor = QTextCursor(self.editor.document())
+        cursor.movePosition(QTextCursor.Start)
+        cursor.insertText(text)
+        added = text.count("\n")
+        self.lines.appendleft(added)
+        self.first -= 1
+        # Likewise, the last page goes only if it starts a screen below the viewport
+        last_start = sum(self.lines) - self.lines[-1]
+        if (
+            len(self.lines) > self.MAX_PAGES
+            and last_start >= value + added + 2 * bar.pageStep()
+        ):
+            cursor.movePosition(QTextCursor.End)
+            cursor.movePosition(
+                QTextCursor.PreviousBlock, QTextCursor.KeepAnchor, self.lines.pop()
+            )
+            cursor.movePosition(QTextCursor.StartOfBlock, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+            self.last -= 1
+        bar.setValue(value + added)
+
+    def _fill(self):
+        self._fill_pending = False
+        self.on_scroll(self.editor.verticalScrollBar().value())
+
+    def on_scroll(self, value: int):
+        if self.preview is None or self._loading:
+            return
+        bar = self.editor.verticalScrollBar()
+        self._loading = True
+        try:
+            # Keep a page step of text beyond either edge of the viewport
+            for _ in range(self.PAGES_PER_STEP):
+                if self.last < self.preview.page_count and (
+                    bar.value() >= bar.maximum() - bar.pageStep()
+                ):
+                    self._append()
+                elif self.first > 0 and bar.value() <= bar.pageStep():
+                    self._prepend()
+                else:
+                    return
+            # Still short of text: continue on the next tick, not in this event
+            if not self._fill_pending:
+                self._fill_pending = True
+                QTimer.singleShot(0, self._fill)
+        except OSError as e:
+            self.show_message(f"Unable to read file: {e}")
+        finally:
+            self._loading = False
+
+
+class IndexWorker(QThread):
+    """Builds or refreshes a PathIndex off the GUI thread."""
+
+    # The index and the generation it was requested for
+    built = pyqtSignal(object, int)
+
+    def __init__(self, job, generation: int, parent=None):
+        super().__init__(parent)
+        self.job = job
+        self.generation = generation
+
+    def run(self):
+        self.built.emit(self.job(), self.generation)
+
+
+class ProjectExportTool(QMainWindow):
+    FONT_PATH = os.path.join(RESOURCE_DIR, "HarmonyOS_Sans_SC_Regular.ttf")
+
+    DEFAULT_IGNORE_PATTERNS = set(DEFAULT_IGNORE_PATTERNS)
+
+    # Search waits for a pause in typing, then lists at most SEARCH_LIMIT files
+    SEARCH_DEBOUNCE_MS = 150
+    SEARCH_LIMIT = 500
+
+    def __init__(self):
+        super().__init__()
+        self.current_dir: Optional[str] = None
+        self.ignore_rules: Optional[GitIgnoreRules] = None
+        self.file_model = LazyFileModel(self.should_ignore)
+        self.ignore_patterns: Set[str] = self.DEFAULT_IGNORE_PATTERNS.copy()
+        # Exports run one at a time on a worker thread; the rest wait here
+        self.export_queue: Deque[Tuple[str, str, ExportOptions]] = deque()
+        self.export_worker: Optional[ExportWorker] = None
+        # Recently previewed pages, shared by every file in the session
+        self.page_cache = PageCache()
+        # Search index of the current project, built in the background
+        self.path_index: Optional[PathIndex] = None
+        self.index_worker: Optional[IndexWorker] = None
+        self.index_pending = False
+        # Bumped whenever the project or ignore settings change, to drop stale indexes
+        self.index_generation = 0
+        self.setWindowTitle("Project File Export Tool")
+        self.setGeometry(100, 100, 1000, 600)
+        self.initUI()
+
+    def initUI(self):
+        # Every widget is created exactly once; the font and window icon
+        # are applied after the first paint by load_deferred_resources
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.layout = QVBoxLayout(self.central_widget)
+
+        # Create title
+        title_label = QLabel("Project File Export Tool")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("font-size: 24px; font-weight: bold; margin: 15px 0;")
+        self.layout.addWidget(title_label)
+
+        top_layout = QHBoxLayout()
+
+        # Create drag area
+        self.drag_label = QLabel("Drag Project Folder Here", self)
+        self.drag_label.setAlignment(Qt.AlignCenter)
+        self.drag_label.setStyleSheet(
+            """
+            QLabel {
+                border: 2px dashed #aaa;
+                border-radius: 5px;
+                padding: 20px;
+                background-color: #f8f8f8;
+                color: #555;
+                font-size: 16px;
+            }
+        """
+        )
+        self.drag_label.setMinimumHeight(80)
+        top_layout.addWidget(self.drag_label, 1)
+
+        # Create select folder button
+        self.select_button = QPushButton("Select Folder", self)
+        self.select_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                padding: 10px;
+                border: none;
+                border-radius: 4px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #45a049;
+            }
+        """
+        )
+        self.select_button.clicked.connect(self.select_folder)
+        top_layout.addWidget(self.select_button)
+
+        self.layout.addLayout(top_layout)
+
+        splitter = QSplitter(Qt.Horizontal)
+
+        # Left panel - File tree and export options
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+
+        # Search box
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search files...")
+        self.search_box.textChanged.connect(self.filter_files)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        left_layout.addWidget(self.search_box)
+
+        # File tree
+        self.file_tree = QTreeView()
+        self.file_tree.setModel(self.file_model)
+        self.file_tree.clicked.connect(self.on_file_clicked)
+        left_layout.addWidget(self.file_tree)
+
+        options_widget = QWidget()
+        options_layout = QVBoxLayout(options_widget)
+        options_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Create structure-only checkbox
+        self.structure_only_cb = QCheckBox("Export Structure Only")
+        self.structure_only_cb.setToolTip(
+            "Only export the directory structure, not file contents"
+        )
+        options_layout.addWidget(self.structure_only_cb)
+
+        # Create LLM optimization checkbox
+        self.llm_optimize_cb = QCheckBox("Optimize for LLMs")
+        self.llm_optimize_cb.setToolTip(
+            "Enhances output for Large Language Models by:\n"
+            "• Adding semantic file type detection\n"
+            "• Including metadata (size, type, modification date)\n"
+            "• Generating content previews\n"
+            "• Adding structural markers for better parsing\n"
+            "• Chunking large files for RAG systems"
+        )
+        options_layout.addWidget(self.llm_optimize_cb)
+
+        # Create ignore patterns checkbox
+        self.ignore_defaults_cb = QCheckBox("Use Default Ignore Patterns")
+        self.ignore_defaults_cb.setToolTip(
+            "Ignore common files/folders like:\n"
+            "• .git, __pycache__, node_modules\n"
+            "• IDE folders (.vscode, .idea)\n"
+            "• Temporary files (*.tmp, *.log)\n"
+            "• System files (.DS_Store, Thumbs.db)"
+        )
+        self.ignore_defaults_cb.setChecked(True)
+        self.ignore_defaults_cb.stateChanged.connect(self.toggle_ignore_patterns)
+        options_layout.addWidget(self.ignore_defaults_cb)
+
+        # Create .gitignore checkbox
+        self.gitignore_cb = QCheckBox("Respect .gitignore Files")
+        self.gitignore_cb.setToolTip(
+            "Skip everything excluded by the project's\n"
+            ".gitignore, .ignore and .git/info/exclude files"
+        )
+        self.gitignore_cb.setChecked(True)
+        self.gitignore_cb.stateChanged.connect(self.toggle_gitignore)
+        options_layout.addWidget(self.gitignore_cb)
+
+        # Custom ignore patterns input
+        ignore_layout = QHBoxLayout()
+        self.ignore_input = QLineEdit()
+        self.ignore_input.setPlaceholderText("Add custom ignore pattern (e.g., *.txt)")
+        self.ignore_add_btn = QPushButton("Add")
+        self.ignore_add_btn.clicked.connect(self.add_ignore_pattern)
+        ignore_layout.addWidget(self.ignore_input)
+        ignore_layout.addWidget(self.ignore_add_btn)
+        options_layout.addLayout(ignore_layout)
+
+        # Ignore patterns display
+        self.ignore_display = QTextEdit()
+        self.ignore_display.setReadOnly(True)
+        self.ignore_display.setMaximumHeight(80)
+        self.ignore_display.setPlaceholderText("Current ignore patterns will show here")
+        self.update_ignore_display()
+        options_layout.addWidget(self.ignore_display)
+
+        # Export format selection
+        format_layout = QHBoxLayout()
+        format_label = QLabel("Export Format:")
+        self.format_combo = QComboBox()
+        self.format_combo.addItems(["Text", "Markdown", "JSON", "YAML", "JSONL-Chunks"])
+        format_layout.addWidget(format_label)
+        format_layout.addWidget(self.format_combo)
+        options_layout.addLayout(format_layout)
+
+        # Export button
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self.export_project)
+        options_layout.addWidget(self.export_button)
+
+        # Progress of the running export
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("%v / %m files")
+        self.progress_bar.setValue(0)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setToolTip("Stop the running export; queued exports still run")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_export)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        options_layout.addLayout(progress_layout)
+
+        left_layout.addWidget(options_widget)
+
+        # Right panel - Preview
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+
+        self.preview_label = QLabel("Preview")
+        self.preview_text = QPlainTextEdit()
+        self.paged_preview = PagedPreview(self.preview_text, self.page_cache)
+
+        right_layout.addWidget(self.preview_label)
+        right_layout.addWidget(self.preview_text)
+
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([400, 600])
+        self.layout.addWidget(splitter, 1)
+
+        # Create status edit
+        self.status_edit = QLineEdit()
+        self.status_edit.setReadOnly(True)
+        self.status_edit.setPlaceholderText("Output status will be shown here")
+        self.status_edit.setStyleSheet(
+            """
+            QLineEdit {
+                padding: 10px;
+                border: 1px solid #ccc;
+                border-radius: 4px;
+                background-color: #f9f9f9;
+                font-size: 14px;
+            }
+        """
+        )
+        self.layout.addWidget(self.status_edit)
+
+        # Enable drag and drop
+        self.setAcceptDrops(True)
+
+    def load_deferred_resources(self):
+        """Load the font and window icon; run_gui calls this after the first paint."""
+        icon_path = os.path.join(RESOURCE_DIR, "icon-3sizes.ico")
+        if os.path.exists(icon_path):
+            self.setWindowIcon(QIcon(icon_path))
+        font = load_app_font()
+        if font is not None:
+            QApplication.instance().setFont(font)
+
+    def select_folder(self):
+        title = "Select Project Folder"
+        dir_path = QFileDialog.getExistingDirectory(self, title)
+        if dir_path:
+            self.process_folder(dir_path)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        urls = event.mimeData().urls()
+        if urls:
+            dir_path = urls[0].toLocalFile()
+            self.process_folder(dir_path)
+
+    def process_folder(self, dir_path: str):
+        if not os.path.isdir(dir_path):
+            return
+
+        self.current_dir = dir_path
+        self.load_ignore_rules()
+        self.populate_file_tree(dir_path)
+        self.start_indexing()
+        self.status_edit.setText(f"Loaded project: {dir_path}")
+        if self.search_box.text().strip():
+            self.run_search()
+
+    def reload_project(self):
+        """Re-list the tree and rebuild the search index after the ignore settings change."""
+        if not self.current_dir:
+            return
+        self.populate_file_tree(self.current_dir)
+        self.start_indexing()
+        if self.search_box.text().strip():
+            self.run_search()
+
+    def filter_files(self, text: str):
+        # Restarted on every keystroke, so only the final query is searched
+        self.search_timer.start()
+
+    def run_search(self):
+        if not self.current_dir:
+            return
+        query = self.search_box.text().strip()
+        if not query:
+            if self.file_model.flat:
+                self.populate_file_tree(self.current_dir)
+            return
+        if self.path_index is None:
+            # on_index_built searches again once the index is ready
+            self.status_edit.setText(f"Indexing {self.current_dir}...")
+            return
+        start = perf_counter()
+        paths = self.path_index.search(query, self.SEARCH_LIMIT)
+        elapsed = perf_counter() - start
+        self.file_model.show_paths(paths)
+        self.status_edit.setText(
+            f"{len(paths)} match(es) for {query!r} in {len(self.path_index)} files "
+            f"({elapsed * 1000:.0f} ms)"
+        )
+
+    def ignore_check(self):
+        """Snapshot of the ignore settings that a background scan can use safely."""
+        matcher = self.ignore_matcher
+        rules = GitIgnoreRules(self.current_dir) if self.gitignore_cb.isChecked() else None
+
+        def is_ignored(rel_path: str, is_dir: bool) -> bool:
+            if matcher.matches(rel_path, is_dir):
+                return True
+            return rules is not None and rules.matches(rel_path, is_dir)
+
+        return is_ignored
+
+    def start_indexing(self, rebuild: bool = True):
+        """Build the search index in the background, or just refresh it.
+
+        A refresh only rescans directories that changed since the index
+        was built. Requests made while a pass is running are queued, and
+        results for an outdated project or ignore setup are dropped.
+        """
+        if not self.current_dir:
+            return
+        if rebuild:
+            self.index_generation += 1
+            self.path_index = None
+        if self.index_worker is not None:
+            self.index_pending = True
+            return
+        if self.path_index is not None:
+            job = self.path_index.refreshed
+        else:
+            directory, is_ignored = self.current_dir, self.ignore_check()
+
+            def job():
+                return PathIndex.build(directory, is_ignored)
+
+        worker = IndexWorker(job, self.index_generation, self)
+        worker.built.connect(self.on_index_built)
+        worker.finished.connect(self.on_index_finished)
+        self.index_worker = worker
+        worker.start()
+
+    def on_index_built(self, index: PathIndex, generation: int):
+        if generation != self.index_generation:
+            return
+        self.path_index = index
+        if self.search_box.text().strip():
+            self.run_search()
+
+    def on_index_finished(self):
+        self.index_worker.deleteLater()
+        self.index_worker = None
+        if self.index_pending:
+            self.index_pending = False
+            self.start_indexing(rebuild=False)
+
+    def changeEvent(self, event):
+        # Pick up files added or removed while the window was in the background
+        if (
+            event.type() == QEvent.ActivationChange
+            and self.isActiveWindow()
+            and self.path_index is not None
+        ):
+            self.start_indexing(rebuild=False)
+        super().changeEvent(event)
+
+    def on_file_clicked(self, index):
+        if self.file_model.is_dir(index):
+            return
+        name = self.file_model.node(index).rel_path
+        try:
+            preview = open_preview(self.file_model.file_path(index))
+        except OSError as e:
+            self.preview_label.setText(f"Preview: {name}")
+            self.paged_preview.show_message(f"Unable to read file: {e}")
+            return
+        self.preview_label.setText(f"Preview: {name} ({preview.summary()})")
+        self.paged_preview.show(preview)
+
+    def toggle_ignore_patterns(self, state):
+        if state == Qt.Checked:
+            self.ignore_patterns = self.DEFAULT_IGNORE_PATTERNS.copy()
+        else:
+            self.ignore_patterns.clear()
+        self.update_ignore_display()
+        self.reload_project()
+
+    def load_ignore_rules(self):
+        """Reload .gitignore rules for the current project, if enabled."""
+        if self.current_dir and self.gitignore_cb.isChecked():
+            self.ignore_rules = GitIgnoreRules(self.current_dir)
+        else:
+            self.ignore_rules = None
+
+    def toggle_gitignore(self, state):
+        self.load_ignore_rules()
+        self.reload_project()
+
+    def add_ignore_pattern(self):
+        pattern = self.ignore_input.text().strip()
+        if pattern:
+            self.ignore_patterns.add(pattern)
+            self.ignore_input.clear()
+            self.update_ignore_display()
+            self.reload_project()
+
+    def update_ignore_display(self):
+        # Patterns only change together with the display, so recompile here
+        self.ignore_matcher = compile_ignore_patterns(self.ignore_patterns)
+        self.ignore_display.setText("\n".join(sorted(self.ignore_patterns)))
+
+    def should_ignore(self, path: str, is_dir: bool = False) -> bool:
+        """Check if a path relative to the project root should be ignored."""
+        rel_path = path.replace(os.sep, "/")
+        if self.ignore_matcher.matches(rel_path, is_dir):
+            return True
+        return self.ignore_rules is not None and self.ignore_rules.matches(rel_path, is_dir)
+
+    def populate_file_tree(self, directory: str):
+        """Show the project in the file tree; subdirectories load when expanded."""
+        self.file_model.set_root(directory)
+        self.file_model.fetchMore(QModelIndex())
+
+    def build_options(self) -> ExportOptions:
+        """Collect the current widget states into engine options."""
+        return ExportOptions(
+            export_format=self.format_combo.currentText().lower(),
+            structure_only=self.structure_only_cb.isChecked(),
+            llm_optimize=self.llm_optimize_cb.isChecked(),
+            ignore_patterns=set(self.ignore_patterns),
+            use_gitignore=self.gitignore_cb.isChecked(),
+        )
+
+    def export_project(self):
+        if not self.current_dir:
+            return
+
+        # Options are taken now, so later widget changes don't affect queued exports
+        options = self.build_options()
+        output_file = default_output_path(self.current_dir, options)
+        self.export_queue.append((self.current_dir, output_file, options))
+        if self.export_worker is None:
+            self.start_next_export()
+        else:
+            self.status_edit.setText(
+                f"Queued export of {self.current_dir} ({len(self.export_queue)} waiting)"
+            )
+
+    def start_next_export(self):
+        if not self.export_queue:
+            self.cancel_button.setEnabled(False)
+            return
+        directory, output_file, options = self.export_queue.popleft()
+        worker = ExportWorker(directory, output_file, options, self)
+        worker.progress.connect(self.on_export_progress)
+        worker.completed.connect(self.on_export_completed)
+        worker.failed.connect(self.on_export_failed)
+        worker.cancelled.connect(self.on_export_cancelled)
+        worker.finished.connect(self.on_export_finished)
+        self.export_worker = worker
+        self.progress_bar.setRange(0, 0)  # busy until the walk is done
+        self.cancel_button.setEnabled(True)
+        self.status_edit.setText(f"Scanning {directory}...")
+        worker.start()
+
+    def cancel_export(self):
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.status_edit.setText("Cancelling export...")
+
+    def queue_note(self) -> str:
+        return f" - {len(self.export_queue)} queued" if self.export_queue else ""
+
+    def on_export_progress(self, done: int, total: int, nbytes: int, path: str, eta: float):
+        self.progress_bar.setRange(0, max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_edit.setText(
+            f"Exporting {path} ({done}/{total} files, {nbytes / 1e6:.1f} MB, "
+            f"ETA {format_eta(eta if eta >= 0 else None)}){self.queue_note()}"
+        )
+
+    def on_export_completed(self, output_file: str, stats: ExportStats):
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+        self.status_edit.setText(
+            f"Export completed: {output_file} "
+            f"({stats.counts['exported']} files, {stats.total_seconds:.2f} s){self.queue_note()}"
+        )
+
+    def on_export_failed(self, message: str):
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.status_edit.setText(f"Export failed: {message}{self.queue_note()}")
+
+    def on_export_cancelled(self):
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.status_edit.setText(f"Export cancelled{self.queue_note()}")
+
+    def on_export_finished(self):
+        self.export_worker.deleteLater()
+        self.export_worker = None
+        self.start_next_export()
+
+    def closeEvent(self, event):
+        # Don't leave a thread writing files behind the closed window
+        self.export_queue.clear()
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.export_worker.wait()
+        if self.index_worker is not None:
+            self.index_worker.wait()
+        super().closeEvent(event)
+
+    @staticmethod
+    def process_directory(
+        directory: str,
+        output_file: Optional[str] = None,
+        export_format: str = "markdown",
+        structure_only: bool = False,
+        llm_optimize: bool = False
+    ) -> str:
+        """Process a directory from command line."""
+        return export_directory(
+            directory,
+            output_file,
+            ExportOptions(
+                export_format=export_format,
+                structure_only=structure_only,
+                llm_optimize=llm_optimize,
+            ),
+        )
+
+
+def run_gui(directory: Optional[str] = None) -> int:
+    """Start the Qt application, optionally preloading a project directory."""
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    window = ProjectExportTool()
+    # The font is large and only restyles the window, so it waits for the first paint
+    FirstPaintHook(window, window.load_deferred_resources)
+    if directory:
+        window.process_folder(directory)
+    window.show()
+    return app.exec_()
@@ -0,0 +1,173 @@
+import os
+import re
+from fnmatch import translate
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional
+
+GLOB_CHARS = frozenset("*?[")
+
+# fnmatch folds case wherever os.path.normcase does (i.e. on Windows); match that.
+_FOLD_CASE = os.path.normcase("A") == "a"
+
+
+def has_glob(pattern: str) -> bool:
+    return any(c in GLOB_CHARS for c in pattern)
+
+
+def translate_path_glob(pattern: str) -> str:
+    """Translate a slash-separated glob into a regex body.
+
+    Unlike fnmatch, ``*`` and ``?`` never cross a ``/``; ``**/`` matches zero
+    or more leading directories and a trailing ``/**`` matches everything
+    inside a directory.
+    """
+    i, n = 0, len(pattern)
+    res: List[str] = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                j = i + 2
+                if j < n and pattern[j] == "/":
+                    res.append("(?:.*/)?")
+                    i = j + 1
+                else:
+                    res.append(".*")
+                    i = j
+                continue
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 1
+            if j >= n:
+                res.append("\\[")
+            else:
+                stuff = pattern[i + 1:j].replace("\\", "\\\\")
+                if stuff[0] in "!^":
+                    stuff = "^" + stuff[1:]
+                res.append(f"[{stuff}]")
+                i = j + 1
+                continue
+        elif c == "\\" and i + 1 < n:
+            res.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            res.append(re.escape(c))
+        i += 1
+    return "".join(res)
+
+
+class _PatternBucket:
+    """Patterns of one kind (any entry, or directories only), split by match strategy."""
+
+    __slots__ = ("names", "extensions", "globs", "paths", "_glob_re", "_path_re")
+
+    def __init__(self):
+        self.names = set()
+        self.extensions = set()
+        self.globs: List[str] = []
+        self.paths: List[str] = []
+        self._glob_re = None
+        self._path_re = None
+
+    def add(self, pattern: str, anchored: bool):
+        if anchored:
+            self.paths.append(translate_path_glob(pattern))
+        elif not has_glob(pattern):
+            self.names.add(pattern)
+        elif (
+            pattern.startswith("*.")
+            and not has_glob(pattern[2:])
+            and "." not in pattern[2:]
+        ):
+            self.extensions.add(pattern[1:])
+        else:
+            self.globs.append(pattern)
+
+    def compile(self):
+        if self.globs:
+            self._glob_re = re.compile(
+                "|".join(f"(?:{translate(p)})" for p in self.globs)
+            ).match
+        if self.paths:
+            self._path_re = re.compile(
+                "(?:" + "|".join(self.paths) + r")\Z", re.S
+            ).match
+
+    def __bool__(self):
+        return bool(self.names or self.extensions or self.globs or self.paths)
+
+    def matches(self, rel_path: str, name: str) -> bool:
+        if name in self.names:
+            return True
+        if self.extensions:
+            dot = name.rfind(".")
+            if dot != -1 and name[dot:] in self.extensions:
+                return True
+        if self._glob_re is not None and self._glob_re(name):
+            return True
+        if self._path_re is not None and self._path_re(rel_path):
+            return True
+        return False
+
+
+class IgnoreMatcher:
+    """Ignore patterns compiled once into set lookups and combined regexes.
+
+    * ``name`` - a literal name, matched with a set lookup
+    * ``*.ext`` - matched with an extension set lookup
+    * other globs without ``/`` - matched against the basename with one regex
+    * ``dir/*.py`` or ``/build`` - anchored to the project root and matched
+      against the full relative path
+    * a trailing ``/`` (``build/``) restricts a pattern to directories
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: FrozenSet[str] = frozenset(patterns)
+        self._any = _PatternBucket()
+        self._dirs = _PatternBucket()
+
+        for raw in self.patterns:
+            pattern = raw.strip()
+            if _FOLD_CASE:
+                pattern = pattern.lower()
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+            if not pattern:
+                continue
+            anchored = "/" in pattern
+            pattern = pattern.lstrip("/")
+            (self._dirs if dir_only else self._any).add(pattern, anchored)
+
+        self._any.compile()
+        self._dirs.compile()
+        self._has_dirs = bool(self._dirs)
+
+    def matches(self, rel_path: str, is_dir: bool = False) -> bool:
+        """Return True if the ``/``-separated path relative to the root is ignored."""
+        if _FOLD_CASE:
+            rel_path = rel_path.lower()
+        name = rel_path[rel_path.rfind("/") + 1:]
+        if self._any.matches(rel_path, name):
+            return True
+        return is_dir and self._has_dirs and self._dirs.matches(rel_path, name)
+
+    __call__ = matches
+
+
+@lru_cache(maxsize=32)
+def _compile(patterns: FrozenSet[str]) -> IgnoreMatcher:
+    return IgnoreMatcher(patterns)
+
+
+def compile_ignore_patterns(patterns: Optional[Iterable[str]]) -> IgnoreMatcher:
+    """Return a compiled matcher, reusing the cached one for an unchanged pattern set."""
+    return _compile(frozenset(patterns or ()))
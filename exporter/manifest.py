@@ -0,0 +1,126 @@
+import json
+import os
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .options import ExportOptions
+from .tokens import tokenizer_name
+from .walker import FileEntry
+
+MANIFEST_VERSION = 2
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def manifest_path(output_file: str) -> str:
+    """The manifest lives next to the export it describes."""
+    return output_file + MANIFEST_SUFFIX
+
+
+def export_fingerprint(root_dir: str, export_format: str, options: ExportOptions) -> Dict:
+    """Everything besides file contents that changes how a record is rendered.
+
+    A previous export is only reused when its fingerprint is identical.
+    """
+    fingerprint = {
+        "version": MANIFEST_VERSION,
+        "root_dir": os.path.abspath(root_dir),
+        "format": export_format,
+        "llm_optimize": options.llm_optimize,
+        "binary_policy": options.binary_policy,
+        "max_file_bytes": options.max_file_bytes,
+        "truncate_mode": options.truncate_mode,
+        "tokenizer": tokenizer_name(options.tokenizer) if options.llm_optimize else None,
+        "dedup": options.dedup,
+    }
+    if export_format == "jsonl-chunks":
+        fingerprint["chunks"] = [
+            options.chunk_bytes, options.chunk_lines, options.chunk_overlap
+        ]
+    return fingerprint
+
+
+class ManifestEntry(NamedTuple):
+    size: int
+    mtime: float
+    digest: Optional[str]
+    offset: int
+    length: int
+    # Set when the body is a reference to an earlier file with the same content
+    duplicate_of: Optional[str] = None
+
+
+class Manifest:
+    """Per-file size, mtime, content hash and rendered byte span of one export."""
+
+    def __init__(self, fingerprint: Dict):
+        self.fingerprint = fingerprint
+        self.files: Dict[str, ManifestEntry] = {}
+        self.output_size = 0
+        self.output_mtime_ns = 0
+
+    def add(
+        self,
+        entry: FileEntry,
+        digest: Optional[str],
+        span: Tuple[int, int],
+        duplicate_of: Optional[str] = None,
+    ):
+        start, end = span
+        self.files[entry.rel_path] = ManifestEntry(
+            entry.size, entry.mtime, digest, start, end - start, duplicate_of
+        )
+
+    def unchanged(self, entry: FileEntry) -> Optional[ManifestEntry]:
+        """Return the previous entry if size and mtime say the file is untouched."""
+        old = self.files.get(entry.rel_path)
+        if old is not None and old.size == entry.size and old.mtime == entry.mtime:
+            return old
+        return None
+
+    def save(self, output_file: str):
+        """Write the manifest atomically, recording the finished output's identity."""
+        st = os.stat(output_file)
+        self.output_size = st.st_size
+        self.output_mtime_ns = st.st_mtime_ns
+        data = {
+            "fingerprint": self.fingerprint,
+            "output_size": self.output_size,
+            "output_mtime_ns": self.output_mtime_ns,
+            "files": {path: list(entry) for path, entry in self.files.items()},
+        }
+        path = manifest_path(output_file)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, output_file: str, fingerprint: Dict) -> Optional["Manifest"]:
+        """Load the manifest for ``output_file`` if it is still valid to splice from.
+
+        Returns None when there is no manifest, it was made with different
+        settings, or the output was modified since the manifest was written.
+        """
+        try:
+            with open(manifest_path(output_file), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            st = os.stat(output_file)
+        except (OSError, ValueError):
+            return None
+        if data.get("fingerprint") != fingerprint:
+            return None
+        if (
+            data.get("output_size") != st.st_size
+            or data.get("output_mtime_ns") != st.st_mtime_ns
+        ):
+            return None
+
+        manifest = cls(fingerprint)
+        manifest.output_size = st.st_size
+        manifest.output_mtime_ns = st.st_mtime_ns
+        try:
+            manifest.files = {
+                path: ManifestEntry(*values) for path, values in data["files"].items()
+            }
+        except (KeyError, TypeError):
+            return None
+        return manifest
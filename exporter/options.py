@@ -0,0 +1,109 @@
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Set, Union
+
+from .chunks import check_chunk_limits
+from .compression import COMPRESSION_EXTENSIONS
+
+DEFAULT_IGNORE_PATTERNS = frozenset({
+    '.git',
+    '.gitignore',
+    '__pycache__',
+    '*.pyc',
+    '.DS_Store',
+    'node_modules',
+    '.idea',
+    '.vscode',
+    '*.log',
+    '*.tmp',
+    '*.temp',
+    '*.swp',
+    '~*',
+    'Thumbs.db',
+    'desktop.ini',
+})
+
+# What to do with files sniffed as binary: emit a short record, or leave them out
+BINARY_POLICIES = ("placeholder", "skip")
+
+# How files over max_file_bytes are cut down: keep both ends, or the start only
+TRUNCATE_MODES = ("head-tail", "head")
+
+# Where the files to export come from: a filesystem walk, or the git index
+# (falling back to the walk outside a git work tree)
+FILE_SOURCES = ("walk", "git")
+
+_SIZE_UNITS = {"": 1, "k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+
+FORMAT_EXTENSIONS = {
+    "text": ".txt",
+    "markdown": ".md",
+    "json": ".json",
+    "yaml": ".yaml",
+    "jsonl-chunks": ".jsonl",
+}
+
+
+@dataclass
+class ExportOptions:
+    """Plain settings object shared by the CLI, the GUI and library callers."""
+
+    export_format: str = "markdown"
+    structure_only: bool = False
+    llm_optimize: bool = False
+    ignore_patterns: Set[str] = field(
+        default_factory=lambda: set(DEFAULT_IGNORE_PATTERNS)
+    )
+    use_gitignore: bool = True
+    # "walk" or "git"; with "git", git_untracked adds untracked, non-ignored files
+    file_source: str = "walk"
+    git_untracked: bool = False
+    jobs: int = 1
+    incremental: bool = False
+    binary_policy: str = "placeholder"
+    max_file_bytes: Optional[int] = None
+    max_total_bytes: Optional[int] = None
+    truncate_mode: str = "head-tail"
+    token_budget: Optional[int] = None
+    # A name from tokens.TOKENIZERS or any callable returning a token count
+    tokenizer: Union[str, Callable[[str], int]] = "bytes"
+    dedup: bool = False
+    # "gzip", "zstd" or "xz"; an output extension such as .gz takes precedence
+    compress: Optional[str] = None
+    compress_level: Optional[int] = None
+    # jsonl-chunks format: chunk size limits and lines repeated between chunks
+    chunk_bytes: int = 2048
+    chunk_lines: Optional[int] = None
+    chunk_overlap: int = 2
+
+    def __post_init__(self):
+        check_chunk_limits(self.chunk_bytes, self.chunk_lines, self.chunk_overlap)
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as ``4096``, ``512k`` or ``10M``."""
+    value = text.strip().lower()
+    if value.endswith("b"):
+        value = value[:-1]
+    unit = value[-1:] if value[-1:] in _SIZE_UNITS else ""
+    number = value[:len(value) - len(unit)]
+    try:
+        size = int(float(number) * _SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"invalid size: {text!r}") from None
+    if size < 0:
+        raise ValueError(f"invalid size: {text!r}")
+    return size
+
+
+def default_output_path(directory: str, options: Optional[ExportOptions] = None) -> str:
+    """Return the auto-generated output path inside the project directory."""
+    options = options or ExportOptions()
+    project_name = os.path.basename(os.path.normpath(directory))
+    filename = f"{project_name}_structure"
+    if not options.structure_only:
+        filename += "_and_content"
+    filename += FORMAT_EXTENSIONS.get(options.export_format, ".txt")
+    if options.compress:
+        filename += COMPRESSION_EXTENSIONS[options.compress]
+    return os.path.join(directory, filename)
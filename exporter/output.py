@@ -0,0 +1,43 @@
+import os
+from typing import BinaryIO
+
+
+class OutputStream:
+    """Text stream over a binary file that knows its exact byte position.
+
+    Behaves like a file opened with ``open(path, "w", encoding="utf-8")``
+    (including newline translation) but also supports ``tell()`` as a
+    plain byte offset and splicing raw bytes from another file, which the
+    incremental export relies on.
+    """
+
+    def __init__(self, raw: BinaryIO, encoding: str = "utf-8"):
+        self.raw = raw
+        self.encoding = encoding
+        self.position = 0
+        self._newline = os.linesep if os.linesep != "\n" else None
+
+    def write(self, text: str) -> int:
+        if self._newline:
+            text = text.replace("\n", self._newline)
+        data = text.encode(self.encoding)
+        self.raw.write(data)
+        self.position += len(data)
+        return len(text)
+
+    def write_bytes(self, data: bytes) -> int:
+        self.raw.write(data)
+        self.position += len(data)
+        return len(data)
+
+    def copy_from(self, source: memoryview, offset: int, length: int):
+        """Copy ``length`` bytes at ``offset`` of a buffer (e.g. an mmap) without slicing copies."""
+        if offset + length > len(source):
+            raise EOFError("previous export is shorter than its manifest")
+        self.write_bytes(source[offset:offset + length])
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        self.raw.flush()
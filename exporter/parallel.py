@@ -0,0 +1,40 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Results allowed in flight per worker before the consumer must catch up
+WINDOW_PER_JOB = 4
+
+
+def ordered_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    jobs: int = 1,
+    window: Optional[int] = None,
+) -> Iterator[R]:
+    """Like map(), but runs func on a bounded thread pool.
+
+    Results are yielded in input order. At most ``window`` calls are
+    submitted ahead of the one being consumed, which caps memory at
+    ``window`` results no matter how far the slowest item lags.
+    """
+    if jobs <= 1:
+        yield from map(func, items)
+        return
+
+    window = max(window or jobs * WINDOW_PER_JOB, jobs)
+    pool = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="export-read")
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Stop promptly if the consumer abandons the iterator
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,227 @@
+import heapq
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .walker import IgnoreCheck, _never_ignore
+
+# Matches ranked per query; broader queries rank the first ones in path order
+MAX_CANDIDATES = 5000
+
+_BOUNDARY = "/_-. "
+
+# "\n"-prefixed paths, and a lowercase copy when lowering keeps the offsets
+Haystack = Tuple[str, Optional[str]]
+
+
+def _pattern(query: str, flags: int = 0) -> "re.Pattern":
+    """Regex matching each "\\n"-prefixed line that has ``query`` as a subsequence.
+
+    Starting at the newline lets the engine skip ahead with a literal
+    search, and each step uses a negated class instead of a lazy ``.*?``,
+    so every line is scanned once without backtracking.
+    """
+    steps = "".join(f"[^\\n{re.escape(c)}]*{re.escape(c)}" for c in query)
+    return re.compile(f"\\n{steps}[^\\n]*", flags)
+
+
+def _make_haystack(paths: Iterable[str]) -> Haystack:
+    text = "".join(f"\n{path}" for path in paths)
+    folded = text.lower()
+    return text, folded if len(folded) == len(text) else None
+
+
+def _span(query: str, text: str) -> Tuple[int, int]:
+    """Start and length of a tight window holding ``query`` as a subsequence.
+
+    Finds the leftmost end greedily, then walks back to the latest start.
+    """
+    end = -1
+    for c in query:
+        end = text.find(c, end + 1)
+    start = end
+    for c in reversed(query[:-1]):
+        start = text.rfind(c, 0, start)
+    return start, end + 1 - start
+
+
+def score(path: str, query: str) -> int:
+    """Rank a matching path, higher first.
+
+    A prefix of the file name beats a substring of the name, which beats
+    a substring of the path; fuzzy matches score by how tightly the
+    characters are packed, with a bonus when they all fall in the name.
+    """
+    path = path.lower()
+    name_start = path.rfind("/") + 1
+    pos = path.find(query, name_start)
+    if pos == name_start:
+        return 400
+    if pos != -1:
+        return 300 if path[pos - 1] in _BOUNDARY else 250
+    pos = path.find(query)
+    if pos != -1:
+        return 200 if pos == 0 or path[pos - 1] in _BOUNDARY else 150
+    start, length = _span(query, path)
+    return 100 - min(length, 90) + (10 if start >= name_start else 0)
+
+
+class PathIndex:
+    """In-memory index of a project's file paths for search-as-you-type.
+
+    ``build`` walks the project once, honoring ``is_ignored`` like the
+    export walk. Queries never touch the disk: all paths are kept in one
+    string that a compiled subsequence regex scans in C, and a query that
+    extends the previous one only rescans the previous matches.
+    ``refreshed`` returns an updated copy that only rescans directories
+    whose mtime changed, which is how added, removed and renamed entries
+    show up.
+    """
+
+    def __init__(self, root_dir: str, is_ignored: Optional[IgnoreCheck] = None):
+        self.root_dir = os.path.normpath(root_dir)
+        self.is_ignored = is_ignored or _never_ignore
+        # Keyed by "" (root) or "a/b/" prefixes, like ProjectScan.dirs
+        self.mtimes: Dict[str, int] = {}
+        self.files: Dict[str, List[str]] = {}
+        self.subdirs: Dict[str, List[str]] = {}
+        self._haystack: Optional[Haystack] = None
+        # The previous query and all of its matches, unless there were too many
+        self._last: Optional[Tuple[str, Haystack]] = None
+
+    @classmethod
+    def build(cls, root_dir: str, is_ignored: Optional[IgnoreCheck] = None) -> "PathIndex":
+        index = cls(root_dir, is_ignored)
+        index._scan_tree("")
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self.files.values())
+
+    def _abspath(self, rel_dir: str) -> str:
+        return os.path.join(self.root_dir, *rel_dir.split("/")[:-1])
+
+    def _changed(self):
+        self._haystack = None
+        self._last = None
+
+    def _scan_dir(self, rel_dir: str) -> Optional[List[str]]:
+        """(Re)list one directory; returns its subdirectories, or None if it is gone."""
+        path = self._abspath(rel_dir)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return None
+        files = []
+        subdirs = []
+        for entry in entries:
+            rel_path = rel_dir + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if self.is_ignored(rel_path, is_dir):
+                continue
+            if not is_dir:
+                files.append(entry.name)
+            elif not entry.is_symlink():
+                subdirs.append(rel_path + "/")
+        self.mtimes[rel_dir] = mtime
+        self.files[rel_dir] = sorted(files)
+        self.subdirs[rel_dir] = sorted(subdirs)
+        self._changed()
+        return self.subdirs[rel_dir]
+
+    def _scan_tree(self, rel_dir: str):
+        stack = [rel_dir]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop()) or ())
+
+    def _forget(self, rel_dir: str):
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            self.mtimes.pop(current, None)
+            self.files.pop(current, None)
+            stack.extend(self.subdirs.pop(current, ()))
+        self._changed()
+
+    def refreshed(self) -> "PathIndex":
+        """A copy of the index with changed directories rescanned.
+
+        Creating, deleting or renaming an entry updates its directory's
+        mtime, so one stat per directory finds every change; unchanged
+        subtrees are carried over without being listed again.
+        """
+        new = PathIndex(self.root_dir, self.is_ignored)
+        new.mtimes = dict(self.mtimes)
+        new.files = dict(self.files)
+        new.subdirs = dict(self.subdirs)
+        new._haystack = self._haystack
+        changed = []
+        for rel_dir, mtime in self.mtimes.items():
+            try:
+                current = os.stat(self._abspath(rel_dir)).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                changed.append(rel_dir)
+        # Parents sort before their subdirectories
+        for rel_dir in sorted(changed):
+            if rel_dir not in new.mtimes:
+                continue
+            old = set(new.subdirs.get(rel_dir, ()))
+            subdirs = new._scan_dir(rel_dir)
+            if subdirs is None:
+                new._forget(rel_dir)
+                continue
+            for gone in old.difference(subdirs):
+                new._forget(gone)
+            for added in sorted(set(subdirs) - old):
+                new._scan_tree(added)
+        return new
+
+    def paths(self) -> Iterator[str]:
+        """Every indexed file path, "/"-separated, directory by directory."""
+        for rel_dir in sorted(self.files):
+            for name in self.files[rel_dir]:
+                yield rel_dir + name
+
+    @property
+    def haystack(self) -> Haystack:
+        if self._haystack is None:
+            self._haystack = _make_haystack(self.paths())
+        return self._haystack
+
+    def search(self, query: str, limit: int = 200) -> List[str]:
+        """Paths containing the characters of ``query`` in order, best first.
+
+        Spaces are ignored and matching is case-insensitive. At most
+        MAX_CANDIDATES matches are ranked; ties go to shorter paths.
+        """
+        query = "".join(query.split()).lower()
+        if not query:
+            return []
+        haystack = self.haystack
+        if self._last is not None and query.startswith(self._last[0]):
+            # Typing narrows the results: only the previous matches can match
+            haystack = self._last[1]
+        text, folded = haystack
+        if folded is not None:
+            matches = _pattern(query).finditer(folded)
+        else:
+            matches = _pattern(query, re.IGNORECASE).finditer(text)
+
+        matched = []
+        for match in matches:
+            if len(matched) == MAX_CANDIDATES:
+                # Too broad to narrow from; the next query scans everything
+                self._last = None
+                break
+            matched.append(text[match.start() + 1:match.end()])
+        else:
+            self._last = (query, _make_haystack(matched))
+        candidates = [(-score(path, query), len(path), path) for path in matched]
+        return [path for _, _, path in heapq.nsmallest(limit, candidates)]
@@ -0,0 +1,143 @@
+import mmap
+import os
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .binary import SNIFF_BYTES, sniff_binary
+from .records import LINE_SNAP_BYTES
+
+# Text pages cover this many bytes, snapped forward to a line break
+PAGE_BYTES = 64 * 1024
+# Hex pages are shorter: every byte takes about four characters
+HEX_PAGE_BYTES = 4096
+HEX_WIDTH = 16
+
+
+class PreviewFile(NamedTuple):
+    """A file as seen when its preview was opened; pages are read lazily."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    # Detected binary type, None for text
+    binary_type: Optional[str]
+
+    @property
+    def page_bytes(self) -> int:
+        return HEX_PAGE_BYTES if self.binary_type else PAGE_BYTES
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.size // self.page_bytes))
+
+    def summary(self) -> str:
+        if self.binary_type is None:
+            return f"{self.size:,} bytes"
+        return f"Binary file ({self.binary_type}), {self.size:,} bytes"
+
+
+def open_preview(path: str) -> PreviewFile:
+    """Stat and sniff a file for the preview; only the first SNIFF_BYTES are read."""
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+        st = os.fstat(f.fileno())
+    return PreviewFile(path, st.st_size, st.st_mtime_ns, sniff_binary(head))
+
+
+def _snap(mm: mmap.mmap, offset: int) -> int:
+    """Move a page boundary forward to just past a newline, or to a UTF-8 character start."""
+    size = len(mm)
+    if offset <= 0 or offset >= size:
+        return max(0, min(offset, size))
+    newline = mm.find(b"\n", offset - 1, min(size, offset + LINE_SNAP_BYTES))
+    if newline >= 0:
+        return newline + 1
+    while offset < size and mm[offset] & 0xC0 == 0x80:
+        offset += 1
+    return offset
+
+
+def _read_window(path: str, page: int, page_bytes: int, snap: bool) -> bytes:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = page * page_bytes, (page + 1) * page_bytes
+            if snap:
+                start, end = _snap(mm, start), _snap(mm, end)
+            return mm[start:end]
+
+
+def format_hex(data: bytes, offset: int = 0) -> str:
+    """Classic hex dump: offset, sixteen hex bytes, printable ASCII."""
+    lines = []
+    for i in range(0, len(data), HEX_WIDTH):
+        row = data[i:i + HEX_WIDTH]
+        hex_part = " ".join(f"{b:02x}" for b in row)
+        text = "".join(chr(b) if 32 <= b < 127 else "." for b in row)
+        lines.append(f"{offset + i:08x}  {hex_part:<{HEX_WIDTH * 3 - 1}}  {text}\n")
+    return "".join(lines)
+
+
+def render_page(preview: PreviewFile, page: int) -> str:
+    """Text of one page: decoded lines for text files, a hex dump for binaries.
+
+    Text pages start and end on line breaks where possible, so pages
+    joined in order give back the whole file. Undecodable bytes are
+    shown as U+FFFD instead of failing the preview.
+    """
+    if preview.binary_type is not None:
+        data = _read_window(preview.path, page, HEX_PAGE_BYTES, snap=False)
+        return format_hex(data, page * HEX_PAGE_BYTES)
+    data = _read_window(preview.path, page, PAGE_BYTES, snap=True)
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class PageCache:
+    """Size-bounded LRU cache of rendered preview pages.
+
+    Pages are keyed by path, size and mtime, so a file changed on disk
+    gets new keys; its outdated pages are dropped when the new version
+    is first read. ``max_chars`` bounds the total cached text.
+    """
+
+    def __init__(self, max_chars: int = 16 * 1024 * 1024):
+        self.max_chars = max_chars
+        self.chars = 0
+        self._pages: "OrderedDict[Tuple[str, int, int, int], str]" = OrderedDict()
+        # The (size, mtime) each cached path was read at
+        self._versions: Dict[str, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def _drop(self, key):
+        self.chars -= len(self._pages.pop(key))
+
+    def get(self, preview: PreviewFile, page: int) -> str:
+        version = (preview.size, preview.mtime_ns)
+        key = (preview.path, *version, page)
+        text = self._pages.get(key)
+        if text is not None:
+            self._pages.move_to_end(key)
+            return text
+        if self._versions.get(preview.path, version) != version:
+            for stale in [k for k in self._pages if k[0] == preview.path]:
+                self._drop(stale)
+        self._versions[preview.path] = version
+
+        text = render_page(preview, page)
+        if len(text) <= self.max_chars:
+            self._pages[key] = text
+            self.chars += len(text)
+            while self.chars > self.max_chars:
+                self._drop(next(iter(self._pages)))
+        return text
+
+    def clear(self):
+        self._pages.clear()
+        self._versions.clear()
+        self.chars = 0
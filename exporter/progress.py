@@ -0,0 +1,73 @@
+import threading
+from time import perf_counter
+from typing import Optional
+
+
+class ExportCancelled(Exception):
+    """Raised inside an export when its ProgressReporter was cancelled."""
+
+
+class ProgressReporter:
+    """Progress and cancellation hooks for one export.
+
+    Pass an instance to ``ExportEngine.generate_file_structure``. The
+    engine calls ``scanning`` for every directory it walks, ``started``
+    once the file list is known and ``file_done`` after each record is
+    written. Every hook checks the cancel flag, so ``cancel()`` from any
+    thread stops the export at the next directory or file and the engine
+    removes the partial output. Subclasses override ``update`` to show
+    progress; the base class only keeps the counts.
+    """
+
+    def __init__(self):
+        self.total_files = 0
+        self.total_bytes = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.current_path = ""
+        self._started = perf_counter()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check(self):
+        if self._cancel.is_set():
+            raise ExportCancelled()
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self._started
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left, extrapolated from the bytes written so far."""
+        if not self.bytes_done or not self.total_bytes:
+            return None
+        rate = self.bytes_done / self.elapsed
+        return max(0.0, (self.total_bytes - self.bytes_done) / rate)
+
+    def scanning(self, rel_dir: str):
+        self.check()
+        self.current_path = rel_dir
+
+    def started(self, total_files: int, total_bytes: int):
+        self.check()
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self._started = perf_counter()
+        self.update()
+
+    def file_done(self, rel_path: str, size: int):
+        self.files_done += 1
+        self.bytes_done += size
+        self.current_path = rel_path
+        self.update()
+        self.check()
+
+    def update(self):
+        """Called after every change to the counts; override to display them."""
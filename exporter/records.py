@@ -0,0 +1,293 @@
+import hashlib
+import mmap
+import os
+from datetime import datetime
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Tuple
+
+from .binary import SNIFF_BYTES, sniff_binary
+from .walker import FileEntry
+
+if TYPE_CHECKING:
+    from .stats import ExportStats
+
+# Truncated heads and tails snap to a line break within this many bytes of the cut
+LINE_SNAP_BYTES = 1024
+
+
+class ReadResult(NamedTuple):
+    """A file's export record plus data the engine tracks but does not write."""
+
+    entry: FileEntry
+    record: Dict
+    digest: Optional[str] = None
+    # Token estimate of the record's content, when token counting is enabled
+    tokens: Optional[int] = None
+
+
+def get_semantic_type(ext: str, content: str = "") -> str:
+    """Determine semantic type of file content."""
+    if ext in ['.py', '.js', '.java', '.cpp', '.cs']:
+        return "source_code"
+    elif ext in ['.md', '.txt', '.rst']:
+        return "documentation"
+    elif ext in ['.json', '.yaml', '.yml', '.xml']:
+        return "data"
+    elif ext in ['.jpg', '.png', '.gif', '.svg']:
+        return "image"
+    elif ext in ['.html', '.css']:
+        return "web"
+    elif ext in ['.conf', '.ini', '.env']:
+        return "configuration"
+    return "unknown"
+
+
+def read_file(
+    entry: FileEntry,
+    max_bytes: Optional[int] = None,
+    truncate_mode: str = "head-tail",
+) -> Tuple[Optional[str], Optional[bytes], int]:
+    """Return ``(binary_type, data, omitted_bytes)`` for one file.
+
+    ``data`` is None for binary files; only the first SNIFF_BYTES are read
+    before deciding, so large assets are never loaded in full. Text files
+    larger than ``max_bytes`` are cut down to their head (and tail) through
+    an mmap, with an elision marker in place of the omitted middle.
+    """
+    with open(entry.path, "rb") as file:
+        head = file.read(SNIFF_BYTES)
+        binary_type = sniff_binary(head)
+        if binary_type is not None:
+            return binary_type, None, 0
+        size = os.fstat(file.fileno()).st_size
+        if max_bytes is not None and size > max_bytes:
+            return None, *_read_truncated(file, size, max_bytes, truncate_mode)
+        if len(head) < SNIFF_BYTES:
+            return None, head, 0
+        # Re-read from the start rather than concatenating two large buffers
+        file.seek(0)
+        return None, file.read(), 0
+
+
+def _read_truncated(file, size: int, max_bytes: int, truncate_mode: str) -> Tuple[bytes, int]:
+    """Slice the kept ends out of an mmap of ``file``; the middle is never read."""
+    head_len = max_bytes if truncate_mode == "head" else max_bytes - max_bytes // 2
+    tail_len = max_bytes - head_len
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        head_end = mm.rfind(b"\n", max(0, head_len - LINE_SNAP_BYTES), head_len) + 1
+        if not head_end:
+            head_end = head_len
+            # Never split a UTF-8 sequence: back up past continuation bytes
+            while head_end and mm[head_end] & 0xC0 == 0x80:
+                head_end -= 1
+        tail_start = size - tail_len
+        if tail_len:
+            newline = mm.find(b"\n", tail_start, min(size, tail_start + LINE_SNAP_BYTES))
+            if newline >= 0:
+                tail_start = newline + 1
+            else:
+                while tail_start < size and mm[tail_start] & 0xC0 == 0x80:
+                    tail_start += 1
+        head, tail = mm[:head_end], mm[tail_start:]
+    omitted = tail_start - head_end
+    marker = f"[... {omitted} bytes omitted ...]\n".encode("ascii")
+    if head and not head.endswith(b"\n"):
+        marker = b"\n" + marker
+    return head + marker + tail, omitted
+
+
+def decode_text(data: bytes) -> str:
+    """Decode UTF-8 exactly like a text-mode open(), universal newlines included."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_llm_record(
+    entry: FileEntry,
+    content: str,
+    omitted_bytes: int = 0,
+    digest: Optional[str] = None,
+) -> Dict:
+    """Build the LLM-optimized record for a file's decoded content."""
+    # Metadata comes from the walk's DirEntry, no extra stat call
+    ext = os.path.splitext(entry.path)[1].lower()
+
+    metadata = {
+        "is_binary": False,
+        "line_count": content.count('\n') + 1,
+        "extension": ext,
+        "truncated": bool(omitted_bytes),
+    }
+    if omitted_bytes:
+        metadata["omitted_bytes"] = omitted_bytes
+    if digest is not None:
+        metadata["content_hash"] = digest
+
+    return {
+        "file_path": entry.rel_path,
+        "file_type": ext[1:] if ext else "unknown",
+        "size_bytes": entry.size,
+        "last_modified": datetime.fromtimestamp(entry.mtime).isoformat(),
+        "semantic_type": get_semantic_type(ext, content),
+        "content_preview": _content_preview(content),
+        "content_size": len(content),
+        "content": content,
+        "metadata": metadata,
+    }
+
+
+def _content_preview(content: str) -> str:
+    if len(content) > 200:
+        return content[:200] + "..."
+    return content
+
+
+def replace_content(record: Dict, content: str) -> Dict:
+    """Copy of a text record with new content and the LLM fields derived from it.
+
+    The content hash and token estimate described the original bytes, so
+    they are dropped rather than left stale.
+    """
+    record = dict(record, content=content)
+    if "content_size" in record:
+        metadata = dict(record["metadata"], line_count=content.count("\n") + 1)
+        metadata.pop("content_hash", None)
+        metadata.pop("token_estimate", None)
+        record.update(
+            semantic_type=get_semantic_type(metadata["extension"], content),
+            content_preview=_content_preview(content),
+            content_size=len(content),
+            metadata=metadata,
+        )
+    return record
+
+
+def build_binary_record(entry: FileEntry, binary_type: str, llm_optimize: bool) -> Dict:
+    """Compact placeholder for a binary file; its content is never read."""
+    if not llm_optimize:
+        return {
+            "file_path": entry.rel_path,
+            "binary_type": binary_type,
+            "size_bytes": entry.size,
+        }
+    ext = os.path.splitext(entry.path)[1].lower()
+    return {
+        "file_path": entry.rel_path,
+        "file_type": ext[1:] if ext else "unknown",
+        "size_bytes": entry.size,
+        "last_modified": datetime.fromtimestamp(entry.mtime).isoformat(),
+        "semantic_type": get_semantic_type(ext),
+        "binary_type": binary_type,
+        "content_preview": "",
+        "content_size": 0,
+        "content": None,
+        "metadata": {
+            "is_binary": True,
+            "line_count": 0,
+            "extension": ext,
+            "truncated": False,
+        }
+    }
+
+
+def build_duplicate_record(
+    entry: FileEntry, first_path: str, digest: str, llm_optimize: bool
+) -> Dict:
+    """Short reference to an earlier file with identical content."""
+    if not llm_optimize:
+        return {"file_path": entry.rel_path, "duplicate_of": first_path}
+    ext = os.path.splitext(entry.path)[1].lower()
+    return {
+        "file_path": entry.rel_path,
+        "file_type": ext[1:] if ext else "unknown",
+        "size_bytes": entry.size,
+        "last_modified": datetime.fromtimestamp(entry.mtime).isoformat(),
+        "semantic_type": get_semantic_type(ext),
+        "duplicate_of": first_path,
+        "content_preview": "",
+        "content_size": 0,
+        "content": None,
+        "metadata": {
+            "is_binary": False,
+            "line_count": 0,
+            "extension": ext,
+            "truncated": False,
+            "content_hash": digest,
+        }
+    }
+
+
+def placeholder_text(record: Dict) -> Optional[str]:
+    """What writers show instead of content for binary or duplicate records."""
+    duplicate_of = record.get("duplicate_of")
+    if duplicate_of is not None:
+        return f"[Same content as {duplicate_of}]"
+    binary_type = record.get("binary_type")
+    if binary_type is not None:
+        return f"[Binary file omitted: {binary_type}, {record['size_bytes']} bytes]"
+    return None
+
+
+def read_entry(
+    entry: FileEntry,
+    llm_optimize: bool = False,
+    hash_content: bool = False,
+    binary_policy: str = "placeholder",
+    max_bytes: Optional[int] = None,
+    truncate_mode: str = "head-tail",
+    stats: Optional["ExportStats"] = None,
+) -> Optional[ReadResult]:
+    """Read one file and return its export record.
+
+    Records are the unit every writer consumes: ``file_path`` plus either
+    ``content`` or ``error``, and the extra metadata fields in LLM mode.
+    Binary files become a placeholder record, or None under the "skip"
+    policy. Files over ``max_bytes`` are truncated as described in
+    read_file. The content hash is only computed when ``hash_content`` is
+    set; for truncated files it covers the kept bytes and the marker, i.e.
+    exactly what gets exported. In LLM mode it is added to the metadata.
+    ``stats`` is charged with read, hash and decode time and the outcome.
+    """
+    digest = None
+    try:
+        if stats is not None:
+            start = perf_counter()
+        binary_type, data, omitted = read_file(entry, max_bytes, truncate_mode)
+        if stats is not None:
+            start = stats.lap("read", start)
+            stats.add_read(len(data) if data is not None else min(entry.size, SNIFF_BYTES))
+            if binary_type is not None:
+                stats.count("skipped" if binary_policy == "skip" else "binary")
+            elif omitted:
+                stats.count("truncated")
+        if binary_type is not None:
+            if binary_policy == "skip":
+                return None
+            record = build_binary_record(entry, binary_type, llm_optimize)
+            return ReadResult(entry, record, None)
+        if hash_content:
+            digest = content_hash(data)
+            if stats is not None:
+                start = stats.lap("hash", start)
+        content = decode_text(data)
+        if stats is not None:
+            stats.lap("decode", start)
+    except Exception as e:
+        if stats is not None:
+            stats.count("errors")
+        if llm_optimize:
+            record = {"file_path": entry.rel_path, "error": str(e), "content": None}
+        else:
+            record = {"file_path": entry.rel_path, "error": str(e)}
+        return ReadResult(entry, record, digest)
+
+    if llm_optimize:
+        return ReadResult(entry, build_llm_record(entry, content, omitted, digest), digest)
+    return ReadResult(entry, {"file_path": entry.rel_path, "content": content}, digest)
+
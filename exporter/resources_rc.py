@@ -0,0 +1,1035 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\xf7\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x33\x2e\x37\x31\x20\x34\x2e\
+\x32\x39\x6c\x2d\x33\x2d\x33\x4c\x31\x30\x20\x31\x48\x34\x4c\x33\
+\x20\x32\x76\x31\x32\x6c\x31\x20\x31\x68\x39\x6c\x31\x2d\x31\x56\
+\x35\x6c\x2d\x2e\x32\x39\x2d\x2e\x37\x31\x7a\x4d\x31\x33\x20\x31\
+\x34\x48\x34\x56\x32\x68\x35\x76\x34\x68\x34\x76\x38\x7a\x6d\x2d\
+\x33\x2d\x39\x56\x32\x6c\x33\x20\x33\x68\x2d\x33\x7a\x22\x2f\x3e\
+\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\xaf\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x31\x2e\x33\x34\x20\x39\x2e\x37\x31\x68\x2e\x37\x31\x6c\x32\
+\x2e\x36\x37\x2d\x32\x2e\x36\x37\x76\x2d\x2e\x37\x31\x4c\x31\x33\
+\x2e\x33\x38\x20\x35\x68\x2d\x2e\x37\x6c\x2d\x31\x2e\x38\x32\x20\
+\x31\x2e\x38\x31\x68\x2d\x35\x56\x35\x2e\x35\x36\x6c\x31\x2e\x38\
+\x36\x2d\x31\x2e\x38\x35\x56\x33\x6c\x2d\x32\x2d\x32\x48\x35\x4c\
+\x31\x20\x35\x76\x2e\x37\x31\x6c\x32\x20\x32\x68\x2e\x37\x31\x6c\
+\x31\x2e\x31\x34\x2d\x31\x2e\x31\x35\x76\x35\x2e\x37\x39\x6c\x2e\
+\x35\x2e\x35\x48\x31\x30\x76\x2e\x35\x32\x6c\x31\x2e\x33\x33\x20\
+\x31\x2e\x33\x34\x68\x2e\x37\x31\x6c\x32\x2e\x36\x37\x2d\x32\x2e\
+\x36\x37\x76\x2d\x2e\x37\x31\x4c\x31\x33\x2e\x33\x37\x20\x31\x30\
+\x68\x2d\x2e\x37\x6c\x2d\x31\x2e\x38\x36\x20\x31\x2e\x38\x35\x68\
+\x2d\x35\x76\x2d\x34\x48\x31\x30\x76\x2e\x34\x38\x6c\x31\x2e\x33\
+\x34\x20\x31\x2e\x33\x38\x7a\x6d\x31\x2e\x36\x39\x2d\x33\x2e\x36\
+\x35\x6c\x2e\x36\x33\x2e\x36\x33\x2d\x32\x20\x32\x2d\x2e\x36\x33\
+\x2d\x2e\x36\x33\x20\x32\x2d\x32\x7a\x6d\x30\x20\x35\x6c\x2e\x36\
+\x33\x2e\x36\x33\x2d\x32\x20\x32\x2d\x2e\x36\x33\x2d\x2e\x36\x33\
+\x20\x32\x2d\x32\x7a\x4d\x33\x2e\x33\x35\x20\x36\x2e\x36\x35\x6c\
+\x2d\x31\x2e\x32\x39\x2d\x31\x2e\x33\x20\x33\x2e\x32\x39\x2d\x33\
+\x2e\x32\x39\x20\x31\x2e\x33\x20\x31\x2e\x32\x39\x2d\x33\x2e\x33\
+\x20\x33\x2e\x33\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x08\x5c\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x36\x20\x32\x2e\x39\x38\x34\x56\
+\x32\x68\x2d\x2e\x30\x39\x63\x2d\x2e\x33\x31\x33\x20\x30\x2d\x2e\
+\x36\x31\x36\x2e\x30\x36\x32\x2d\x2e\x39\x30\x39\x2e\x31\x38\x35\
+\x61\x32\x2e\x33\x33\x20\x32\x2e\x33\x33\x20\x30\x20\x30\x20\x30\
+\x2d\x2e\x37\x37\x35\x2e\x35\x33\x20\x32\x2e\x32\x33\x20\x32\x2e\
+\x32\x33\x20\x30\x20\x30\x20\x30\x2d\x2e\x34\x39\x33\x2e\x37\x35\
+\x33\x76\x2e\x30\x30\x31\x61\x33\x2e\x35\x34\x32\x20\x33\x2e\x35\
+\x34\x32\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\x39\x38\x2e\x38\x33\
+\x76\x2e\x30\x30\x32\x61\x36\x2e\x30\x38\x20\x36\x2e\x30\x38\x20\
+\x30\x20\x30\x20\x30\x2d\x2e\x30\x32\x34\x2e\x38\x36\x33\x63\x2e\
+\x30\x31\x32\x2e\x32\x39\x2e\x30\x31\x38\x2e\x35\x38\x2e\x30\x31\
+\x38\x2e\x38\x36\x39\x20\x30\x20\x2e\x32\x30\x33\x2d\x2e\x30\x34\
+\x2e\x33\x39\x33\x2d\x2e\x31\x31\x37\x2e\x35\x37\x32\x76\x2e\x30\
+\x30\x31\x61\x31\x2e\x35\x30\x34\x20\x31\x2e\x35\x30\x34\x20\x30\
+\x20\x30\x20\x31\x2d\x2e\x37\x36\x35\x2e\x37\x38\x37\x20\x31\x2e\
+\x33\x37\x36\x20\x31\x2e\x33\x37\x36\x20\x30\x20\x30\x20\x31\x2d\
+\x2e\x35\x35\x38\x2e\x31\x31\x35\x48\x32\x76\x2e\x39\x38\x34\x68\
+\x2e\x30\x39\x63\x2e\x31\x39\x35\x20\x30\x20\x2e\x33\x38\x2e\x30\
+\x34\x2e\x35\x35\x36\x2e\x31\x32\x31\x6c\x2e\x30\x30\x31\x2e\x30\
+\x30\x31\x63\x2e\x31\x37\x38\x2e\x30\x37\x38\x2e\x33\x32\x39\x2e\
+\x31\x38\x34\x2e\x34\x35\x35\x2e\x33\x31\x38\x6c\x2e\x30\x30\x32\
+\x2e\x30\x30\x32\x63\x2e\x31\x33\x2e\x31\x33\x2e\x32\x33\x33\x2e\
+\x32\x38\x35\x2e\x33\x30\x37\x2e\x34\x36\x35\x6c\x2e\x30\x30\x31\
+\x2e\x30\x30\x32\x63\x2e\x30\x37\x38\x2e\x31\x38\x2e\x31\x31\x37\
+\x2e\x33\x36\x38\x2e\x31\x31\x37\x2e\x35\x36\x36\x20\x30\x20\x2e\
+\x32\x39\x2d\x2e\x30\x30\x36\x2e\x35\x38\x2d\x2e\x30\x31\x38\x2e\
+\x38\x36\x39\x2d\x2e\x30\x31\x32\x2e\x32\x39\x36\x2d\x2e\x30\x30\
+\x34\x2e\x35\x38\x35\x2e\x30\x32\x34\x2e\x38\x37\x76\x2e\x30\x30\
+\x31\x63\x2e\x30\x33\x33\x2e\x32\x38\x33\x2e\x30\x39\x39\x2e\x35\
+\x35\x38\x2e\x31\x39\x37\x2e\x38\x32\x34\x76\x2e\x30\x30\x31\x63\
+\x2e\x31\x30\x36\x2e\x32\x37\x33\x2e\x32\x37\x31\x2e\x35\x32\x34\
+\x2e\x34\x39\x34\x2e\x37\x35\x33\x2e\x32\x32\x33\x2e\x32\x33\x2e\
+\x34\x38\x32\x2e\x34\x30\x37\x2e\x37\x37\x35\x2e\x35\x33\x2e\x32\
+\x39\x33\x2e\x31\x32\x33\x2e\x35\x39\x36\x2e\x31\x38\x35\x2e\x39\
+\x31\x2e\x31\x38\x35\x48\x36\x76\x2d\x2e\x39\x38\x34\x68\x2d\x2e\
+\x30\x39\x63\x2d\x2e\x32\x20\x30\x2d\x2e\x33\x38\x37\x2d\x2e\x30\
+\x33\x38\x2d\x2e\x35\x36\x33\x2d\x2e\x31\x31\x35\x61\x31\x2e\x36\
+\x31\x33\x20\x31\x2e\x36\x31\x33\x20\x30\x20\x30\x20\x31\x2d\x2e\
+\x34\x35\x37\x2d\x2e\x33\x32\x20\x31\x2e\x36\x35\x39\x20\x31\x2e\
+\x36\x35\x39\x20\x30\x20\x30\x20\x31\x2d\x2e\x33\x30\x39\x2d\x2e\
+\x34\x36\x37\x63\x2d\x2e\x30\x37\x34\x2d\x2e\x31\x38\x2d\x2e\x31\
+\x31\x2d\x2e\x33\x37\x2d\x2e\x31\x31\x2d\x2e\x35\x37\x33\x20\x30\
+\x2d\x2e\x32\x32\x38\x2e\x30\x30\x33\x2d\x2e\x34\x35\x33\x2e\x30\
+\x31\x31\x2d\x2e\x36\x37\x32\x2e\x30\x30\x38\x2d\x2e\x32\x32\x38\
+\x2e\x30\x30\x38\x2d\x2e\x34\x35\x20\x30\x2d\x2e\x36\x36\x35\x61\
+\x34\x2e\x36\x33\x39\x20\x34\x2e\x36\x33\x39\x20\x30\x20\x30\x20\
+\x30\x2d\x2e\x30\x35\x35\x2d\x2e\x36\x34\x20\x32\x2e\x36\x38\x32\
+\x20\x32\x2e\x36\x38\x32\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\x36\
+\x38\x2d\x2e\x36\x30\x39\x41\x32\x2e\x32\x38\x34\x20\x32\x2e\x32\
+\x38\x34\x20\x30\x20\x30\x20\x30\x20\x33\x2e\x35\x32\x32\x20\x38\
+\x61\x32\x2e\x32\x38\x34\x20\x32\x2e\x32\x38\x34\x20\x30\x20\x30\
+\x20\x30\x20\x2e\x37\x33\x38\x2d\x2e\x39\x35\x35\x63\x2e\x30\x38\
+\x2d\x2e\x31\x39\x32\x2e\x31\x33\x35\x2d\x2e\x33\x39\x33\x2e\x31\
+\x36\x38\x2d\x2e\x36\x30\x32\x2e\x30\x33\x33\x2d\x2e\x32\x31\x2e\
+\x30\x35\x31\x2d\x2e\x34\x32\x33\x2e\x30\x35\x35\x2d\x2e\x36\x34\
+\x2e\x30\x30\x38\x2d\x2e\x32\x32\x2e\x30\x30\x38\x2d\x2e\x34\x34\
+\x32\x20\x30\x2d\x2e\x36\x36\x36\x2d\x2e\x30\x30\x38\x2d\x2e\x32\
+\x32\x34\x2d\x2e\x30\x31\x32\x2d\x2e\x34\x35\x2d\x2e\x30\x31\x32\
+\x2d\x2e\x36\x37\x38\x61\x31\x2e\x34\x37\x20\x31\x2e\x34\x37\x20\
+\x30\x20\x30\x20\x31\x20\x2e\x38\x37\x37\x2d\x31\x2e\x33\x35\x34\
+\x20\x31\x2e\x33\x33\x20\x31\x2e\x33\x33\x20\x30\x20\x30\x20\x31\
+\x20\x2e\x35\x36\x33\x2d\x2e\x31\x32\x31\x48\x36\x7a\x6d\x34\x20\
+\x31\x30\x2e\x30\x33\x32\x56\x31\x34\x68\x2e\x30\x39\x63\x2e\x33\
+\x31\x33\x20\x30\x20\x2e\x36\x31\x36\x2d\x2e\x30\x36\x32\x2e\x39\
+\x30\x39\x2d\x2e\x31\x38\x35\x2e\x32\x39\x33\x2d\x2e\x31\x32\x33\
+\x2e\x35\x35\x32\x2d\x2e\x33\x2e\x37\x37\x35\x2d\x2e\x35\x33\x2e\
+\x32\x32\x33\x2d\x2e\x32\x33\x2e\x33\x38\x38\x2d\x2e\x34\x38\x2e\
+\x34\x39\x33\x2d\x2e\x37\x35\x33\x76\x2d\x2e\x30\x30\x31\x63\x2e\
+\x31\x2d\x2e\x32\x36\x36\x2e\x31\x36\x35\x2d\x2e\x35\x34\x33\x2e\
+\x31\x39\x38\x2d\x2e\x38\x33\x76\x2d\x2e\x30\x30\x32\x63\x2e\x30\
+\x32\x38\x2d\x2e\x32\x38\x2e\x30\x33\x36\x2d\x2e\x35\x36\x37\x2e\
+\x30\x32\x34\x2d\x2e\x38\x36\x33\x2d\x2e\x30\x31\x32\x2d\x2e\x32\
+\x39\x2d\x2e\x30\x31\x38\x2d\x2e\x35\x38\x2d\x2e\x30\x31\x38\x2d\
+\x2e\x38\x36\x39\x20\x30\x2d\x2e\x32\x30\x33\x2e\x30\x34\x2d\x2e\
+\x33\x39\x33\x2e\x31\x31\x37\x2d\x2e\x35\x37\x32\x76\x2d\x2e\x30\
+\x30\x31\x61\x31\x2e\x35\x30\x32\x20\x31\x2e\x35\x30\x32\x20\x30\
+\x20\x30\x20\x31\x20\x2e\x37\x36\x35\x2d\x2e\x37\x38\x37\x20\x31\
+\x2e\x33\x38\x20\x31\x2e\x33\x38\x20\x30\x20\x30\x20\x31\x20\x2e\
+\x35\x35\x38\x2d\x2e\x31\x31\x35\x48\x31\x34\x76\x2d\x2e\x39\x38\
+\x34\x68\x2d\x2e\x30\x39\x63\x2d\x2e\x31\x39\x36\x20\x30\x2d\x2e\
+\x33\x38\x31\x2d\x2e\x30\x34\x2d\x2e\x35\x35\x37\x2d\x2e\x31\x32\
+\x31\x6c\x2d\x2e\x30\x30\x31\x2d\x2e\x30\x30\x31\x61\x31\x2e\x33\
+\x37\x36\x20\x31\x2e\x33\x37\x36\x20\x30\x20\x30\x20\x31\x2d\x2e\
+\x34\x35\x35\x2d\x2e\x33\x31\x38\x6c\x2d\x2e\x30\x30\x32\x2d\x2e\
+\x30\x30\x32\x61\x31\x2e\x34\x31\x35\x20\x31\x2e\x34\x31\x35\x20\
+\x30\x20\x30\x20\x31\x2d\x2e\x33\x30\x37\x2d\x2e\x34\x36\x35\x76\
+\x2d\x2e\x30\x30\x32\x61\x31\x2e\x34\x30\x35\x20\x31\x2e\x34\x30\
+\x35\x20\x30\x20\x30\x20\x31\x2d\x2e\x31\x31\x38\x2d\x2e\x35\x36\
+\x36\x63\x30\x2d\x2e\x32\x39\x2e\x30\x30\x36\x2d\x2e\x35\x38\x2e\
+\x30\x31\x38\x2d\x2e\x38\x36\x39\x61\x36\x2e\x31\x37\x34\x20\x36\
+\x2e\x31\x37\x34\x20\x30\x20\x30\x20\x30\x2d\x2e\x30\x32\x34\x2d\
+\x2e\x38\x37\x76\x2d\x2e\x30\x30\x31\x61\x33\x2e\x35\x33\x37\x20\
+\x33\x2e\x35\x33\x37\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\x39\x37\
+\x2d\x2e\x38\x32\x34\x76\x2d\x2e\x30\x30\x31\x61\x32\x2e\x32\x33\
+\x20\x32\x2e\x32\x33\x20\x30\x20\x30\x20\x30\x2d\x2e\x34\x39\x34\
+\x2d\x2e\x37\x35\x33\x20\x32\x2e\x33\x33\x31\x20\x32\x2e\x33\x33\
+\x31\x20\x30\x20\x30\x20\x30\x2d\x2e\x37\x37\x35\x2d\x2e\x35\x33\
+\x20\x32\x2e\x33\x32\x35\x20\x32\x2e\x33\x32\x35\x20\x30\x20\x30\
+\x20\x30\x2d\x2e\x39\x31\x2d\x2e\x31\x38\x35\x48\x31\x30\x76\x2e\
+\x39\x38\x34\x68\x2e\x30\x39\x63\x2e\x32\x20\x30\x20\x2e\x33\x38\
+\x37\x2e\x30\x33\x38\x2e\x35\x36\x32\x2e\x31\x31\x35\x2e\x31\x37\
+\x34\x2e\x30\x38\x32\x2e\x33\x32\x36\x2e\x31\x38\x38\x2e\x34\x35\
+\x37\x2e\x33\x32\x2e\x31\x32\x37\x2e\x31\x33\x34\x2e\x32\x33\x2e\
+\x32\x39\x2e\x33\x30\x39\x2e\x34\x36\x37\x2e\x30\x37\x34\x2e\x31\
+\x38\x2e\x31\x31\x2e\x33\x37\x2e\x31\x31\x2e\x35\x37\x33\x20\x30\
+\x20\x2e\x32\x32\x38\x2d\x2e\x30\x30\x33\x2e\x34\x35\x32\x2d\x2e\
+\x30\x31\x31\x2e\x36\x37\x32\x2d\x2e\x30\x30\x38\x2e\x32\x32\x38\
+\x2d\x2e\x30\x30\x38\x2e\x34\x35\x20\x30\x20\x2e\x36\x36\x35\x2e\
+\x30\x30\x34\x2e\x32\x32\x32\x2e\x30\x32\x32\x2e\x34\x33\x35\x2e\
+\x30\x35\x35\x2e\x36\x34\x2e\x30\x33\x33\x2e\x32\x31\x34\x2e\x30\
+\x38\x39\x2e\x34\x31\x36\x2e\x31\x36\x38\x2e\x36\x30\x39\x61\x32\
+\x2e\x32\x38\x35\x20\x32\x2e\x32\x38\x35\x20\x30\x20\x30\x20\x30\
+\x20\x2e\x37\x33\x38\x2e\x39\x35\x35\x20\x32\x2e\x32\x38\x35\x20\
+\x32\x2e\x32\x38\x35\x20\x30\x20\x30\x20\x30\x2d\x2e\x37\x33\x38\
+\x2e\x39\x35\x35\x20\x32\x2e\x36\x38\x39\x20\x32\x2e\x36\x38\x39\
+\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\x36\x38\x2e\x36\x30\x32\x63\
+\x2d\x2e\x30\x33\x33\x2e\x32\x31\x2d\x2e\x30\x35\x31\x2e\x34\x32\
+\x33\x2d\x2e\x30\x35\x35\x2e\x36\x34\x61\x39\x2e\x31\x35\x20\x39\
+\x2e\x31\x35\x20\x30\x20\x30\x20\x30\x20\x30\x20\x2e\x36\x36\x36\
+\x63\x2e\x30\x30\x38\x2e\x32\x32\x34\x2e\x30\x31\x32\x2e\x34\x35\
+\x2e\x30\x31\x32\x2e\x36\x37\x38\x61\x31\x2e\x34\x37\x31\x20\x31\
+\x2e\x34\x37\x31\x20\x30\x20\x30\x20\x31\x2d\x2e\x38\x37\x37\x20\
+\x31\x2e\x33\x35\x34\x20\x31\x2e\x33\x33\x20\x31\x2e\x33\x33\x20\
+\x30\x20\x30\x20\x31\x2d\x2e\x35\x36\x33\x2e\x31\x32\x31\x48\x31\
+\x30\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\xc5\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x30\x2e\x35\x37\x20\x31\x2e\
+\x31\x34\x6c\x33\x2e\x32\x38\x20\x33\x2e\x33\x2e\x31\x35\x2e\x33\
+\x36\x76\x39\x2e\x37\x6c\x2d\x2e\x35\x2e\x35\x68\x2d\x31\x31\x6c\
+\x2d\x2e\x35\x2d\x2e\x35\x76\x2d\x31\x33\x6c\x2e\x35\x2d\x2e\x35\
+\x68\x37\x2e\x37\x32\x6c\x2e\x33\x35\x2e\x31\x34\x7a\x4d\x33\x20\
+\x32\x76\x31\x32\x68\x31\x30\x56\x35\x6c\x2d\x33\x2d\x33\x48\x33\
+\x7a\x6d\x31\x2e\x34\x36\x20\x34\x2e\x30\x35\x32\x63\x30\x20\x31\
+\x2e\x32\x38\x37\x2e\x34\x35\x38\x20\x31\x2e\x39\x33\x20\x31\x2e\
+\x33\x37\x34\x20\x31\x2e\x39\x33\x2e\x34\x35\x37\x20\x30\x20\x2e\
+\x38\x30\x37\x2d\x2e\x31\x37\x33\x20\x31\x2e\x30\x35\x2d\x2e\x35\
+\x32\x2e\x32\x34\x36\x2d\x2e\x33\x34\x38\x2e\x33\x36\x38\x2d\x2e\
+\x38\x34\x37\x2e\x33\x36\x38\x2d\x31\x2e\x34\x39\x39\x43\x37\x2e\
+\x32\x35\x32\x20\x34\x2e\x36\x35\x34\x20\x36\x2e\x38\x30\x35\x20\
+\x34\x20\x35\x2e\x39\x31\x20\x34\x63\x2d\x2e\x34\x37\x31\x20\x30\
+\x2d\x2e\x38\x33\x31\x2e\x31\x37\x35\x2d\x31\x2e\x30\x38\x2e\x35\
+\x32\x36\x2d\x2e\x32\x34\x37\x2e\x33\x35\x2d\x2e\x33\x37\x2e\x38\
+\x35\x38\x2d\x2e\x33\x37\x20\x31\x2e\x35\x32\x36\x7a\x6d\x2e\x38\
+\x36\x32\x2d\x2e\x30\x32\x32\x63\x30\x2d\x2e\x39\x32\x32\x2e\x31\
+\x38\x33\x2d\x31\x2e\x33\x38\x33\x2e\x35\x35\x2d\x31\x2e\x33\x38\
+\x33\x2e\x33\x34\x34\x20\x30\x20\x2e\x35\x31\x36\x2e\x34\x34\x38\
+\x2e\x35\x31\x36\x20\x31\x2e\x33\x34\x33\x73\x2d\x2e\x31\x37\x36\
+\x20\x31\x2e\x33\x34\x33\x2d\x2e\x35\x32\x37\x20\x31\x2e\x33\x34\
+\x33\x63\x2d\x2e\x33\x36\x20\x30\x2d\x2e\x35\x34\x2d\x2e\x34\x33\
+\x34\x2d\x2e\x35\x34\x2d\x31\x2e\x33\x30\x33\x7a\x6d\x33\x2e\x31\
+\x38\x37\x20\x31\x2e\x38\x38\x36\x68\x32\x2e\x34\x33\x35\x76\x2d\
+\x2e\x36\x37\x32\x68\x2d\x2e\x37\x39\x32\x56\x34\x6c\x2d\x31\x2e\
+\x36\x36\x35\x2e\x33\x33\x36\x76\x2e\x36\x38\x37\x6c\x2e\x38\x32\
+\x2d\x2e\x31\x37\x37\x76\x32\x2e\x33\x39\x38\x68\x2d\x2e\x37\x39\
+\x38\x76\x2e\x36\x37\x32\x7a\x6d\x2d\x31\x2e\x33\x33\x37\x20\x35\
+\x48\x34\x2e\x37\x33\x36\x76\x2d\x2e\x36\x37\x32\x68\x2e\x37\x39\
+\x38\x56\x39\x2e\x38\x34\x36\x6c\x2d\x2e\x38\x32\x2e\x31\x37\x37\
+\x76\x2d\x2e\x36\x38\x37\x4c\x36\x2e\x33\x38\x20\x39\x76\x33\x2e\
+\x32\x34\x34\x68\x2e\x37\x39\x32\x76\x2e\x36\x37\x31\x7a\x6d\x31\
+\x2e\x30\x33\x35\x2d\x31\x2e\x39\x33\x31\x63\x30\x20\x31\x2e\x32\
+\x38\x37\x2e\x34\x35\x38\x20\x31\x2e\x39\x33\x20\x31\x2e\x33\x37\
+\x35\x20\x31\x2e\x39\x33\x2e\x34\x35\x37\x20\x30\x20\x2e\x38\x30\
+\x37\x2d\x2e\x31\x37\x33\x20\x31\x2e\x30\x35\x2d\x2e\x35\x32\x2e\
+\x32\x34\x35\x2d\x2e\x33\x34\x38\x2e\x33\x36\x38\x2d\x2e\x38\x34\
+\x37\x2e\x33\x36\x38\x2d\x31\x2e\x34\x39\x39\x20\x30\x2d\x31\x2e\
+\x33\x30\x39\x2d\x2e\x34\x34\x38\x2d\x31\x2e\x39\x36\x33\x2d\x31\
+\x2e\x33\x34\x33\x2d\x31\x2e\x39\x36\x33\x2d\x2e\x34\x37\x20\x30\
+\x2d\x2e\x38\x33\x2e\x31\x37\x35\x2d\x31\x2e\x30\x38\x2e\x35\x32\
+\x36\x2d\x2e\x32\x34\x36\x2e\x33\x35\x2d\x2e\x33\x37\x2e\x38\x35\
+\x38\x2d\x2e\x33\x37\x20\x31\x2e\x35\x32\x36\x7a\x6d\x2e\x38\x36\
+\x32\x2d\x2e\x30\x32\x32\x63\x30\x2d\x2e\x39\x32\x32\x2e\x31\x38\
+\x34\x2d\x31\x2e\x33\x38\x33\x2e\x35\x35\x2d\x31\x2e\x33\x38\x33\
+\x2e\x33\x34\x34\x20\x30\x20\x2e\x35\x31\x36\x2e\x34\x34\x38\x2e\
+\x35\x31\x36\x20\x31\x2e\x33\x34\x33\x73\x2d\x2e\x31\x37\x35\x20\
+\x31\x2e\x33\x34\x33\x2d\x2e\x35\x32\x36\x20\x31\x2e\x33\x34\x33\
+\x63\x2d\x2e\x33\x36\x20\x30\x2d\x2e\x35\x34\x2d\x2e\x34\x33\x34\
+\x2d\x2e\x35\x34\x2d\x31\x2e\x33\x30\x33\x7a\x22\x2f\x3e\x3c\x2f\
+\x73\x76\x67\x3e\
+\x00\x00\x01\x48\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x39\x2e\x35\x20\x30\x76\x31\
+\x2e\x35\x4c\x32\x31\x20\x33\x76\x31\x39\x2e\x35\x4c\x31\x39\x2e\
+\x35\x20\x32\x34\x68\x2d\x31\x35\x4c\x33\x20\x32\x32\x2e\x35\x56\
+\x33\x6c\x31\x2e\x35\x2d\x31\x2e\x35\x56\x30\x48\x36\x76\x31\x2e\
+\x35\x68\x33\x56\x30\x68\x31\x2e\x35\x76\x31\x2e\x35\x68\x33\x56\
+\x30\x48\x31\x35\x76\x31\x2e\x35\x68\x33\x56\x30\x68\x31\x2e\x35\
+\x7a\x6d\x2d\x31\x35\x20\x32\x32\x2e\x35\x68\x31\x35\x56\x33\x68\
+\x2d\x31\x35\x76\x31\x39\x2e\x35\x7a\x4d\x37\x2e\x35\x20\x36\x68\
+\x39\x76\x31\x2e\x35\x68\x2d\x39\x56\x36\x7a\x6d\x39\x20\x36\x68\
+\x2d\x39\x76\x31\x2e\x35\x68\x39\x56\x31\x32\x7a\x6d\x2d\x39\x20\
+\x36\x68\x39\x76\x31\x2e\x35\x68\x2d\x39\x56\x31\x38\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x82\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x36\x20\x35\x2e\x39\x31\x34\x6c\
+\x32\x2e\x30\x36\x2d\x32\x2e\x30\x36\x76\x2d\x2e\x37\x30\x38\x4c\
+\x35\x2e\x39\x31\x35\x20\x31\x6c\x2d\x2e\x37\x30\x37\x2e\x37\x30\
+\x37\x2e\x30\x34\x33\x2e\x30\x34\x33\x2e\x32\x35\x2e\x32\x35\x20\
+\x31\x20\x31\x68\x2d\x33\x61\x32\x2e\x35\x20\x32\x2e\x35\x20\x30\
+\x20\x30\x20\x30\x20\x30\x20\x35\x48\x34\x56\x37\x68\x2d\x2e\x35\
+\x61\x31\x2e\x35\x20\x31\x2e\x35\x20\x30\x20\x31\x20\x31\x20\x30\
+\x2d\x33\x68\x33\x4c\x35\x2e\x32\x30\x37\x20\x35\x2e\x32\x39\x33\
+\x20\x35\x2e\x39\x31\x34\x20\x36\x20\x36\x20\x35\x2e\x39\x31\x34\
+\x7a\x4d\x31\x31\x20\x32\x48\x38\x2e\x33\x32\x38\x6c\x2d\x31\x2d\
+\x31\x48\x31\x32\x6c\x2e\x37\x31\x2e\x32\x39\x20\x33\x20\x33\x4c\
+\x31\x36\x20\x35\x76\x39\x6c\x2d\x31\x20\x31\x48\x36\x6c\x2d\x31\
+\x2d\x31\x56\x36\x2e\x35\x6c\x31\x20\x2e\x38\x34\x37\x56\x31\x34\
+\x68\x39\x56\x36\x68\x2d\x34\x56\x32\x7a\x6d\x31\x20\x30\x76\x33\
+\x68\x33\x6c\x2d\x33\x2d\x33\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\
+\x3e\
+\x00\x00\x01\x27\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x32\x20\x32\x68\x31\x32\x6c\x31\
+\x20\x31\x76\x31\x30\x6c\x2d\x31\x20\x31\x48\x32\x6c\x2d\x31\x2d\
+\x31\x56\x33\x6c\x31\x2d\x31\x7a\x6d\x30\x20\x31\x31\x68\x31\x32\
+\x56\x33\x48\x32\x76\x31\x30\x7a\x6d\x31\x31\x2d\x39\x48\x33\x76\
+\x33\x68\x31\x30\x56\x34\x7a\x6d\x2d\x31\x20\x32\x48\x34\x56\x35\
+\x68\x38\x76\x31\x7a\x6d\x2d\x33\x20\x36\x68\x34\x56\x38\x48\x39\
+\x76\x34\x7a\x6d\x31\x2d\x33\x68\x32\x76\x32\x68\x2d\x32\x56\x39\
+\x7a\x4d\x37\x20\x38\x48\x33\x76\x31\x68\x34\x56\x38\x7a\x6d\x2d\
+\x34\x20\x33\x68\x34\x76\x31\x48\x33\x76\x2d\x31\x7a\x22\x2f\x3e\
+\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x38\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x34\
+\x22\x20\x79\x3d\x22\x39\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x34\x22\x20\x79\x3d\x22\x31\x32\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x37\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x34\x22\x20\x79\x3d\x22\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x31\x30\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x22\x20\x79\x3d\x22\x33\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\
+\x3d\x22\x34\x22\x20\x79\x3d\x22\x34\x22\x20\x77\x69\x64\x74\x68\
+\x3d\x22\x31\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x39\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xf2\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x34\x2e\x35\x20\x32\x68\x2d\
+\x31\x33\x6c\x2d\x2e\x35\x2e\x35\x76\x31\x30\x6c\x2e\x35\x2e\x35\
+\x48\x37\x76\x31\x48\x34\x76\x31\x68\x38\x76\x2d\x31\x48\x39\x76\
+\x2d\x31\x68\x35\x2e\x35\x6c\x2e\x35\x2d\x2e\x35\x76\x2d\x31\x30\
+\x6c\x2d\x2e\x35\x2d\x2e\x35\x7a\x4d\x31\x34\x20\x31\x32\x48\x32\
+\x56\x33\x68\x31\x32\x76\x39\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\
+\x3e\
+\x00\x00\x01\x9d\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x35\x20\x32\x2e\x35\x6c\x2e\x35\
+\x2d\x2e\x35\x68\x32\x6c\x2e\x35\x2e\x35\x76\x31\x31\x6c\x2d\x2e\
+\x35\x2e\x35\x68\x2d\x32\x6c\x2d\x2e\x35\x2d\x2e\x35\x76\x2d\x31\
+\x31\x7a\x4d\x36\x20\x33\x76\x31\x30\x68\x31\x56\x33\x48\x36\x7a\
+\x6d\x33\x2e\x31\x37\x31\x2e\x33\x34\x35\x6c\x2e\x32\x39\x39\x2d\
+\x2e\x36\x34\x31\x20\x31\x2e\x38\x38\x2d\x2e\x36\x38\x34\x2e\x36\
+\x34\x2e\x32\x39\x39\x20\x33\x2e\x37\x36\x32\x20\x31\x30\x2e\x33\
+\x33\x36\x2d\x2e\x32\x39\x39\x2e\x36\x34\x31\x2d\x31\x2e\x38\x37\
+\x39\x2e\x36\x38\x34\x2d\x2e\x36\x34\x2d\x2e\x32\x39\x39\x4c\x39\
+\x2e\x31\x37\x20\x33\x2e\x33\x34\x35\x7a\x6d\x31\x2e\x31\x31\x2e\
+\x31\x32\x38\x6c\x33\x2e\x34\x32\x20\x39\x2e\x33\x39\x36\x2e\x39\
+\x34\x2d\x2e\x33\x34\x31\x2d\x33\x2e\x34\x32\x2d\x39\x2e\x33\x39\
+\x37\x2d\x2e\x39\x34\x2e\x33\x34\x32\x7a\x4d\x31\x20\x32\x2e\x35\
+\x6c\x2e\x35\x2d\x2e\x35\x68\x32\x6c\x2e\x35\x2e\x35\x76\x31\x31\
+\x6c\x2d\x2e\x35\x2e\x35\x68\x2d\x32\x6c\x2d\x2e\x35\x2d\x2e\x35\
+\x76\x2d\x31\x31\x7a\x4d\x32\x20\x33\x76\x31\x30\x68\x31\x56\x33\
+\x48\x32\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x38\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x36\x2e\x33\x34\x35\x20\x35\x68\x32\x2e\x31\x76\x36\x2e\x35\x33\
+\x33\x48\x36\x2e\x39\x39\x33\x6c\x2e\x30\x35\x35\x2d\x35\x2e\x33\
+\x31\x2d\x31\x2e\x37\x37\x34\x20\x35\x2e\x33\x31\x48\x34\x2e\x30\
+\x37\x32\x6c\x2d\x31\x2e\x38\x30\x35\x2d\x35\x2e\x33\x31\x63\x2e\
+\x30\x34\x2e\x36\x34\x34\x2e\x30\x36\x20\x35\x2e\x33\x31\x2e\x30\
+\x36\x20\x35\x2e\x33\x31\x48\x31\x56\x35\x68\x32\x2e\x31\x35\x36\
+\x73\x31\x2e\x35\x32\x38\x20\x34\x2e\x34\x39\x33\x20\x31\x2e\x35\
+\x37\x37\x20\x34\x2e\x38\x30\x37\x4c\x36\x2e\x33\x34\x35\x20\x35\
+\x7a\x6d\x36\x2e\x37\x31\x20\x33\x2e\x36\x31\x37\x76\x2d\x33\x2e\
+\x35\x48\x31\x31\x2e\x31\x31\x76\x33\x2e\x35\x48\x39\x2e\x31\x36\
+\x36\x6c\x32\x2e\x39\x31\x37\x20\x32\x2e\x39\x31\x36\x4c\x31\x35\
+\x20\x38\x2e\x36\x31\x37\x68\x2d\x31\x2e\x39\x34\x35\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x04\xac\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x33\x2e\x34\x36\x33\x20\x31\x32\x2e\x38\x36\x6c\x2d\x2e\x30\x30\
+\x35\x2d\x2e\x30\x37\x2e\x30\x30\x35\x2e\x30\x37\x7a\x6d\x37\x2e\
+\x32\x36\x34\x2e\x36\x39\x6c\x2d\x33\x2e\x30\x33\x34\x2d\x33\x2e\
+\x30\x34\x39\x20\x31\x2e\x30\x31\x34\x2d\x31\x2e\x30\x31\x34\x20\
+\x33\x2e\x32\x30\x39\x20\x33\x2e\x32\x32\x35\x20\x33\x2e\x31\x36\
+\x33\x2d\x33\x2e\x31\x36\x33\x20\x31\x2e\x30\x31\x34\x20\x31\x2e\
+\x30\x31\x34\x2d\x33\x2e\x30\x33\x34\x20\x33\x2e\x30\x33\x34\x20\
+\x33\x2e\x30\x33\x34\x20\x33\x2e\x30\x35\x2d\x31\x2e\x30\x31\x34\
+\x20\x31\x2e\x30\x31\x34\x2d\x33\x2e\x32\x30\x39\x2d\x33\x2e\x32\
+\x32\x35\x4c\x38\x2e\x37\x30\x37\x20\x31\x37\x2e\x36\x6c\x2d\x31\
+\x2e\x30\x31\x34\x2d\x31\x2e\x30\x31\x34\x20\x33\x2e\x30\x33\x34\
+\x2d\x33\x2e\x30\x33\x34\x7a\x22\x2f\x3e\x3c\x70\x61\x74\x68\x20\
+\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\
+\x76\x65\x6e\x6f\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x36\x2e\x39\
+\x33\x33\x20\x35\x2e\x30\x30\x33\x56\x36\x68\x31\x2e\x33\x34\x35\
+\x6c\x32\x2e\x38\x34\x33\x2d\x32\x2e\x38\x34\x32\x20\x31\x2e\x30\
+\x31\x34\x20\x31\x2e\x30\x31\x34\x2d\x32\x2e\x36\x39\x32\x20\x32\
+\x2e\x36\x39\x31\x2e\x30\x33\x33\x2e\x30\x38\x35\x61\x31\x33\x2e\
+\x37\x35\x20\x31\x33\x2e\x37\x35\x20\x30\x20\x30\x20\x31\x20\x2e\
+\x38\x38\x35\x20\x34\x2e\x39\x31\x32\x63\x30\x20\x2e\x33\x33\x35\
+\x2d\x2e\x30\x31\x31\x2e\x36\x36\x37\x2d\x2e\x30\x33\x34\x2e\x39\
+\x39\x35\x6c\x2d\x2e\x30\x30\x35\x2e\x30\x37\x35\x68\x33\x2e\x35\
+\x34\x76\x31\x2e\x34\x33\x34\x68\x2d\x33\x2e\x37\x32\x6c\x2d\x2e\
+\x30\x31\x2e\x30\x35\x38\x63\x2d\x2e\x33\x30\x33\x20\x31\x2e\x36\
+\x35\x33\x2d\x2e\x38\x39\x31\x20\x33\x2e\x31\x36\x2d\x31\x2e\x36\
+\x39\x32\x20\x34\x2e\x34\x32\x39\x6c\x2d\x2e\x30\x36\x2e\x30\x39\
+\x34\x20\x33\x2e\x34\x32\x33\x20\x33\x2e\x34\x34\x2d\x31\x2e\x30\
+\x31\x37\x20\x31\x2e\x30\x31\x32\x2d\x33\x2e\x32\x37\x34\x2d\x33\
+\x2e\x32\x39\x2d\x2e\x30\x39\x39\x2e\x31\x31\x63\x2d\x31\x2e\x34\
+\x37\x39\x20\x31\x2e\x36\x35\x34\x2d\x33\x2e\x33\x39\x35\x20\x32\
+\x2e\x36\x34\x36\x2d\x35\x2e\x34\x38\x33\x20\x32\x2e\x36\x34\x36\
+\x2d\x32\x2e\x31\x32\x20\x30\x2d\x34\x2e\x30\x36\x33\x2d\x31\x2e\
+\x30\x32\x33\x2d\x35\x2e\x35\x35\x32\x2d\x32\x2e\x37\x32\x33\x6c\
+\x2d\x2e\x30\x39\x38\x2d\x2e\x31\x31\x33\x2d\x33\x2e\x32\x30\x39\
+\x20\x33\x2e\x32\x30\x38\x2d\x31\x2e\x30\x31\x34\x2d\x31\x2e\x30\
+\x31\x34\x20\x33\x2e\x33\x36\x36\x2d\x33\x2e\x33\x36\x35\x2d\x2e\
+\x30\x35\x39\x2d\x2e\x30\x39\x35\x63\x2d\x2e\x37\x37\x32\x2d\x31\
+\x2e\x32\x35\x2d\x31\x2e\x33\x34\x2d\x32\x2e\x37\x32\x35\x2d\x31\
+\x2e\x36\x33\x36\x2d\x34\x2e\x33\x34\x6c\x2d\x2e\x30\x31\x2d\x2e\
+\x30\x35\x37\x48\x30\x56\x31\x32\x2e\x39\x33\x68\x33\x2e\x35\x33\
+\x38\x6c\x2d\x2e\x30\x30\x35\x2d\x2e\x30\x37\x35\x61\x31\x34\x2e\
+\x32\x33\x20\x31\x34\x2e\x32\x33\x20\x30\x20\x30\x20\x31\x2d\x2e\
+\x30\x33\x34\x2d\x2e\x39\x39\x35\x63\x30\x2d\x31\x2e\x37\x34\x33\
+\x2e\x33\x31\x2d\x33\x2e\x33\x39\x2e\x38\x36\x33\x2d\x34\x2e\x38\
+\x35\x34\x6c\x2e\x30\x33\x32\x2d\x2e\x30\x38\x34\x2d\x32\x2e\x37\
+\x36\x32\x2d\x32\x2e\x37\x37\x36\x4c\x32\x2e\x36\x35\x20\x33\x2e\
+\x31\x33\x35\x20\x35\x2e\x35\x20\x36\x68\x31\x2e\x34\x32\x37\x76\
+\x2d\x2e\x39\x39\x37\x61\x35\x2e\x30\x30\x33\x20\x35\x2e\x30\x30\
+\x33\x20\x30\x20\x30\x20\x31\x20\x31\x30\x2e\x30\x30\x36\x20\x30\
+\x7a\x6d\x2d\x38\x2e\x35\x37\x32\x20\x30\x56\x36\x48\x31\x35\x2e\
+\x35\x76\x2d\x2e\x39\x39\x37\x61\x33\x2e\x35\x36\x39\x20\x33\x2e\
+\x35\x36\x39\x20\x30\x20\x30\x20\x30\x2d\x37\x2e\x31\x33\x38\x20\
+\x30\x7a\x6d\x39\x2e\x38\x20\x32\x2e\x35\x32\x32\x6c\x2d\x2e\x30\
+\x33\x34\x2d\x2e\x30\x39\x48\x35\x2e\x37\x33\x33\x6c\x2d\x2e\x30\
+\x33\x34\x2e\x30\x39\x61\x31\x32\x2e\x33\x32\x38\x20\x31\x32\x2e\
+\x33\x32\x38\x20\x30\x20\x30\x20\x30\x2d\x2e\x37\x36\x36\x20\x34\
+\x2e\x33\x33\x35\x63\x30\x20\x32\x2e\x37\x36\x2e\x38\x36\x32\x20\
+\x35\x2e\x32\x30\x31\x20\x32\x2e\x31\x38\x34\x20\x36\x2e\x39\x32\
+\x20\x31\x2e\x33\x32\x20\x31\x2e\x37\x31\x36\x20\x33\x2e\x30\x33\
+\x36\x20\x32\x2e\x36\x34\x39\x20\x34\x2e\x38\x31\x33\x20\x32\x2e\
+\x36\x34\x39\x20\x31\x2e\x37\x37\x37\x20\x30\x20\x33\x2e\x34\x39\
+\x32\x2d\x2e\x39\x33\x33\x20\x34\x2e\x38\x31\x33\x2d\x32\x2e\x36\
+\x35\x20\x31\x2e\x33\x32\x32\x2d\x31\x2e\x37\x31\x38\x20\x32\x2e\
+\x31\x38\x34\x2d\x34\x2e\x31\x36\x20\x32\x2e\x31\x38\x34\x2d\x36\
+\x2e\x39\x31\x39\x20\x30\x2d\x31\x2e\x35\x37\x34\x2d\x2e\x32\x38\
+\x2d\x33\x2e\x30\x34\x34\x2d\x2e\x37\x36\x36\x2d\x34\x2e\x33\x33\
+\x35\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\x9a\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x38\x20\x31\x2e\x30\x30\x33\x61\
+\x37\x20\x37\x20\x30\x20\x30\x20\x30\x2d\x37\x20\x37\x76\x2e\x34\
+\x33\x63\x2e\x30\x39\x20\x31\x2e\x35\x31\x20\x31\x2e\x39\x31\x20\
+\x31\x2e\x37\x39\x20\x33\x20\x2e\x37\x61\x31\x2e\x38\x37\x20\x31\
+\x2e\x38\x37\x20\x30\x20\x30\x20\x31\x20\x32\x2e\x36\x34\x20\x32\
+\x2e\x36\x34\x63\x2d\x31\x2e\x31\x20\x31\x2e\x31\x36\x2d\x2e\x37\
+\x39\x20\x33\x2e\x30\x37\x2e\x38\x20\x33\x2e\x32\x68\x2e\x36\x61\
+\x37\x20\x37\x20\x30\x20\x31\x20\x30\x20\x30\x2d\x31\x34\x6c\x2d\
+\x2e\x30\x34\x2e\x30\x33\x7a\x6d\x30\x20\x31\x33\x68\x2d\x2e\x35\
+\x32\x61\x2e\x35\x38\x2e\x35\x38\x20\x30\x20\x30\x20\x31\x2d\x2e\
+\x33\x36\x2d\x2e\x31\x34\x2e\x35\x36\x2e\x35\x36\x20\x30\x20\x30\
+\x20\x31\x2d\x2e\x31\x35\x2d\x2e\x33\x20\x31\x2e\x32\x34\x20\x31\
+\x2e\x32\x34\x20\x30\x20\x30\x20\x31\x20\x2e\x33\x35\x2d\x31\x2e\
+\x30\x38\x20\x32\x2e\x38\x37\x20\x32\x2e\x38\x37\x20\x30\x20\x30\
+\x20\x30\x20\x30\x2d\x34\x20\x32\x2e\x38\x37\x20\x32\x2e\x38\x37\
+\x20\x30\x20\x30\x20\x30\x2d\x34\x2e\x30\x36\x20\x30\x20\x31\x20\
+\x31\x20\x30\x20\x30\x20\x31\x2d\x2e\x39\x2e\x33\x34\x2e\x34\x31\
+\x2e\x34\x31\x20\x30\x20\x30\x20\x31\x2d\x2e\x32\x32\x2d\x2e\x31\
+\x32\x2e\x34\x32\x2e\x34\x32\x20\x30\x20\x30\x20\x31\x2d\x2e\x31\
+\x2d\x2e\x32\x39\x76\x2d\x2e\x33\x37\x61\x36\x20\x36\x20\x30\x20\
+\x31\x20\x31\x20\x36\x20\x36\x6c\x2d\x2e\x30\x34\x2d\x2e\x30\x34\
+\x7a\x4d\x39\x20\x33\x2e\x39\x39\x37\x61\x31\x20\x31\x20\x30\x20\
+\x31\x20\x31\x2d\x32\x20\x30\x20\x31\x20\x31\x20\x30\x20\x30\x20\
+\x31\x20\x32\x20\x30\x7a\x6d\x33\x20\x37\x2e\x30\x30\x37\x61\x31\
+\x20\x31\x20\x30\x20\x31\x20\x31\x2d\x32\x20\x30\x20\x31\x20\x31\
+\x20\x30\x20\x30\x20\x31\x20\x32\x20\x30\x7a\x6d\x2d\x37\x2d\x35\
+\x61\x31\x20\x31\x20\x30\x20\x31\x20\x30\x20\x30\x2d\x32\x20\x31\
+\x20\x31\x20\x30\x20\x30\x20\x30\x20\x30\x20\x32\x7a\x6d\x37\x2d\
+\x31\x61\x31\x20\x31\x20\x30\x20\x31\x20\x31\x2d\x32\x20\x30\x20\
+\x31\x20\x31\x20\x30\x20\x30\x20\x31\x20\x32\x20\x30\x7a\x4d\x31\
+\x33\x20\x38\x61\x31\x20\x31\x20\x30\x20\x31\x20\x31\x2d\x32\x20\
+\x30\x20\x31\x20\x31\x20\x30\x20\x30\x20\x31\x20\x32\x20\x30\x7a\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x10\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\
+\x22\x20\x79\x3d\x22\x39\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x39\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x72\
+\x65\x63\x74\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x31\x32\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x38\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x32\x22\x20\x79\x3d\x22\x36\x22\x20\x77\x69\x64\x74\x68\x3d\x22\
+\x31\x32\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x32\x22\x20\x79\x3d\x22\x33\
+\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x31\x22\x20\x68\x65\x69\
+\x67\x68\x74\x3d\x22\x31\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x2f\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x34\x2e\x35\x20\x33\x48\x37\x2e\x37\x31\x6c\x2d\x2e\x38\x35\
+\x2d\x2e\x38\x35\x4c\x36\x2e\x35\x31\x20\x32\x68\x2d\x35\x6c\x2d\
+\x2e\x35\x2e\x35\x76\x31\x31\x6c\x2e\x35\x2e\x35\x68\x31\x33\x6c\
+\x2e\x35\x2d\x2e\x35\x76\x2d\x31\x30\x4c\x31\x34\x2e\x35\x20\x33\
+\x7a\x6d\x2d\x2e\x35\x31\x20\x38\x2e\x34\x39\x56\x31\x33\x68\x2d\
+\x31\x32\x56\x37\x68\x34\x2e\x34\x39\x6c\x2e\x33\x35\x2d\x2e\x31\
+\x35\x2e\x38\x36\x2d\x2e\x38\x36\x48\x31\x34\x76\x31\x2e\x35\x6c\
+\x2d\x2e\x30\x31\x20\x34\x7a\x6d\x30\x2d\x36\x2e\x34\x39\x68\x2d\
+\x36\x2e\x35\x6c\x2d\x2e\x33\x35\x2e\x31\x35\x2d\x2e\x38\x36\x2e\
+\x38\x36\x48\x32\x76\x2d\x33\x68\x34\x2e\x32\x39\x6c\x2e\x38\x35\
+\x2e\x38\x35\x2e\x33\x36\x2e\x31\x35\x48\x31\x34\x6c\x2d\x2e\x30\
+\x31\x2e\x39\x39\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x6e\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x33\x2e\x35\x20\x31\x32\x68\x2d\x31\x2e\x37\x39\x33\x4c\x31\
+\x30\x20\x31\x30\x2e\x32\x39\x33\x56\x36\x2e\x35\x4c\x39\x2e\x35\
+\x20\x36\x48\x38\x56\x34\x68\x2e\x35\x6c\x2e\x35\x2d\x2e\x35\x76\
+\x2d\x32\x4c\x38\x2e\x35\x20\x31\x68\x2d\x32\x6c\x2d\x2e\x35\x2e\
+\x35\x76\x32\x6c\x2e\x35\x2e\x35\x48\x37\x76\x32\x48\x35\x2e\x35\
+\x6c\x2d\x2e\x35\x2e\x35\x76\x33\x2e\x37\x39\x33\x4c\x33\x2e\x32\
+\x39\x33\x20\x31\x32\x48\x31\x2e\x35\x6c\x2d\x2e\x35\x2e\x35\x76\
+\x32\x6c\x2e\x35\x2e\x35\x68\x32\x6c\x2e\x35\x2d\x2e\x35\x76\x2d\
+\x31\x2e\x37\x39\x33\x4c\x35\x2e\x37\x30\x37\x20\x31\x31\x68\x33\
+\x2e\x35\x38\x36\x4c\x31\x31\x20\x31\x32\x2e\x37\x30\x37\x56\x31\
+\x34\x2e\x35\x6c\x2e\x35\x2e\x35\x68\x32\x6c\x2e\x35\x2d\x2e\x35\
+\x76\x2d\x32\x6c\x2d\x2e\x35\x2d\x2e\x35\x7a\x4d\x37\x20\x32\x68\
+\x31\x76\x31\x48\x37\x56\x32\x7a\x4d\x36\x20\x37\x68\x33\x76\x33\
+\x48\x36\x56\x37\x7a\x6d\x2d\x33\x20\x37\x48\x32\x76\x2d\x31\x68\
+\x31\x76\x31\x7a\x6d\x31\x30\x20\x30\x68\x2d\x31\x76\x2d\x31\x68\
+\x31\x76\x31\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xea\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x2e\x35\x20\x31\x68\x31\x33\
+\x6c\x2e\x35\x2e\x35\x76\x31\x32\x6c\x2d\x2e\x35\x2e\x35\x68\x2d\
+\x31\x33\x6c\x2d\x2e\x35\x2d\x2e\x35\x76\x2d\x31\x32\x6c\x2e\x35\
+\x2d\x2e\x35\x7a\x4d\x32\x20\x35\x76\x38\x68\x31\x32\x56\x35\x48\
+\x32\x7a\x6d\x30\x2d\x31\x68\x31\x32\x56\x32\x48\x32\x76\x32\x7a\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x06\x6b\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x34\x2e\x37\x37\x33\x20\x33\
+\x2e\x34\x38\x35\x6c\x2d\x2e\x37\x38\x2d\x2e\x31\x38\x34\x2d\x32\
+\x2e\x31\x30\x38\x20\x32\x2e\x30\x39\x36\x2d\x31\x2e\x31\x39\x34\
+\x2d\x31\x2e\x32\x31\x36\x20\x32\x2e\x30\x35\x36\x2d\x32\x2e\x31\
+\x35\x37\x2d\x2e\x31\x38\x2d\x2e\x37\x39\x32\x61\x34\x2e\x34\x32\
+\x20\x34\x2e\x34\x32\x20\x30\x20\x30\x20\x30\x2d\x31\x2e\x33\x34\
+\x37\x2d\x2e\x32\x32\x38\x20\x33\x2e\x36\x34\x20\x33\x2e\x36\x34\
+\x20\x30\x20\x30\x20\x30\x2d\x31\x2e\x34\x35\x37\x2e\x32\x38\x20\
+\x33\x2e\x38\x32\x34\x20\x33\x2e\x38\x32\x34\x20\x30\x20\x30\x20\
+\x30\x2d\x31\x2e\x31\x38\x36\x2e\x38\x34\x20\x33\x2e\x37\x33\x36\
+\x20\x33\x2e\x37\x33\x36\x20\x30\x20\x30\x20\x30\x2d\x2e\x38\x37\
+\x35\x20\x31\x2e\x32\x36\x35\x20\x33\x2e\x39\x33\x38\x20\x33\x2e\
+\x39\x33\x38\x20\x30\x20\x30\x20\x30\x20\x30\x20\x32\x2e\x39\x36\
+\x36\x20\x33\x33\x35\x2e\x33\x34\x31\x20\x33\x33\x35\x2e\x33\x34\
+\x31\x20\x30\x20\x30\x20\x30\x2d\x36\x2e\x31\x37\x33\x20\x36\x2e\
+\x32\x33\x34\x63\x2d\x2e\x32\x31\x2e\x32\x37\x35\x2d\x2e\x33\x31\
+\x2e\x36\x31\x38\x2d\x2e\x32\x38\x34\x2e\x39\x36\x33\x61\x31\x2e\
+\x34\x30\x33\x20\x31\x2e\x34\x30\x33\x20\x30\x20\x30\x20\x30\x20\
+\x2e\x34\x36\x34\x2e\x39\x36\x37\x63\x2e\x31\x32\x34\x2e\x31\x33\
+\x35\x2e\x32\x37\x32\x2e\x32\x34\x37\x2e\x34\x33\x37\x2e\x33\x32\
+\x38\x2e\x31\x37\x2e\x30\x37\x35\x2e\x33\x35\x33\x2e\x31\x31\x38\
+\x2e\x35\x33\x38\x2e\x31\x32\x37\x2e\x33\x31\x36\x2d\x2e\x30\x30\
+\x36\x2e\x36\x31\x39\x2d\x2e\x31\x32\x36\x2e\x38\x35\x34\x2d\x2e\
+\x33\x33\x37\x20\x31\x2e\x35\x34\x38\x2d\x31\x2e\x34\x35\x37\x20\
+\x34\x2e\x35\x31\x34\x2d\x34\x2e\x34\x35\x20\x36\x2e\x31\x39\x39\
+\x2d\x36\x2e\x32\x30\x34\x2e\x34\x35\x37\x2e\x31\x39\x34\x2e\x39\
+\x34\x38\x2e\x32\x39\x34\x20\x31\x2e\x34\x34\x34\x2e\x32\x39\x33\
+\x61\x33\x2e\x37\x33\x36\x20\x33\x2e\x37\x33\x36\x20\x30\x20\x30\
+\x20\x30\x20\x32\x2e\x36\x37\x37\x2d\x31\x2e\x31\x33\x33\x20\x33\
+\x2e\x38\x38\x35\x20\x33\x2e\x38\x38\x35\x20\x30\x20\x30\x20\x30\
+\x20\x31\x2e\x31\x31\x31\x2d\x32\x2e\x37\x33\x20\x34\x2e\x32\x31\
+\x31\x20\x34\x2e\x32\x31\x31\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\
+\x39\x36\x2d\x31\x2e\x33\x37\x38\x7a\x4d\x32\x2e\x39\x33\x33\x20\
+\x31\x33\x2e\x39\x32\x38\x61\x2e\x33\x31\x2e\x33\x31\x20\x30\x20\
+\x30\x20\x31\x2d\x2e\x31\x33\x35\x2e\x30\x37\x2e\x34\x33\x37\x2e\
+\x34\x33\x37\x20\x30\x20\x30\x20\x31\x2d\x2e\x31\x34\x39\x20\x30\
+\x20\x2e\x33\x34\x36\x2e\x33\x34\x36\x20\x30\x20\x30\x20\x31\x2d\
+\x2e\x31\x34\x34\x2d\x2e\x30\x35\x37\x2e\x33\x33\x36\x2e\x33\x33\
+\x36\x20\x30\x20\x30\x20\x31\x2d\x2e\x31\x31\x34\x2d\x2e\x31\x31\
+\x63\x2d\x2e\x31\x34\x2d\x2e\x31\x34\x33\x2d\x2e\x32\x37\x31\x2d\
+\x2e\x34\x31\x35\x2d\x2e\x31\x34\x2d\x2e\x35\x36\x38\x20\x31\x2e\
+\x33\x37\x2d\x31\x2e\x34\x35\x37\x20\x34\x2e\x31\x39\x31\x2d\x34\
+\x2e\x33\x30\x35\x20\x35\x2e\x39\x35\x35\x2d\x36\x2e\x30\x34\x36\
+\x2e\x31\x2e\x31\x33\x32\x2e\x32\x31\x2e\x32\x35\x38\x2e\x33\x32\
+\x38\x2e\x33\x37\x36\x2e\x31\x31\x38\x2e\x31\x32\x33\x2e\x32\x34\
+\x35\x2e\x32\x33\x37\x2e\x33\x38\x2e\x33\x34\x31\x2d\x31\x2e\x37\
+\x30\x36\x20\x31\x2e\x37\x35\x2d\x34\x2e\x34\x38\x38\x20\x34\x2e\
+\x35\x36\x34\x2d\x35\x2e\x39\x38\x20\x35\x2e\x39\x39\x34\x7a\x6d\
+\x31\x31\x2e\x31\x31\x38\x2d\x39\x2e\x30\x36\x35\x63\x2e\x30\x30\
+\x32\x2e\x37\x36\x35\x2d\x2e\x32\x39\x36\x20\x31\x2e\x35\x2d\x2e\
+\x38\x33\x32\x20\x32\x2e\x30\x34\x38\x61\x32\x2e\x38\x36\x31\x20\
+\x32\x2e\x38\x36\x31\x20\x30\x20\x30\x20\x31\x2d\x34\x2e\x30\x30\
+\x37\x20\x30\x20\x32\x2e\x39\x39\x32\x20\x32\x2e\x39\x39\x32\x20\
+\x30\x20\x30\x20\x31\x2d\x2e\x36\x33\x35\x2d\x33\x2e\x31\x33\x37\
+\x41\x32\x2e\x37\x34\x38\x20\x32\x2e\x37\x34\x38\x20\x30\x20\x30\
+\x20\x31\x20\x31\x30\x2e\x31\x34\x20\x32\x2e\x31\x38\x61\x32\x2e\
+\x37\x36\x20\x32\x2e\x37\x36\x20\x30\x20\x30\x20\x31\x20\x31\x2e\
+\x30\x37\x32\x2d\x2e\x32\x31\x34\x68\x2e\x32\x35\x34\x4c\x39\x2e\
+\x36\x34\x39\x20\x33\x2e\x38\x33\x39\x76\x2e\x36\x39\x36\x6c\x31\
+\x2e\x38\x39\x35\x20\x31\x2e\x38\x38\x36\x68\x2e\x36\x36\x6c\x31\
+\x2e\x38\x34\x37\x2d\x31\x2e\x38\x31\x36\x76\x2e\x32\x35\x38\x7a\
+\x4d\x33\x2e\x32\x34\x20\x36\x2e\x36\x38\x38\x68\x31\x2e\x35\x33\
+\x31\x6c\x2e\x37\x30\x35\x2e\x37\x31\x37\x2e\x36\x37\x38\x2d\x2e\
+\x36\x37\x34\x2d\x2e\x36\x36\x35\x2d\x2e\x36\x37\x38\x56\x36\x2e\
+\x30\x31\x6c\x2e\x30\x35\x37\x2d\x31\x2e\x36\x34\x39\x2d\x2e\x32\
+\x32\x2d\x2e\x34\x33\x37\x2d\x32\x2e\x38\x36\x2d\x31\x2e\x38\x38\
+\x32\x2d\x2e\x35\x39\x31\x2e\x30\x36\x36\x2d\x2e\x38\x33\x31\x2e\
+\x38\x34\x39\x2d\x2e\x30\x36\x36\x2e\x35\x39\x39\x20\x31\x2e\x38\
+\x33\x38\x20\x32\x2e\x39\x31\x38\x2e\x34\x32\x34\x2e\x32\x31\x35\
+\x7a\x6d\x2d\x2e\x39\x34\x35\x2d\x33\x2e\x36\x33\x32\x4c\x34\x2e\
+\x36\x30\x39\x20\x34\x2e\x35\x38\x20\x34\x2e\x35\x37\x20\x35\x2e\
+\x37\x30\x33\x48\x33\x2e\x34\x39\x34\x4c\x32\x2e\x30\x30\x32\x20\
+\x33\x2e\x33\x34\x31\x6c\x2e\x32\x39\x33\x2d\x2e\x32\x38\x35\x7a\
+\x6d\x37\x2e\x31\x30\x35\x20\x36\x2e\x39\x36\x6c\x2e\x36\x37\x34\
+\x2d\x2e\x36\x37\x33\x20\x33\x2e\x31\x30\x36\x20\x33\x2e\x31\x38\
+\x35\x61\x31\x2e\x34\x37\x39\x20\x31\x2e\x34\x37\x39\x20\x30\x20\
+\x30\x20\x31\x20\x30\x20\x32\x2e\x30\x33\x39\x20\x31\x2e\x34\x30\
+\x34\x20\x31\x2e\x34\x30\x34\x20\x30\x20\x30\x20\x31\x2d\x31\x2e\
+\x35\x34\x39\x2e\x33\x31\x35\x20\x31\x2e\x33\x31\x20\x31\x2e\x33\
+\x31\x20\x30\x20\x30\x20\x31\x2d\x2e\x34\x33\x37\x2d\x2e\x33\x31\
+\x35\x6c\x2d\x33\x2e\x31\x34\x32\x2d\x33\x2e\x32\x30\x33\x2e\x36\
+\x37\x39\x2d\x2e\x36\x37\x38\x20\x33\x2e\x31\x33\x32\x20\x33\x2e\
+\x31\x39\x34\x61\x2e\x34\x30\x32\x2e\x34\x30\x32\x20\x30\x20\x30\
+\x20\x30\x20\x2e\x31\x35\x33\x2e\x31\x30\x35\x2e\x34\x37\x37\x2e\
+\x34\x37\x37\x20\x30\x20\x30\x20\x30\x20\x2e\x33\x35\x39\x20\x30\
+\x20\x2e\x34\x30\x33\x2e\x34\x30\x33\x20\x30\x20\x30\x20\x30\x20\
+\x2e\x31\x35\x33\x2d\x2e\x31\x30\x35\x2e\x34\x33\x36\x2e\x34\x33\
+\x36\x20\x30\x20\x30\x20\x30\x20\x2e\x31\x2d\x2e\x31\x35\x33\x2e\
+\x35\x32\x35\x2e\x35\x32\x35\x20\x30\x20\x30\x20\x30\x20\x2e\x30\
+\x33\x36\x2d\x2e\x31\x38\x34\x2e\x35\x34\x37\x2e\x35\x34\x37\x20\
+\x30\x20\x30\x20\x30\x2d\x2e\x30\x33\x35\x2d\x2e\x31\x38\x34\x2e\
+\x34\x33\x36\x2e\x34\x33\x36\x20\x30\x20\x30\x20\x30\x2d\x2e\x31\
+\x2d\x2e\x31\x35\x33\x4c\x39\x2e\x34\x20\x31\x30\x2e\x30\x31\x36\
+\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\x28\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x66\x69\x6c\x6c\
+\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\x64\x64\x22\x20\
+\x63\x6c\x69\x70\x2d\x72\x75\x6c\x65\x3d\x22\x65\x76\x65\x6e\x6f\
+\x64\x64\x22\x20\x64\x3d\x22\x4d\x31\x39\x2e\x38\x35\x20\x38\x2e\
+\x37\x35\x6c\x34\x2e\x31\x35\x2e\x38\x33\x76\x34\x2e\x38\x34\x6c\
+\x2d\x34\x2e\x31\x35\x2e\x38\x33\x20\x32\x2e\x33\x35\x20\x33\x2e\
+\x35\x32\x2d\x33\x2e\x34\x33\x20\x33\x2e\x34\x33\x2d\x33\x2e\x35\
+\x32\x2d\x32\x2e\x33\x35\x2d\x2e\x38\x33\x20\x34\x2e\x31\x35\x48\
+\x39\x2e\x35\x38\x6c\x2d\x2e\x38\x33\x2d\x34\x2e\x31\x35\x2d\x33\
+\x2e\x35\x32\x20\x32\x2e\x33\x35\x2d\x33\x2e\x34\x33\x2d\x33\x2e\
+\x34\x33\x20\x32\x2e\x33\x35\x2d\x33\x2e\x35\x32\x4c\x30\x20\x31\
+\x34\x2e\x34\x32\x56\x39\x2e\x35\x38\x6c\x34\x2e\x31\x35\x2d\x2e\
+\x38\x33\x4c\x31\x2e\x38\x20\x35\x2e\x32\x33\x20\x35\x2e\x32\x33\
+\x20\x31\x2e\x38\x6c\x33\x2e\x35\x32\x20\x32\x2e\x33\x35\x4c\x39\
+\x2e\x35\x38\x20\x30\x68\x34\x2e\x38\x34\x6c\x2e\x38\x33\x20\x34\
+\x2e\x31\x35\x20\x33\x2e\x35\x32\x2d\x32\x2e\x33\x35\x20\x33\x2e\
+\x34\x33\x20\x33\x2e\x34\x33\x2d\x32\x2e\x33\x35\x20\x33\x2e\x35\
+\x32\x7a\x6d\x2d\x31\x2e\x35\x37\x20\x35\x2e\x30\x37\x6c\x34\x2d\
+\x2e\x38\x31\x76\x2d\x32\x6c\x2d\x34\x2d\x2e\x38\x31\x2d\x2e\x35\
+\x34\x2d\x31\x2e\x33\x20\x32\x2e\x32\x39\x2d\x33\x2e\x34\x33\x2d\
+\x31\x2e\x34\x33\x2d\x31\x2e\x34\x33\x2d\x33\x2e\x34\x33\x20\x32\
+\x2e\x32\x39\x2d\x31\x2e\x33\x2d\x2e\x35\x34\x2d\x2e\x38\x31\x2d\
+\x34\x68\x2d\x32\x6c\x2d\x2e\x38\x31\x20\x34\x2d\x31\x2e\x33\x2e\
+\x35\x34\x2d\x33\x2e\x34\x33\x2d\x32\x2e\x32\x39\x2d\x31\x2e\x34\
+\x33\x20\x31\x2e\x34\x33\x4c\x36\x2e\x33\x38\x20\x38\x2e\x39\x6c\
+\x2d\x2e\x35\x34\x20\x31\x2e\x33\x2d\x34\x20\x2e\x38\x31\x76\x32\
+\x6c\x34\x20\x2e\x38\x31\x2e\x35\x34\x20\x31\x2e\x33\x2d\x32\x2e\
+\x32\x39\x20\x33\x2e\x34\x33\x20\x31\x2e\x34\x33\x20\x31\x2e\x34\
+\x33\x20\x33\x2e\x34\x33\x2d\x32\x2e\x32\x39\x20\x31\x2e\x33\x2e\
+\x35\x34\x2e\x38\x31\x20\x34\x68\x32\x6c\x2e\x38\x31\x2d\x34\x20\
+\x31\x2e\x33\x2d\x2e\x35\x34\x20\x33\x2e\x34\x33\x20\x32\x2e\x32\
+\x39\x20\x31\x2e\x34\x33\x2d\x31\x2e\x34\x33\x2d\x32\x2e\x32\x39\
+\x2d\x33\x2e\x34\x33\x2e\x35\x34\x2d\x31\x2e\x33\x7a\x6d\x2d\x38\
+\x2e\x31\x38\x36\x2d\x34\x2e\x36\x37\x32\x41\x33\x2e\x34\x33\x20\
+\x33\x2e\x34\x33\x20\x30\x20\x30\x20\x31\x20\x31\x32\x20\x38\x2e\
+\x35\x37\x20\x33\x2e\x34\x34\x20\x33\x2e\x34\x34\x20\x30\x20\x30\
+\x20\x31\x20\x31\x35\x2e\x34\x33\x20\x31\x32\x61\x33\x2e\x34\x33\
+\x20\x33\x2e\x34\x33\x20\x30\x20\x31\x20\x31\x2d\x35\x2e\x33\x33\
+\x36\x2d\x32\x2e\x38\x35\x32\x7a\x6d\x2e\x39\x35\x36\x20\x34\x2e\
+\x32\x37\x34\x63\x2e\x32\x38\x31\x2e\x31\x38\x38\x2e\x36\x31\x32\
+\x2e\x32\x38\x38\x2e\x39\x35\x2e\x32\x38\x38\x41\x31\x2e\x37\x20\
+\x31\x2e\x37\x20\x30\x20\x30\x20\x30\x20\x31\x33\x2e\x37\x31\x20\
+\x31\x32\x61\x31\x2e\x37\x31\x20\x31\x2e\x37\x31\x20\x30\x20\x31\
+\x20\x30\x2d\x32\x2e\x36\x36\x20\x31\x2e\x34\x32\x32\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x5b\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x33\x2e\x33\x36\x20\x37\x4c\x31\x20\x31\x33\x68\x31\x2e\x33\x34\
+\x6c\x2e\x35\x31\x2d\x31\x2e\x34\x37\x68\x32\x2e\x32\x36\x4c\x35\
+\x2e\x36\x34\x20\x31\x33\x48\x37\x4c\x34\x2e\x36\x35\x20\x37\x48\
+\x33\x2e\x33\x36\x7a\x6d\x2d\x2e\x31\x35\x20\x33\x2e\x35\x33\x6c\
+\x2e\x37\x38\x2d\x32\x2e\x31\x34\x2e\x37\x38\x20\x32\x2e\x31\x34\
+\x48\x33\x2e\x32\x31\x7a\x4d\x31\x31\x2e\x38\x32\x20\x34\x68\x2d\
+\x31\x2e\x36\x4c\x37\x20\x31\x33\x68\x31\x2e\x35\x36\x6c\x2e\x37\
+\x35\x2d\x32\x2e\x32\x39\x68\x33\x2e\x33\x36\x6c\x2e\x37\x37\x20\
+\x32\x2e\x32\x39\x48\x31\x35\x6c\x2d\x33\x2e\x31\x38\x2d\x39\x7a\
+\x4d\x39\x2e\x36\x37\x20\x39\x2e\x35\x6c\x31\x2e\x31\x38\x2d\x33\
+\x2e\x35\x39\x63\x2e\x30\x35\x39\x2d\x2e\x31\x38\x35\x2e\x31\x2d\
+\x2e\x33\x37\x36\x2e\x31\x32\x2d\x2e\x35\x37\x2e\x30\x32\x37\x2e\
+\x31\x39\x32\x2e\x30\x36\x34\x2e\x33\x38\x32\x2e\x31\x31\x2e\x35\
+\x37\x6c\x31\x2e\x32\x35\x20\x33\x2e\x35\x39\x48\x39\x2e\x36\x37\
+\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x20\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x34\x2e\x37\x30\x38\x20\x35\x2e\x35\x37\x38\x4c\x32\x2e\x30\x36\
+\x31\x20\x38\x2e\x32\x32\x34\x6c\x32\x2e\x36\x34\x37\x20\x32\x2e\
+\x36\x34\x36\x2d\x2e\x37\x30\x38\x2e\x37\x30\x38\x2d\x33\x2d\x33\
+\x56\x37\x2e\x38\x37\x6c\x33\x2d\x33\x20\x2e\x37\x30\x38\x2e\x37\
+\x30\x38\x7a\x6d\x37\x2d\x2e\x37\x30\x38\x4c\x31\x31\x20\x35\x2e\
+\x35\x37\x38\x6c\x32\x2e\x36\x34\x37\x20\x32\x2e\x36\x34\x36\x4c\
+\x31\x31\x20\x31\x30\x2e\x38\x37\x6c\x2e\x37\x30\x38\x2e\x37\x30\
+\x38\x20\x33\x2d\x33\x56\x37\x2e\x38\x37\x6c\x2d\x33\x2d\x33\x7a\
+\x4d\x34\x2e\x39\x30\x38\x20\x31\x33\x6c\x2e\x38\x39\x34\x2e\x34\
+\x34\x38\x20\x35\x2d\x31\x30\x4c\x39\x2e\x39\x30\x38\x20\x33\x6c\
+\x2d\x35\x20\x31\x30\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x38\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x36\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x31\x36\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x31\x36\x20\x31\x36\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x63\x75\x72\x72\x65\x6e\x74\x43\
+\x6f\x6c\x6f\x72\x22\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\
+\x31\x33\x2e\x35\x31\x20\x34\x6c\x2d\x35\x2d\x33\x68\x2d\x31\x6c\
+\x2d\x35\x20\x33\x2d\x2e\x34\x39\x2e\x38\x36\x76\x36\x6c\x2e\x34\
+\x39\x2e\x38\x35\x20\x35\x20\x33\x68\x31\x6c\x35\x2d\x33\x20\x2e\
+\x34\x39\x2d\x2e\x38\x35\x76\x2d\x36\x4c\x31\x33\x2e\x35\x31\x20\
+\x34\x7a\x6d\x2d\x36\x20\x39\x2e\x35\x36\x6c\x2d\x34\x2e\x35\x2d\
+\x32\x2e\x37\x56\x35\x2e\x37\x6c\x34\x2e\x35\x20\x32\x2e\x34\x35\
+\x76\x35\x2e\x34\x31\x7a\x4d\x33\x2e\x32\x37\x20\x34\x2e\x37\x6c\
+\x34\x2e\x37\x34\x2d\x32\x2e\x38\x34\x20\x34\x2e\x37\x34\x20\x32\
+\x2e\x38\x34\x2d\x34\x2e\x37\x34\x20\x32\x2e\x35\x39\x4c\x33\x2e\
+\x32\x37\x20\x34\x2e\x37\x7a\x6d\x39\x2e\x37\x34\x20\x36\x2e\x31\
+\x36\x6c\x2d\x34\x2e\x35\x20\x32\x2e\x37\x56\x38\x2e\x31\x35\x6c\
+\x34\x2e\x35\x2d\x32\x2e\x34\x35\x76\x35\x2e\x31\x36\x7a\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x08\
+\x00\x28\x57\x67\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x00\xae\x70\xe7\
+\x00\x74\
+\x00\x79\x00\x70\x00\x65\x00\x73\x00\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0e\
+\x01\xe6\x73\xc7\
+\x00\x6a\
+\x00\x61\x00\x76\x00\x61\x00\x73\x00\x63\x00\x72\x00\x69\x00\x70\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x06\x87\x55\x07\
+\x00\x77\
+\x00\x6f\x00\x72\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x06\xa9\x5a\x27\
+\x00\x70\
+\x00\x64\x00\x66\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x06\
+\x06\xe2\x5a\xc7\
+\x00\x67\
+\x00\x6f\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x09\
+\x07\xd8\xba\xa7\
+\x00\x69\
+\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x08\x3f\x55\x27\
+\x00\x79\
+\x00\x61\x00\x6d\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x08\x9e\x09\x07\
+\x00\x63\
+\x00\x73\x00\x68\x00\x61\x00\x72\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x08\xc4\x54\xc7\
+\x00\x6a\
+\x00\x61\x00\x76\x00\x61\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0c\
+\x08\xd0\x79\xa7\
+\x00\x6d\
+\x00\x61\x00\x72\x00\x6b\x00\x64\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x0a\x73\x5a\x07\
+\x00\x63\
+\x00\x70\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x0a\xa6\x5a\x07\
+\x00\x63\
+\x00\x73\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x0a\xa9\x5a\x07\
+\x00\x63\
+\x00\x73\x00\x76\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x0a\xc8\xf6\x87\
+\x00\x66\
+\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x0a\xca\x5a\x27\
+\x00\x73\
+\x00\x76\x00\x67\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x0b\x3f\x57\x27\
+\x00\x68\
+\x00\x74\x00\x6d\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x0c\xa7\x55\xe7\
+\x00\x72\
+\x00\x75\x00\x73\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x0c\xf7\x16\x47\
+\x00\x63\
+\x00\x6f\x00\x6e\x00\x66\x00\x69\x00\x67\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x08\
+\x0c\xf7\x55\x87\
+\x00\x74\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x07\
+\x0f\x3f\x5a\x27\
+\x00\x78\
+\x00\x6d\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
+\x00\x0a\
+\x0f\x6e\x5b\x87\
+\x00\x70\
+\x00\x79\x00\x74\x00\x68\x00\x6f\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x16\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\xfb\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x02\xae\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x0e\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd7\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x10\x23\
+\x00\x00\x00\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x11\xa9\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x12\xd4\
+\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x14\x10\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x15\x06\
+\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\x16\xa7\
+\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x17\xe3\
+\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x93\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x31\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x45\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x21\x78\
+\x00\x00\x01\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x22\xea\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xd8\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x47\
+\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x73\
+\x00\x00\x01\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x2e\xd2\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x2f\xf6\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x16\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\xfb\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x02\xae\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x0e\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd7\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x10\x23\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x11\xa9\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x12\xd4\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x14\x10\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x15\x06\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\x16\xa7\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x17\xe3\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x36\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x93\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x31\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x20\x45\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x21\x78\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x22\xea\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x23\xd8\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x2a\x47\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x2d\x73\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x2e\xd2\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x2f\xf6\
+\x00\x00\x01\x9a\x5d\x70\xfc\x08\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
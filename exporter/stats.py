@@ -0,0 +1,124 @@
+import heapq
+import threading
+from collections import Counter
+from time import perf_counter
+from typing import Dict, Iterable, List, Tuple
+
+from .walker import FileEntry
+
+# Report order. "ignore" is part of "walk"; "select" is the token budget's
+# counting pass; read-side phases add up across threads
+PHASES = (
+    "walk", "ignore", "select", "read", "hash", "decode", "tokens", "render", "splice",
+)
+
+COUNTERS = (
+    "dirs", "files", "ignored", "exported", "reused", "binary", "skipped",
+    "duplicates", "truncated", "errors",
+)
+
+
+class ExportStats:
+    """Timings and counters collected during one export.
+
+    Pass an instance to ``ExportEngine.generate_file_structure`` (or
+    ``export_directory``) to have it filled in. The engine only touches it
+    behind ``if stats is not None`` checks, so exports without stats pay
+    nothing for the instrumentation. Read-side phases are summed over all
+    reading threads, so with ``jobs > 1`` they can exceed the wall time.
+    """
+
+    def __init__(self, top: int = 10):
+        self.top = top
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.counts: Counter = Counter(dict.fromkeys(COUNTERS, 0))
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.total_seconds = 0.0
+        # Min-heap of (seconds, path) holding the ``top`` slowest files
+        self._slowest: List[Tuple[float, str]] = []
+        self.largest: List[Tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def add_time(self, phase: str, seconds: float):
+        with self._lock:
+            self.phases[phase] += seconds
+
+    def lap(self, phase: str, start: float) -> float:
+        """Charge the time since ``start`` to ``phase`` and return the new start."""
+        now = perf_counter()
+        self.add_time(phase, now - start)
+        return now
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counts[name] += n
+
+    def add_read(self, nbytes: int):
+        with self._lock:
+            self.bytes_read += nbytes
+
+    def ignore_check(self, start: float, ignored: bool):
+        """Walker hook: one ignore decision that started at ``start``."""
+        self.phases["ignore"] += perf_counter() - start
+        if ignored:
+            self.counts["ignored"] += 1
+
+    def file_done(self, path: str, seconds: float):
+        with self._lock:
+            item = (seconds, path)
+            if len(self._slowest) < self.top:
+                heapq.heappush(self._slowest, item)
+            elif item > self._slowest[0]:
+                heapq.heapreplace(self._slowest, item)
+
+    def set_files(self, files: Iterable[FileEntry]):
+        self.largest = heapq.nlargest(self.top, ((e.size, e.rel_path) for e in files))
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        return sorted(self._slowest, reverse=True)
+
+    @property
+    def files_per_second(self) -> float:
+        return self.counts["exported"] / self.total_seconds if self.total_seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_read / self.total_seconds if self.total_seconds else 0.0
+
+    def as_dict(self) -> Dict:
+        """Plain data for JSON, the GUI or other library callers."""
+        return {
+            "total_seconds": self.total_seconds,
+            "phases": dict(self.phases),
+            "counts": dict(self.counts),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "files_per_second": self.files_per_second,
+            "bytes_per_second": self.bytes_per_second,
+            "slowest": [{"path": p, "seconds": s} for s, p in self.slowest],
+            "largest": [{"path": p, "size_bytes": n} for n, p in self.largest],
+        }
+
+    def format_report(self) -> str:
+        total = self.total_seconds or 1e-9
+        lines = [f"Export stats ({self.total_seconds:.3f} s total)", "", "Phases:"]
+        for phase in PHASES:
+            seconds = self.phases[phase]
+            lines.append(f"  {phase:<8} {seconds:9.3f} s  {seconds / total:6.1%}")
+        lines += ["", "Counts:"]
+        lines += [f"  {name:<11} {self.counts[name]:>9}" for name in COUNTERS]
+        lines += [
+            "",
+            f"Read {self.bytes_read / 1e6:.2f} MB, wrote {self.bytes_written / 1e6:.2f} MB",
+            f"Throughput: {self.files_per_second:.0f} files/s, "
+            f"{self.bytes_per_second / 1e6:.1f} MB/s",
+        ]
+        if self._slowest:
+            lines += ["", f"Slowest {len(self._slowest)} files:"]
+            lines += [f"  {s * 1000:9.2f} ms  {p}" for s, p in self.slowest]
+        if self.largest:
+            lines += ["", f"Largest {len(self.largest)} files:"]
+            lines += [f"  {n:>12,} B  {p}" for n, p in self.largest]
+        return "\n".join(lines)
@@ -0,0 +1,231 @@
+import os
+from typing import BinaryIO, Dict, Iterable, Iterator, NamedTuple, Optional
+
+from .chunks import Chunk, iter_chunks
+from .engine import ExportEngine
+from .options import ExportOptions
+from .output import OutputStream
+from .progress import ProgressReporter
+from .records import ReadResult, replace_content
+from .stats import ExportStats
+from .walker import FileEntry, ProjectScan
+from .writers import WRITERS, ExportWriter
+
+# FileRecord.kind values
+KINDS = ("text", "binary", "duplicate", "error")
+
+
+class FileRecord(NamedTuple):
+    """One exported file: a typed view of the record dict the writers render.
+
+    ``data`` is that dict, in the shape the export options produce (with
+    the LLM fields under ``llm_optimize``); the other fields are read
+    from it or from the walk. ``content`` is None for binary files,
+    duplicates and unreadable files.
+    """
+
+    path: str
+    size: int
+    mtime: float
+    kind: str
+    content: Optional[str]
+    data: Dict
+    # SHA-256 of the exported bytes, when hashing was enabled
+    content_hash: Optional[str] = None
+    # Token estimate, when token counting was enabled
+    tokens: Optional[int] = None
+
+    @classmethod
+    def from_result(cls, result: ReadResult) -> "FileRecord":
+        data = result.record
+        if "duplicate_of" in data:
+            kind = "duplicate"
+        elif data.get("binary_type") is not None:
+            kind = "binary"
+        elif data.get("error") is not None:
+            kind = "error"
+        else:
+            kind = "text"
+        entry = result.entry
+        return cls(
+            entry.rel_path, entry.size, entry.mtime, kind, data.get("content"), data,
+            result.digest, result.tokens,
+        )
+
+    @property
+    def metadata(self) -> Dict:
+        """The LLM metadata block; empty without ``llm_optimize``."""
+        return self.data.get("metadata", {})
+
+    @property
+    def duplicate_of(self) -> Optional[str]:
+        return self.data.get("duplicate_of")
+
+    @property
+    def binary_type(self) -> Optional[str]:
+        return self.data.get("binary_type")
+
+    @property
+    def error(self) -> Optional[str]:
+        return self.data.get("error")
+
+    def chunks(
+        self, max_bytes: int = 2048, max_lines: Optional[int] = None, overlap: int = 2
+    ) -> Iterator[Chunk]:
+        """The content split into line-aligned chunks, as the jsonl-chunks format does."""
+        if self.content is None:
+            return iter(())
+        return iter_chunks(self.content, max_bytes, max_lines, overlap)
+
+    def with_content(self, content: str) -> "FileRecord":
+        """A copy with new content, for transforming text records in a pipeline."""
+        if self.kind != "text":
+            raise ValueError(f"{self.path} is a {self.kind} record and has no content")
+        return self._replace(
+            content=content, data=replace_content(self.data, content),
+            content_hash=None, tokens=None,
+        )
+
+
+class ProjectExport:
+    """A lazy export of one project, iterated as FileRecords.
+
+    Nothing happens until the tree or the first record is asked for;
+    then the project is walked once (applying the ignore rules, size
+    limits and token budget of ``options``) and files are read one at a
+    time as the iteration advances, on ``options.jobs`` threads, so
+    memory is bounded by the records in flight rather than the project.
+    Records come in walk order, with duplicates already turned into
+    references under ``options.dedup``.
+
+    Pass the export and the records you keep to a RecordWriter to
+    render them in any format. ``close()`` (or leaving a ``with`` block)
+    stops the reading threads of an abandoned iteration.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        options: Optional[ExportOptions] = None,
+        stats: Optional[ExportStats] = None,
+        progress: Optional[ProgressReporter] = None,
+    ):
+        self.engine = ExportEngine(options)
+        self.root_dir = os.path.normpath(root_dir)
+        self.stats = stats
+        self.progress = progress
+        self._scan: Optional[ProjectScan] = None
+        self._results: Optional[Iterator[ReadResult]] = None
+
+    @property
+    def options(self) -> ExportOptions:
+        return self.engine.options
+
+    @property
+    def scan(self) -> ProjectScan:
+        if self._scan is None:
+            self._scan = self.engine._prepare(self.root_dir, None, self.stats, self.progress)
+        return self._scan
+
+    @property
+    def tree(self) -> str:
+        """The rendered directory tree."""
+        return self.scan.tree
+
+    @property
+    def files(self) -> Iterable[FileEntry]:
+        """The files that will be exported, before any are read."""
+        return () if self.options.structure_only else self.scan.files
+
+    def __iter__(self) -> "ProjectExport":
+        return self
+
+    def __next__(self) -> FileRecord:
+        if self._results is None:
+            self._results = self.engine._iter_results(self.scan, stats=self.stats)
+        result = next(self._results)
+        if self.progress is not None:
+            self.progress.file_done(result.entry.rel_path, result.entry.size)
+        return FileRecord.from_result(result)
+
+    def close(self):
+        if self._results is not None:
+            self._results.close()
+
+    def __enter__(self) -> "ProjectExport":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_export(
+    root_dir: str,
+    options: Optional[ExportOptions] = None,
+    stats: Optional[ExportStats] = None,
+    progress: Optional[ProgressReporter] = None,
+) -> ProjectExport:
+    """Export ``root_dir`` as a lazy stream of FileRecords.
+
+    >>> for record in iter_export("project", ExportOptions(llm_optimize=True)):
+    ...     upload(record.path, record.content, record.metadata)
+    """
+    return ProjectExport(root_dir, options, stats, progress)
+
+
+class RecordWriter:
+    """Renders FileRecords in one export format to a binary stream.
+
+    The tree and header are written on entering the ``with`` block (or
+    by ``begin()``) and the footer on leaving it (or by ``finish()``),
+    so any subset of an export's records, filtered or transformed, makes
+    a complete, well-formed document. ``export_format`` defaults to the
+    export's ``options.export_format``.
+
+    >>> with open("py.json", "wb") as f, RecordWriter(f, export, "json") as writer:
+    ...     writer.write_all(r for r in export if r.path.endswith(".py"))
+    """
+
+    def __init__(self, out: BinaryIO, export: ProjectExport, export_format: Optional[str] = None):
+        export_format = export_format or export.options.export_format
+        if export_format not in WRITERS:
+            raise ValueError(f"unknown export format: {export_format!r}")
+        self.export = export
+        self.writer: ExportWriter = WRITERS[export_format](
+            OutputStream(out), export.root_dir, export.options
+        )
+        self._begun = False
+
+    @property
+    def count(self) -> int:
+        """Records written so far."""
+        return self.writer.count
+
+    def begin(self):
+        if not self._begun:
+            self._begun = True
+            self.writer.begin(self.export.tree)
+
+    def write(self, record: FileRecord):
+        self.begin()
+        self.writer.write_record(record.data)
+
+    def write_all(self, records: Iterable[FileRecord]) -> int:
+        """Write every record of an iterable, returning how many were written."""
+        before = self.count
+        for record in records:
+            self.write(record)
+        return self.count - before
+
+    def finish(self):
+        self.begin()
+        self.writer.finish()
+        self.writer.f.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.finish()
@@ -0,0 +1,150 @@
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from .records import get_semantic_type, placeholder_text
+from .walker import FileEntry
+
+Tokenizer = Callable[[str], int]
+
+# Rough average for source code and English prose with BPE tokenizers
+BYTES_PER_TOKEN = 4
+
+# Lower index is kept first when a token budget forces files out
+SEMANTIC_PRIORITY = (
+    "source_code",
+    "web",
+    "configuration",
+    "documentation",
+    "data",
+    "unknown",
+    "image",
+)
+_PRIORITY = {semantic_type: i for i, semantic_type in enumerate(SEMANTIC_PRIORITY)}
+
+
+def count_bytes(text: str) -> int:
+    """Cheap fallback estimate: one token per BYTES_PER_TOKEN bytes of UTF-8."""
+    return -(-len(text.encode("utf-8")) // BYTES_PER_TOKEN)
+
+
+def count_bytes_of_size(size: int) -> int:
+    """What count_bytes returns for ``size`` bytes of UTF-8, without the text."""
+    return -(-size // BYTES_PER_TOKEN)
+
+
+def _tiktoken(encoding: str = "cl100k_base") -> Tokenizer:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError(
+            "the tiktoken tokenizer needs the tiktoken package (pip install tiktoken)"
+        ) from None
+
+    enc = tiktoken.get_encoding(encoding)
+
+    def count_tiktoken(text: str) -> int:
+        return len(enc.encode(text, disallowed_special=()))
+
+    return count_tiktoken
+
+
+def _auto() -> Tokenizer:
+    try:
+        return _tiktoken()
+    except ImportError:
+        return count_bytes
+
+
+TOKENIZERS: Dict[str, Callable[[], Tokenizer]] = {
+    "bytes": lambda: count_bytes,
+    "tiktoken": _tiktoken,
+    "auto": _auto,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name: str) -> Tokenizer:
+    """Build a named tokenizer once; "auto" uses tiktoken when it is installed."""
+    try:
+        factory = TOKENIZERS[name]
+    except KeyError:
+        raise ValueError(f"unknown tokenizer: {name!r}") from None
+    return factory()
+
+
+def resolve_tokenizer(spec: Union[str, Tokenizer]) -> Tokenizer:
+    """Accept either a tokenizer name or any ``str -> int`` callable."""
+    return spec if callable(spec) else get_tokenizer(spec)
+
+
+def tokenizer_name(spec: Union[str, Tokenizer]) -> str:
+    if callable(spec):
+        return f"{spec.__module__}.{getattr(spec, '__qualname__', repr(spec))}"
+    return spec
+
+
+def record_tokens(record: Dict, tokenizer: Tokenizer) -> int:
+    """Estimate the tokens a record's content contributes to the export."""
+    text = placeholder_text(record)
+    if text is None:
+        text = record.get("content") or record.get("error") or ""
+    return tokenizer(text)
+
+
+def is_readme(rel_path: str) -> bool:
+    """Top-level README files are always exported under a token budget."""
+    return "/" not in rel_path and rel_path.lower().startswith("readme")
+
+
+def file_priority(rel_path: str) -> int:
+    ext = os.path.splitext(rel_path)[1].lower()
+    return _PRIORITY.get(get_semantic_type(ext), len(SEMANTIC_PRIORITY))
+
+
+class BudgetSelection(NamedTuple):
+    """Outcome of fitting a project's files into a token budget."""
+
+    budget: int
+    # Tokens spent outside file contents, such as the directory tree
+    overhead: int
+    kept: List[Tuple[str, int]]
+    dropped: List[Tuple[str, int]]
+
+    @property
+    def used(self) -> int:
+        return self.overhead + sum(tokens for _, tokens in self.kept)
+
+    @property
+    def dropped_tokens(self) -> int:
+        return sum(tokens for _, tokens in self.dropped)
+
+
+def select_within_budget(
+    candidates: Iterable[Tuple[FileEntry, int]],
+    budget: int,
+    overhead: int = 0,
+) -> BudgetSelection:
+    """Greedily keep files by priority until ``budget`` tokens are spent.
+
+    The README comes first and is kept even if it alone exceeds the
+    budget. Then source code before web, configuration, documentation and
+    data files, and within each group smaller files first, so the budget
+    covers as many files as possible. A file that does not fit is dropped
+    but smaller ones after it can still be kept.
+    """
+    def order(candidate):
+        entry, tokens = candidate
+        rel_path = entry.rel_path
+        return (not is_readme(rel_path), file_priority(rel_path), tokens, rel_path)
+
+    used = overhead
+    kept: List[Tuple[str, int]] = []
+    dropped: List[Tuple[str, int]] = []
+    for entry, tokens in sorted(candidates, key=order):
+        if is_readme(entry.rel_path) or used + tokens <= budget:
+            kept.append((entry.rel_path, tokens))
+            used += tokens
+        else:
+            dropped.append((entry.rel_path, tokens))
+    return BudgetSelection(budget, overhead, kept, dropped)
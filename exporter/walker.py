@@ -0,0 +1,150 @@
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Iterable, List, NamedTuple, Optional
+
+from .gitignore import GitIgnoreRules
+
+if TYPE_CHECKING:
+    from .stats import ExportStats
+
+
+class FileEntry(NamedTuple):
+    """A file found during the walk, with stat data taken from its DirEntry."""
+
+    path: str
+    rel_path: str
+    size: int
+    mtime: float
+
+
+class ProjectScan(NamedTuple):
+    """Result of a single traversal: the rendered tree and the files to export."""
+
+    tree: str
+    files: List[FileEntry]
+    # Directories that were descended into, as "" (root) or "a/b/" prefixes
+    dirs: List[str]
+    # True when the walk stopped early because the total size budget ran out
+    budget_exhausted: bool = False
+
+
+IgnoreCheck = Callable[[str, bool], bool]
+
+
+def _never_ignore(rel_path: str, is_dir: bool) -> bool:
+    return False
+
+
+def scan_project(
+    root_dir: str,
+    is_ignored: Optional[IgnoreCheck] = None,
+    exclude: Iterable[str] = (),
+    rules: Optional[GitIgnoreRules] = None,
+    max_total_bytes: Optional[int] = None,
+    max_file_bytes: Optional[int] = None,
+    stats: Optional["ExportStats"] = None,
+    on_dir: Optional[Callable[[str], None]] = None,
+) -> ProjectScan:
+    """Walk root_dir once with os.scandir, building the tree and the file list.
+
+    Ignored directories are pruned before they are descended into, and file
+    sizes and mtimes come from the cached DirEntry stat results, so every
+    path is touched at most once. ``exclude`` holds absolute paths (such as
+    the output file) that are left out of both the tree and the file list.
+    When ``rules`` is given, .gitignore-style rules are applied as each
+    directory is entered and inherited by its subdirectories.
+
+    With ``max_total_bytes`` the walk stops at the first file that would
+    take the running total over budget, so large trees are never fully
+    traversed. Each file counts with its on-disk size, capped at
+    ``max_file_bytes`` since larger files are truncated when read.
+    ``stats`` receives the time spent on ignore decisions and their count.
+    ``on_dir`` is called with each directory's relative path before it is
+    listed; an exception raised there aborts the walk.
+    """
+    root_dir = os.path.normpath(root_dir)
+    is_ignored = is_ignored or _never_ignore
+    excluded = {os.path.abspath(p) for p in exclude}
+
+    tree: List[str] = []
+    files: List[FileEntry] = []
+    dirs: List[str] = []
+    remaining = max_total_bytes
+    # Depth-first pre-order, matching os.walk(topdown=True): a directory's
+    # own files are listed before its subdirectories.
+    stack = [(root_dir, "", 0, True, None)]
+    while stack:
+        dirpath, rel_dir, level, descend, parent_node = stack.pop()
+        tree.append(f"{'│   ' * level}├── {os.path.basename(dirpath)}/")
+        if not descend:
+            continue
+        dirs.append(rel_dir)
+        if on_dir is not None:
+            on_dir(rel_dir)
+
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        if stats is not None:
+            start = perf_counter()
+        node = (
+            rules.enter(rel_dir, parent_node, [e.name for e in entries])
+            if rules is not None else None
+        )
+        if stats is not None:
+            stats.lap("ignore", start)
+
+        subdirs = []
+        dir_files = []
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if stats is not None:
+                start = perf_counter()
+            ignored = is_ignored(rel_path, is_dir) or (
+                node is not None and bool(node.check(rel_path, is_dir))
+            )
+            if stats is not None:
+                stats.ignore_check(start, ignored)
+            if ignored:
+                continue
+            if is_dir:
+                # Like os.walk, list symlinked directories but never follow them
+                subdirs.append(
+                    (entry.name, entry.path, rel_path, not entry.is_symlink())
+                )
+            elif excluded and os.path.abspath(entry.path) in excluded:
+                continue
+            else:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                dir_files.append(
+                    FileEntry(entry.path, rel_path, st.st_size, st.st_mtime)
+                )
+
+        subindent = "│   " * (level + 1)
+        dir_files.sort(key=lambda e: e.rel_path)
+        for file_entry in dir_files:
+            if remaining is not None:
+                cost = file_entry.size
+                if max_file_bytes is not None:
+                    cost = min(cost, max_file_bytes)
+                if cost > remaining:
+                    tree.append(f"{subindent}├── ... (total size budget reached)")
+                    return ProjectScan("\n".join(tree) + "\n", files, dirs, True)
+                remaining -= cost
+            tree.append(f"{subindent}├── {os.path.basename(file_entry.path)}")
+            files.append(file_entry)
+
+        subdirs.sort()
+        for name, path, rel_path, follow in reversed(subdirs):
+            stack.append((path, rel_path + "/", level + 1, follow, node))
+
+    return ProjectScan("\n".join(tree) + "\n", files, dirs)
@@ -0,0 +1,246 @@
+import ctypes
+import ctypes.util
+import dataclasses
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from .engine import ExportEngine, output_artifacts
+from .gitignore import IGNORE_FILES, GitIgnoreRules
+from .options import ExportOptions
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Reported instead of a path when the kernel dropped events
+OVERFLOW = "*"
+# Repository-wide exclude file, relative to the project root
+GIT_EXCLUDE = ".git/info/exclude"
+
+
+class ChangeFilter:
+    """Decides whether a changed path should trigger a re-export.
+
+    Uses the same ignore patterns and .gitignore rules as the export, and
+    drops events on the export's own output and manifest files. Edits to
+    the ignore files themselves always count, even though the export
+    leaves them out, since they change what the export contains.
+    """
+
+    def __init__(self, engine: ExportEngine, root_dir: str, output_file: str):
+        self.engine = engine
+        self.root_dir = root_dir
+        self.excluded = {os.path.abspath(p) for p in output_artifacts(output_file)}
+        self.rules: Optional[GitIgnoreRules] = engine.ignore_rules(root_dir)
+
+    def relevant(self, path: str, is_dir: bool) -> bool:
+        if os.path.abspath(path) in self.excluded:
+            return False
+        rel_path = os.path.relpath(path, self.root_dir).replace(os.sep, "/")
+        if rel_path.startswith(".."):
+            return False
+        if not is_dir and (os.path.basename(path) in IGNORE_FILES or rel_path == GIT_EXCLUDE):
+            # Rules changed; rebuild them before judging further events
+            self.rules = self.engine.ignore_rules(self.root_dir)
+            return True
+        if self.engine.matcher.matches(rel_path, is_dir):
+            return False
+        return not (self.rules is not None and self.rules.matches(rel_path, is_dir))
+
+
+class PollingWatcher:
+    """Portable fallback: re-walks the project and diffs sizes and mtimes."""
+
+    def __init__(self, engine: ExportEngine, root_dir: str, output_file: str,
+                 interval: float = 1.0):
+        self.engine = engine
+        self.root_dir = root_dir
+        self.output_file = output_file
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+        self._next_poll = time.monotonic() + interval
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, float]]:
+        scan = self.engine.scan(self.root_dir, self.output_file)
+        snapshot = {e.rel_path: (e.size, e.mtime) for e in scan.files}
+        snapshot.update((d.rstrip("/"), (-1, 0.0)) for d in scan.dirs if d)
+        # The ignore files are left out of the scan but change its result
+        for rel_path in [d + name for d in scan.dirs for name in IGNORE_FILES] + [GIT_EXCLUDE]:
+            try:
+                st = os.stat(os.path.join(self.root_dir, rel_path))
+            except OSError:
+                continue
+            snapshot[rel_path] = (st.st_size, st.st_mtime)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Block until the next poll (or timeout) and return changed relative paths."""
+        delay = max(0.0, self._next_poll - time.monotonic())
+        if timeout is not None and timeout < delay:
+            time.sleep(timeout)
+            return set()
+        time.sleep(delay)
+        self._next_poll = time.monotonic() + self.interval
+
+        snapshot = self._take_snapshot()
+        old = self._snapshot
+        self._snapshot = snapshot
+        changed = {p for p, v in snapshot.items() if old.get(p) != v}
+        changed.update(p for p in old if p not in snapshot)
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher with one watch per non-ignored directory."""
+
+    def __init__(self, engine: ExportEngine, root_dir: str, output_file: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root_dir = root_dir
+        self.filter = ChangeFilter(engine, root_dir, output_file)
+        self._dirs: Dict[int, str] = {}
+        for rel_dir in engine.scan(root_dir, output_file).dirs:
+            self._watch(os.path.join(root_dir, rel_dir) if rel_dir else root_dir)
+        # .git itself is ignored, but its exclude file holds ignore rules
+        info_dir = os.path.join(root_dir, os.path.dirname(GIT_EXCLUDE))
+        if os.path.isdir(info_dir):
+            self._watch(info_dir)
+
+    def _watch(self, path: str):
+        wd = self._add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def _watch_tree(self, path: str):
+        """Add watches for a newly created directory and its non-ignored subdirectories."""
+        self._watch(path)
+        try:
+            with os.scandir(path) as it:
+                subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return
+        for sub in subdirs:
+            if self.filter.relevant(sub, True):
+                self._watch_tree(sub)
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """Block until events arrive (or timeout) and return changed relative paths."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(OVERFLOW)
+                    continue
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None:
+                    continue
+                path = os.path.join(parent, os.fsdecode(name)) if name else parent
+                is_dir = bool(mask & IN_ISDIR)
+                if not self.filter.relevant(path, is_dir):
+                    continue
+                if is_dir and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+                changed.add(os.path.relpath(path, self.root_dir).replace(os.sep, "/"))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(engine: ExportEngine, root_dir: str, output_file: str,
+                   poll_interval: float = 1.0):
+    """inotify on Linux, polling everywhere else or if inotify is unavailable."""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(engine, root_dir, output_file)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(engine, root_dir, output_file, poll_interval)
+
+
+def watch_project(
+    root_dir: str,
+    output_file: str,
+    options: Optional[ExportOptions] = None,
+    debounce: float = 0.3,
+    poll_interval: float = 1.0,
+    on_export: Optional[Callable[[str, Set[str]], None]] = None,
+    stop: Optional[threading.Event] = None,
+):
+    """Export once, then keep ``output_file`` up to date until ``stop`` is set.
+
+    Bursts of events are collected until the tree has been quiet for
+    ``debounce`` seconds. Re-exports are incremental, so only files whose
+    size or mtime changed are read and rendered again; every other record
+    is spliced from the previous output.
+    """
+    root_dir = os.path.normpath(root_dir)
+    options = dataclasses.replace(options or ExportOptions(), incremental=True)
+    engine = ExportEngine(options)
+    stop = stop or threading.Event()
+
+    engine.generate_file_structure(root_dir, output_file)
+    if on_export:
+        on_export(output_file, set())
+
+    watcher = create_watcher(engine, root_dir, output_file, poll_interval)
+    try:
+        while not stop.is_set():
+            changed = watcher.wait(0.5)
+            if not changed:
+                continue
+            while not stop.is_set():
+                more = watcher.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            engine.generate_file_structure(root_dir, output_file)
+            if on_export:
+                on_export(output_file, changed)
+    finally:
+        watcher.close()
@@ -0,0 +1,249 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from .chunks import iter_chunks
+from .compression import strip_compression_extension
+from .options import FORMAT_EXTENSIONS, ExportOptions
+from .output import OutputStream
+from .records import get_semantic_type, placeholder_text
+
+
+class ExportWriter:
+    """Writes one export to an OutputStream, one file record at a time.
+
+    Writers never hold more than the record they are given, so memory is
+    bounded by the largest single file rather than by the whole project.
+    Each record is written as an optional separator followed by a body
+    that depends only on the record itself; the body's byte span is what
+    the incremental manifest stores and splices.
+    """
+
+    def __init__(self, f: OutputStream, root_dir: str, options: ExportOptions):
+        self.f = f
+        self.root_dir = root_dir
+        self.options = options
+        self.count = 0
+
+    def begin(self, tree: str):
+        """Write everything that precedes the file records."""
+
+    def _write_separator(self):
+        """Write whatever goes between records (depends on the record's position)."""
+
+    def _write_body(self, record: Dict):
+        """Write a single file record."""
+
+    def write_record(self, record: Dict) -> Tuple[int, int]:
+        """Write a record and return the byte span of its body."""
+        self._write_separator()
+        start = self.f.tell()
+        self._write_body(record)
+        self.count += 1
+        return start, self.f.tell()
+
+    def copy_record(self, source: memoryview, offset: int, length: int) -> Tuple[int, int]:
+        """Splice a body rendered by a previous export, returning its new span."""
+        self._write_separator()
+        start = self.f.tell()
+        self.f.copy_from(source, offset, length)
+        self.count += 1
+        return start, self.f.tell()
+
+    def finish(self):
+        """Write everything that follows the file records."""
+
+
+class TextWriter(ExportWriter):
+    """Directory tree followed by XML-style ``<file>`` blocks."""
+
+    def begin(self, tree: str):
+        self.f.write(tree)
+
+    def _write_body(self, record: Dict):
+        path = os.path.join(self.root_dir, record["file_path"])
+        normalized_path = os.path.normpath(path).replace("\\", "/")
+        self.f.write(f'\n<file path="{normalized_path}">\n')
+        placeholder = placeholder_text(record)
+        if placeholder is not None:
+            self.f.write(placeholder + "\n")
+        elif "error" in record:
+            self.f.write(f"Unable to read file content: {record['error']}\n")
+        else:
+            self.f.write(record["content"] + "\n")
+        self.f.write("</file>\n")
+
+
+class MarkdownWriter(ExportWriter):
+    """Markdown document with a fenced tree and one section per file."""
+
+    def begin(self, tree: str):
+        self.f.write(f"# Project Structure: {os.path.basename(self.root_dir)}\n\n")
+        self.f.write("## Directory Tree\n\n```\n")
+        self.f.write(tree)
+        self.f.write("```\n")
+        if not self.options.structure_only:
+            self.f.write("\n## File Contents\n\n")
+
+    def _write_body(self, record: Dict):
+        semantic_type = record.get("semantic_type")
+        if semantic_type is None:
+            ext = os.path.splitext(record["file_path"])[1].lower()
+            semantic_type = get_semantic_type(ext)
+        self.f.write(
+            f"\n### File: `{record['file_path']}`\n"
+            f"Type: {semantic_type}\n\n"
+        )
+        placeholder = placeholder_text(record)
+        if placeholder is not None:
+            self.f.write(placeholder + "\n")
+            return
+        if record.get("error"):
+            content = f"Unable to read file content: {record['error']}"
+        else:
+            content = record["content"]
+        self.f.write(f"```\n{content}\n```\n")
+
+
+class JsonWriter(ExportWriter):
+    """Streams the same document ``json.dump(structure, indent=2)`` produced."""
+
+    def begin(self, tree: str):
+        header = {
+            "project_name": os.path.basename(self.root_dir),
+            "export_date": datetime.now().isoformat(),
+            "structure_only": self.options.structure_only,
+            "llm_optimized": self.options.llm_optimize,
+            "directory_tree": tree,
+        }
+        self.f.write("{")
+        for key, value in header.items():
+            self.f.write(f"\n  {json.dumps(key)}: {json.dumps(value)},")
+        self.f.write('\n  "files": [')
+
+    def _write_separator(self):
+        if self.count:
+            self.f.write(",")
+
+    def _write_body(self, record: Dict):
+        # JSON strings never contain raw newlines, so re-indenting is safe
+        body = json.dumps(record, indent=2).replace("\n", "\n    ")
+        self.f.write("\n    " + body)
+
+    def finish(self):
+        self.f.write("\n  ]\n}" if self.count else "]\n}")
+
+
+class YamlWriter(ExportWriter):
+    """Streams the same document ``yaml.dump(structure)`` produced.
+
+    PyYAML sorts top-level keys, so ``files`` is written between
+    ``export_date`` and ``llm_optimized``.
+    """
+
+    def begin(self, tree: str):
+        import yaml
+
+        self._yaml = yaml
+        self._dump({
+            "directory_tree": tree,
+            "export_date": datetime.now().isoformat(),
+        })
+
+    def _dump(self, data):
+        self._yaml.dump(data, self.f, default_flow_style=False)
+
+    def _write_separator(self):
+        if not self.count:
+            self.f.write("files:\n")
+
+    def _write_body(self, record: Dict):
+        self._dump([record])
+
+    def finish(self):
+        if not self.count:
+            self.f.write("files: []\n")
+        self._dump({
+            "llm_optimized": self.options.llm_optimize,
+            "project_name": os.path.basename(self.root_dir),
+            "structure_only": self.options.structure_only,
+        })
+
+
+class JsonlChunksWriter(ExportWriter):
+    """One JSON object per line: a project header, then overlapping chunks.
+
+    Every file is split by ``iter_chunks`` while its record is being
+    written, so chunks reach the disk as they are produced. Duplicates
+    get a single ``duplicate`` line, binary and unreadable files a
+    ``skipped`` one.
+    """
+
+    def begin(self, tree: str):
+        self._write_line({
+            "type": "project",
+            "project_name": os.path.basename(self.root_dir),
+            "export_date": datetime.now().isoformat(),
+            "structure_only": self.options.structure_only,
+            "llm_optimized": self.options.llm_optimize,
+            "directory_tree": tree,
+        })
+
+    def _write_line(self, data: Dict):
+        self.f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+    def _write_body(self, record: Dict):
+        path = record["file_path"]
+        if "duplicate_of" in record:
+            self._write_line({
+                "type": "duplicate",
+                "file_path": path,
+                "duplicate_of": record["duplicate_of"],
+            })
+            return
+        reason = placeholder_text(record) or record.get("error")
+        if reason is not None:
+            self._write_line({"type": "skipped", "file_path": path, "reason": reason})
+            return
+        semantic_type = record.get("semantic_type")
+        if semantic_type is None:
+            semantic_type = get_semantic_type(os.path.splitext(path)[1].lower())
+        options = self.options
+        for chunk in iter_chunks(
+            record["content"], options.chunk_bytes, options.chunk_lines,
+            options.chunk_overlap,
+        ):
+            self._write_line({
+                "type": "chunk",
+                "file_path": path,
+                "semantic_type": semantic_type,
+                "chunk_index": chunk.index,
+                "byte_start": chunk.byte_start,
+                "byte_end": chunk.byte_end,
+                "line_start": chunk.line_start,
+                "line_end": chunk.line_end,
+                "content_hash": chunk.content_hash,
+                "content": chunk.text,
+            })
+
+
+WRITERS = {
+    "text": TextWriter,
+    "markdown": MarkdownWriter,
+    "json": JsonWriter,
+    "yaml": YamlWriter,
+    "jsonl-chunks": JsonlChunksWriter,
+}
+
+_EXTENSION_FORMATS = {ext: fmt for fmt, ext in FORMAT_EXTENSIONS.items()}
+_EXTENSION_FORMATS[".yml"] = "yaml"
+
+
+def format_for_output(output_file: str, default: Optional[str] = None) -> str:
+    """Pick the format from the output extension, falling back to ``default``.
+
+    A compression extension is looked through: ``export.json.gz`` is JSON.
+    """
+    ext = os.path.splitext(strip_compression_extension(output_file))[1].lower()
+    return _EXTENSION_FORMATS.get(ext) or default or "text"
@@ -1,803 +1,454 @@
-import argparse
-import json
-import os
-import sys
-from datetime import datetime
-from fnmatch import fnmatch
-from typing import Dict, List, Optional, Set
-
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import (
-    QFont,
-    QFontDatabase,
-    QIcon,
-    QStandardItem,
-    QStandardItemModel,
-)
-from PyQt5.QtWidgets import (
-    QApplication,
-    QCheckBox,
-    QComboBox,
-    QFileDialog,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QMainWindow,
-    QPushButton,
-    QSplitter,
-    QTextEdit,
-    QTreeView,
-    QVBoxLayout,
-    QWidget,
-)
-
-
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Project Structure Exporter - Generate project documentation"
-    )
-    parser.add_argument(
-        "directory",
-        nargs="?",
-        help="Directory to process (optional in GUI mode)"
-    )
-    parser.add_argument(
-        "--format",
-        choices=["text", "markdown", "json", "yaml"],
-        default="markdown",
-        help="Output format (default: markdown)"
-    )
-    parser.add_argument(
-        "--structure-only",
-        action="store_true",
-        help="Only export directory structure without file contents"
-    )
-    parser.add_argument(
-        "--llm-optimize",
-        action="store_true",
-        help="Optimize output for Large Language Models"
-    )
-    parser.add_argument(
-        "--output",
-        "-o",
-        help="Output file path (default: auto-generated in project directory)"
-    )
-    parser.add_argument(
-        "--gui",
-        action="store_true",
-        help="Start in GUI mode regardless of other arguments"
-    )
-    return parser.parse_args()
-
-
-class FileItem(QStandardItem):
-    """File/directory item for the tree view with VSCode-style icons."""
-
-    # Icon file paths - will be initialized in setup_icons()
-    ICONS = {}
-    ICON_DIR = os.path.join(os.path.dirname(__file__), "icons")
-
-    @classmethod
-    def setup_icons(cls):
-        """Set up the icon mapping from the icons directory."""
-        # Ensure icons directory exists
-        os.makedirs(cls.ICON_DIR, exist_ok=True)
-
-        # Default fallback icons
-        cls.ICONS = {
-            "folder": QIcon(os.path.join(cls.ICON_DIR, "folder.svg")),
-            "file": QIcon(os.path.join(cls.ICON_DIR, "file.svg")),
-        }
-
-        # Language-specific icons
-        cls.LANGUAGE_ICONS = {
-            # Programming Languages
-            ".py": "python",
-            ".js": "javascript",
-            ".ts": "typescript",
-            ".html": "html",
-            ".css": "css",
-            ".java": "java",
-            ".cpp": "cpp",
-            ".h": "h",
-            ".cs": "csharp",
-            ".go": "go",
-            ".rs": "rust",
-            # Documentation
-            ".md": "markdown",
-            ".txt": "text",
-            ".pdf": "pdf",
-            ".doc": "word",
-            ".docx": "word",
-            # Data formats
-            ".json": "json",
-            ".xml": "xml",
-            ".yaml": "yaml",
-            ".yml": "yaml",
-            ".csv": "csv",
-            # Images
-            ".jpg": "image",
-            ".jpeg": "image",
-            ".png": "image",
-            ".gif": "image",
-            ".svg": "svg",
-            # Config files
-            ".conf": "config",
-            ".ini": "config",
-            ".env": "config",
-            ".cfg": "config",
-        }
-
-    def __init__(self, text: str, is_dir: bool = False):
-        super().__init__(text)
-        self.is_dir = is_dir
-        self.setIcon(self.get_icon())
-
-    def get_icon(self) -> QIcon:
-        if self.is_dir:
-            return self.ICONS.get("folder", QIcon())
-
-        ext = os.path.splitext(self.text())[1].lower()
-        icon_name = self.LANGUAGE_ICONS.get(ext, "file")
-        return self.ICONS.get(icon_name, self.ICONS["file"])
-
-
-class ProjectExportTool(QMainWindow):
-    FONT_PATH = os.path.join(
-        os.path.dirname(__file__),
-        "HarmonyOS_Sans_SC_Regular.ttf"
-    )
-
-    DEFAULT_IGNORE_PATTERNS = {
-        '.git',
-        '.gitignore',
-        '__pycache__',
-        '*.pyc',
-        '.DS_Store',
-        'node_modules',
-        '.idea',
-        '.vscode',
-        '*.log',
-        '*.tmp',
-        '*.temp',
-        '*.swp',
-        '~*',
-        'Thumbs.db',
-        'desktop.ini',
-    }
-
-    def __init__(self):
-        super().__init__()
-        self.current_dir: Optional[str] = None
-        self.file_model = QStandardItemModel()
-        self.ignore_patterns: Set[str] = self.DEFAULT_IGNORE_PATTERNS.copy()
-        self.setWindowTitle("Project File Export Tool")
-        self.setGeometry(100, 100, 1000, 600)
-        self.initUI()
-
-    def initUI(self):
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        self.layout = QVBoxLayout(self.central_widget)
-
-        # Load icon
-        icon_path = os.path.join(os.path.dirname(__file__), "icon-3sizes.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        else:
-            print("Icon file not found")
-
-        # Load and set font
-        font_id = QFontDatabase.addApplicationFont(self.FONT_PATH)
-        if (font_id != -1):
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            font = QFont(font_family, 12)
-            self.setFont(font)
-        else:
-            print("Font loading failed, using system default")
-
-        # Create title
-        title_label = QLabel("Project File Export Tool", self)
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; margin: 15px 0;")
-        self.layout.addWidget(title_label)
-
-        # Create drag area
-        self.drag_label = QLabel("Drag Project Folder Here", self)
-        self.drag_label.setAlignment(Qt.AlignCenter)
-        self.drag_label.setStyleSheet(
-            """
-            QLabel {
-                border: 2px dashed #aaa;
-                border-radius: 5px;
-                padding: 30px;
-                background-color: #f8f8f8;
-                color: #555;
-                font-size: 16px;
-            }
-        """
-        )
-        self.drag_label.setMinimumHeight(120)
-        self.layout.addWidget(self.drag_label)
-
-        # Create select folder button
-        self.select_button = QPushButton("Select Folder", self)
-        self.select_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                border: none;
-                border-radius: 4px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """
-        )
-        self.select_button.clicked.connect(self.select_folder)
-        self.layout.addWidget(self.select_button)
-
-        # Create checkboxes container
-        checkbox_container = QWidget()
-        checkbox_layout = QVBoxLayout(checkbox_container)
-
-        # Create structure-only checkbox
-        self.structure_only_cb = QCheckBox("Export Structure Only")
-        self.structure_only_cb.setToolTip(
-            "Only export the directory structure, not file contents"
-        )
-        checkbox_layout.addWidget(self.structure_only_cb)
-
-        # Create LLM optimization checkbox
-        self.llm_optimize_cb = QCheckBox("Optimize for LLMs")
-        self.llm_optimize_cb.setToolTip(
-            "Enhances output for Large Language Models by:\n"
-            "• Adding semantic file type detection\n"
-            "• Including metadata (size, type, modification date)\n"
-            "• Generating content previews\n"
-            "• Adding structural markers for better parsing\n"
-            "• Chunking large files for RAG systems"
-        )
-        checkbox_layout.addWidget(self.llm_optimize_cb)
-
-        # Create ignore patterns checkbox
-        self.ignore_defaults_cb = QCheckBox("Use Default Ignore Patterns")
-        self.ignore_defaults_cb.setToolTip(
-            "Ignore common files/folders like:\n"
-            "• .git, __pycache__, node_modules\n"
-            "• IDE folders (.vscode, .idea)\n"
-            "• Temporary files (*.tmp, *.log)\n"
-            "• System files (.DS_Store, Thumbs.db)"
-        )
-        self.ignore_defaults_cb.setChecked(True)
-        self.ignore_defaults_cb.stateChanged.connect(self.toggle_ignore_patterns)
-        checkbox_layout.addWidget(self.ignore_defaults_cb)
-
-        # Custom ignore patterns input
-        ignore_layout = QHBoxLayout()
-        self.ignore_input = QLineEdit()
-        self.ignore_input.setPlaceholderText("Add custom ignore pattern (e.g., *.txt)")
-        self.ignore_add_btn = QPushButton("Add")
-        self.ignore_add_btn.clicked.connect(self.add_ignore_pattern)
-        ignore_layout.addWidget(self.ignore_input)
-        ignore_layout.addWidget(self.ignore_add_btn)
-        checkbox_layout.addLayout(ignore_layout)
-
-        # Ignore patterns display
-        self.ignore_display = QTextEdit()
-        self.ignore_display.setReadOnly(True)
-        self.ignore_display.setMaximumHeight(80)
-        self.ignore_display.setPlaceholderText("Current ignore patterns will show here")
-        self.update_ignore_display()
-        checkbox_layout.addWidget(self.ignore_display)
-
-        # Export format selection
-        format_layout = QHBoxLayout()
-        format_label = QLabel("Export Format:")
-        self.format_combo = QComboBox()
-        self.format_combo.addItems(["Text", "Markdown", "JSON", "YAML"])
-        format_layout.addWidget(format_label)
-        format_layout.addWidget(self.format_combo)
-        checkbox_layout.addLayout(format_layout)
-
-        # Export button
-        self.export_button = QPushButton("Export")
-        self.export_button.clicked.connect(self.export_project)
-        checkbox_layout.addWidget(self.export_button)
-
-        self.layout.addWidget(checkbox_container)
-
-        # Create status edit
-        self.status_edit = QLineEdit(self)
-        self.status_edit.setReadOnly(True)
-        self.status_edit.setPlaceholderText("Output status will be shown here")
-        self.status_edit.setStyleSheet(
-            """
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f9f9f9;
-                font-size: 14px;
-            }
-        """
-        )
-        self.layout.addWidget(self.status_edit)
-
-        self.central_widget.setLayout(self.layout)
-
-        # Create main layout with splitter
-        main_widget = QWidget()
-        main_layout = QHBoxLayout(main_widget)
-        splitter = QSplitter(Qt.Horizontal)
-
-        # Left panel - File tree and controls
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-
-        # Search box
-        self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Search files...")
-        self.search_box.textChanged.connect(self.filter_files)
-        left_layout.addWidget(self.search_box)
-
-        # File tree
-        self.file_tree = QTreeView()
-        self.file_tree.setModel(self.file_model)
-        self.file_tree.clicked.connect(self.on_file_clicked)
-        left_layout.addWidget(self.file_tree)
-
-        # Export controls
-        controls_widget = QWidget()
-        controls_layout = QVBoxLayout(controls_widget)
-
-        # Export format selection
-        format_layout = QHBoxLayout()
-        format_label = QLabel("Export Format:")
-        self.format_combo = QComboBox()
-        self.format_combo.addItems(["Text", "Markdown", "JSON", "YAML"])
-        format_layout.addWidget(format_label)
-        format_layout.addWidget(self.format_combo)
-        controls_layout.addLayout(format_layout)
-
-        # Structure-only checkbox
-        self.structure_only_cb = QCheckBox("Export Structure Only")
-        controls_layout.addWidget(self.structure_only_cb)
-
-        # Export button
-        self.export_button = QPushButton("Export")
-        self.export_button.clicked.connect(self.export_project)
-        controls_layout.addWidget(self.export_button)
-
-        left_layout.addWidget(controls_widget)
-
-        # Right panel - Preview
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-
-        preview_label = QLabel("Preview")
-        self.preview_text = QTextEdit()
-        self.preview_text.setReadOnly(True)
-
-        right_layout.addWidget(preview_label)
-        right_layout.addWidget(self.preview_text)
-
-        # Add panels to splitter
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-
-        # Set initial splitter sizes
-        splitter.setSizes([400, 600])
-
-        main_layout.addWidget(splitter)
-        self.setCentralWidget(main_widget)
-
-        # Enable drag and drop
-        self.setAcceptDrops(True)
-
-    def select_folder(self):
-        title = "Select Project Folder"
-        dir_path = QFileDialog.getExistingDirectory(self, title)
-        if dir_path:
-            self.process_folder(dir_path)
-
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        urls = event.mimeData().urls()
-        if urls:
-            dir_path = urls[0].toLocalFile()
-            self.process_folder(dir_path)
-
-    def process_folder(self, dir_path: str):
-        if not os.path.isdir(dir_path):
-            return
-
-        self.current_dir = dir_path
-        self.populate_file_tree(dir_path)
-        self.status_edit.setText(f"Loaded project: {dir_path}")
-
-    def filter_files(self, text: str):
-        if not self.current_dir:
-            return
-
-        self.file_model.clear()
-        self.populate_file_tree(self.current_dir, text.lower())
-
-    def on_file_clicked(self, index):
-        item = self.file_model.itemFromIndex(index)
-        if not item.is_dir:
-            try:
-                filepath = os.path.join(self.current_dir, item.text())
-                with open(filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.preview_text.setText(content)
-            except Exception as e:
-                self.preview_text.setText(f"Unable to read file: {str(e)}")
-
-    def add_items_to_tree(self, items, parent, filter_text=""):
-        """Helper method to add items to the tree model."""
-        for name, is_dir in items:
-            if not filter_text or filter_text in name.lower():
-                item = FileItem(name, is_dir=is_dir)
-                parent.appendRow(item)
-
-    def toggle_ignore_patterns(self, state):
-        if state == Qt.Checked:
-            self.ignore_patterns = self.DEFAULT_IGNORE_PATTERNS.copy()
-        else:
-            self.ignore_patterns.clear()
-        self.update_ignore_display()
-        if self.current_dir:
-            self.populate_file_tree(self.current_dir)
-
-    def add_ignore_pattern(self):
-        pattern = self.ignore_input.text().strip()
-        if pattern:
-            self.ignore_patterns.add(pattern)
-            self.ignore_input.clear()
-            self.update_ignore_display()
-            if self.current_dir:
-                self.populate_file_tree(self.current_dir)
-
-    def update_ignore_display(self):
-        self.ignore_display.setText("\n".join(sorted(self.ignore_patterns)))
-
-    def should_ignore(self, path: str) -> bool:
-        """Check if a path should be ignored based on patterns."""
-        name = os.path.basename(path)
-        return any(
-            fnmatch(name, pattern) for pattern in self.ignore_patterns
-        )
-
-    def populate_file_tree(self, directory: str, filter_text: str = ""):
-        """Populate the file tree with directory contents."""
-        self.file_model.clear()
-        root = self.file_model.invisibleRootItem()
-
-        # Get all directories and files at the root level
-        try:
-            items = []
-            with os.scandir(directory) as it:
-                for entry in it:
-                    if not self.should_ignore(entry.path):
-                        items.append((entry.name, entry.is_dir()))
-
-            # Sort directories first, then files
-            dirs = [(n, d) for n, d in items if d]
-            files = [(n, d) for n, d in items if not d]
-
-            # Add to tree
-            self.add_items_to_tree(sorted(dirs), root, filter_text)
-            self.add_items_to_tree(sorted(files), root, filter_text)
-
-        except OSError as e:
-            print(f"Error reading directory: {e}")
-
-    def export_project(self):
-        if not self.current_dir:
-            return
-
-        export_format = self.format_combo.currentText().lower()
-        extension = {"text": ".txt", "markdown": ".md", "json": ".json", "yaml": ".yaml"}.get(export_format, ".txt")
-
-        project_name = os.path.basename(self.current_dir)
-        filename = f"{project_name}_structure"
-        if not self.structure_only_cb.isChecked():
-            filename += "_and_content"
-        filename += extension
-
-        output_file = os.path.join(self.current_dir, filename)
-        self.generate_file_structure(self.current_dir, output_file)
-        self.status_edit.setText(f"Export completed: {output_file}")
-
-    def write_file_content(self, f, filepath, is_markdown, root_dir):
-        """Write the content of a single file to the output."""
-        normalized_path = os.path.normpath(filepath).replace("\\", "/")
-        rel_path = os.path.relpath(normalized_path, root_dir)
-
-        if is_markdown:
-            f.write(f"\n### File: `{rel_path}`\n\n```\n")
-        else:
-            f.write(f'\n<file path="{normalized_path}">\n')
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                content = file.read()
-                f.write(content + "\n")
-        except Exception as e:
-            f.write(f"Unable to read file content: {e}\n")
-
-        if is_markdown:
-            f.write("```\n")
-        else:
-            f.write("</file>\n")
-
-    def write_file_content_llm(self, f, filepath: str, root_dir: str) -> Dict:
-        """Write file content optimized for LLMs."""
-        normalized_path = os.path.normpath(filepath).replace("\\", "/")
-        rel_path = os.path.relpath(normalized_path, root_dir)
-
-        try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                content = file.read()
-
-                # Get file metadata
-                stat = os.stat(filepath)
-                ext = os.path.splitext(filepath)[1].lower()
-
-                # Chunk content if it's large
-                content_preview = content[:200]
-                if len(content) > 200:
-                    content_preview += "..."
-
-                # Create semantic chunk with enhanced metadata
-                chunk = {
-                    "file_path": rel_path,
-                    "file_type": ext[1:] if ext else "unknown",
-                    "size_bytes": stat.st_size,
-                    "last_modified": datetime.fromtimestamp(
-                        stat.st_mtime
-                    ).isoformat(),
-                    "semantic_type": self._get_semantic_type(ext, content),
-                    "content_preview": content_preview,
-                    "content_size": len(content),
-                    "content": content,
-                    "metadata": {
-                        "is_binary": not self._is_text_file(content),
-                        "line_count": content.count('\n') + 1,
-                        "extension": ext,
-                    }
-                }
-                return chunk
-        except Exception as e:
-            return {
-                "file_path": rel_path,
-                "error": str(e),
-                "content": None
-            }
-
-    def _is_text_file(self, content: str) -> bool:
-        """Check if content appears to be text."""
-        try:
-            content.encode('utf-8')
-            return True
-        except UnicodeError:
-            return False
-
-    def _get_semantic_type(self, ext: str, content: str) -> str:
-        """Determine semantic type of file content."""
-        if ext in ['.py', '.js', '.java', '.cpp', '.cs']:
-            return "source_code"
-        elif ext in ['.md', '.txt', '.rst']:
-            return "documentation"
-        elif ext in ['.json', '.yaml', '.yml', '.xml']:
-            return "data"
-        elif ext in ['.jpg', '.png', '.gif', '.svg']:
-            return "image"
-        elif ext in ['.html', '.css']:
-            return "web"
-        elif ext in ['.conf', '.ini', '.env']:
-            return "configuration"
-        return "unknown"
-
-    def generate_file_structure(self, root_dir: str, output_file: str):
-        """Generate the file structure and content output."""
-        is_markdown = output_file.endswith(".md")
-        is_json = output_file.endswith(".json")
-        is_yaml = output_file.endswith(".yaml")
-
-        if is_json or is_yaml:
-            self._generate_structured_output(
-                root_dir,
-                output_file,
-                is_yaml
-            )
-            return
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            if is_markdown:
-                self.write_markdown_header(f, root_dir)
-
-            f.write(self.get_directory_tree(root_dir, output_file))
-
-            if is_markdown:
-                f.write("```\n")
-
-            if not self.structure_only_cb.isChecked():
-                if is_markdown:
-                    f.write("\n## File Contents\n\n")
-
-                for dirpath, _, filenames in os.walk(root_dir):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        if self.should_ignore(filepath):
-                            continue
-                        if is_markdown:
-                            chunk = self.write_file_content_llm(f, filepath, root_dir)
-                            f.write(
-                                f"\n### File: `{chunk['file_path']}`\n"
-                                f"Type: {chunk['semantic_type']}\n\n"
-                                "```\n"
-                                f"{chunk['content']}\n"
-                                "```\n"
-                            )
-                        else:
-                            self.write_file_content(f, filepath, is_markdown, root_dir)
-
-    def write_markdown_header(self, f, root_dir):
-        """Write the Markdown header section."""
-        f.write(f"# Project Structure: {os.path.basename(root_dir)}\n\n")
-        f.write("## Directory Tree\n\n```\n")
-
-    def get_directory_tree(self, root_dir, output_file):
-        """Generate a tree view of the directory structure."""
-        tree = []
-        for dirpath, dirnames, filenames in os.walk(root_dir):
-            level = dirpath.replace(root_dir, "").count(os.sep)
-            indent = "│   " * (level)
-            tree.append(f"{indent}├── {os.path.basename(dirpath)}/")
-            subindent = "│   " * (level + 1)
-            for f in filenames:
-                if os.path.join(dirpath, f) == output_file:
-                    continue
-                tree.append(f"{subindent}├── {f}")
-        return "\n".join(tree) + "\n"
-
-    def _generate_structured_output(
-        self,
-        root_dir: str,
-        output_file: str,
-        is_yaml: bool = False
-    ):
-        """Generate structured output in JSON/YAML format."""
-        structure = {
-            "project_name": os.path.basename(root_dir),
-            "export_date": datetime.now().isoformat(),
-            "structure_only": self.structure_only_cb.isChecked(),
-            "llm_optimized": self.llm_optimize_cb.isChecked(),
-            "directory_tree": self.get_directory_tree(root_dir, output_file),
-            "files": []
-        }
-
-        if not self.structure_only_cb.isChecked():
-            for dirpath, _, filenames in os.walk(root_dir):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if self.should_ignore(filepath):
-                        continue
-                    if filepath == output_file:
-                        continue
-                    if self.llm_optimize_cb.isChecked():
-                        chunk = self.write_file_content_llm(
-                            None, filepath, root_dir
-                        )
-                        structure["files"].append(chunk)
-                    else:
-                        try:
-                            with open(filepath, "r", encoding="utf-8") as f:
-                                content = f.read()
-                                structure["files"].append({
-                                    "file_path": os.path.relpath(
-                                        filepath, root_dir
-                                    ),
-                                    "content": content
-                                })
-                        except Exception as e:
-                            structure["files"].append({
-                                "file_path": os.path.relpath(
-                                    filepath, root_dir
-                                ),
-                                "error": str(e)
-                            })
-
-        with open(output_file, "w", encoding="utf-8") as f:
-            if is_yaml:
-                import yaml
-                yaml.dump(structure, f, default_flow_style=False)
-            else:
-                json.dump(structure, f, indent=2)
-
-    @staticmethod
-    def process_directory(
-        directory: str,
-        output_file: Optional[str] = None,
-        export_format: str = "markdown",
-        structure_only: bool = False,
-        llm_optimize: bool = False
-    ) -> str:
-        """Process a directory from command line."""
-        tool = ProjectExportTool()
-
-        if not output_file:
-            project_name = os.path.basename(directory)
-            filename = f"{project_name}_structure"
-            if not structure_only:
-                filename += "_and_content"
-            extension = {
-                "text": ".txt",
-                "markdown": ".md",
-                "json": ".json",
-                "yaml": ".yaml"
-            }.get(export_format, ".txt")
-            output_file = os.path.join(directory, filename + extension)
-
-        # Set up tool state
-        tool.current_dir = directory
-        tool.structure_only_cb.setChecked(structure_only)
-        tool.llm_optimize_cb.setChecked(llm_optimize)
-        tool.format_combo.setCurrentText(export_format.capitalize())
-
-        # Generate output
-        tool.generate_file_structure(directory, output_file)
-        return output_file
-
-
-def main():
-    """Main entry point supporting both GUI and CLI modes."""
-    args = parse_args()
-
-    # Initialize icon system
-    FileItem.setup_icons()
-
-    if args.gui or not args.directory:
-        # Start GUI mode
-        app = QApplication(sys.argv)
-        app.setStyle("Fusion")
-
-        # Set up font
-        font_id = QFontDatabase.addApplicationFont(ProjectExportTool.FONT_PATH)
-        if font_id != -1:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            font = QFont(font_family, 12)
-            app.setFont(font)
-
-        window = ProjectExportTool()
-        if args.directory:
-            window.process_folder(args.directory)
-        window.show()
-        sys.exit(app.exec_())
-    else:
-        # CLI mode
-        try:
-            output_file = ProjectExportTool.process_directory(
-                directory=args.directory,
-                output_file=args.output,
-                export_format=args.format,
-                structure_only=args.structure_only,
-                llm_optimize=args.llm_optimize
-            )
-            print(f"Export completed successfully: {output_file}")
-        except Exception as e:
-            print(f"Error: {str(e)}", file=sys.stderr)
-            sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+import argparse
+import os
+import sys
+from typing import Optional
+
+from exporter import ExportEngine, ExportOptions, ExportStats, default_output_path
+from exporter.options import parse_size
+
+# Kept in sync with exporter.daemon, which is only imported in daemon modes
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+DEFAULT_CONCURRENCY = 4
+
+
+def size_argument(text: str) -> int:
+    """argparse type for byte counts with an optional k/M/G suffix."""
+    try:
+        return parse_size(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+class RequestArgumentParser(argparse.ArgumentParser):
+    """Parser for daemon requests: errors are raised instead of exiting."""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def parse_args(argv=None, parser_class=argparse.ArgumentParser):
+    """Parse command line arguments."""
+    parser = parser_class(
+        description="Project Structure Exporter - Generate project documentation"
+    )
+    parser.add_argument(
+        "directories",
+        nargs="*",
+        metavar="directory",
+        help="Directory to process (optional in GUI mode); several directories "
+             "are exported as a batch"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "markdown", "json", "yaml", "jsonl-chunks"],
+        default="markdown",
+        help="Output format (default: markdown)"
+    )
+    parser.add_argument(
+        "--structure-only",
+        action="store_true",
+        help="Only export directory structure without file contents"
+    )
+    parser.add_argument(
+        "--llm-optimize",
+        action="store_true",
+        help="Optimize output for Large Language Models"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file path (default: auto-generated in project directory)"
+    )
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd", "xz"],
+        help="Compress the output while writing it (implied by a .gz, .zst or "
+             ".xz output name; zstd needs the zstandard package)"
+    )
+    parser.add_argument(
+        "--compress-level",
+        type=int,
+        help="Compression level on the codec's own scale (default: gzip 6, "
+             "zstd 3, xz 6)"
+    )
+    parser.add_argument(
+        "--no-gitignore",
+        action="store_true",
+        help="Do not apply .gitignore, .ignore and .git/info/exclude rules"
+    )
+    parser.add_argument(
+        "--source",
+        choices=["walk", "git"],
+        default="walk",
+        help="Where to find the files: walk the directory, or list them from "
+             "the git index (git ls-files; walks when not in a git work tree; "
+             "default: walk)"
+    )
+    parser.add_argument(
+        "--untracked",
+        action="store_true",
+        help="With --source git, also export untracked files that git does not ignore"
+    )
+    parser.add_argument(
+        "--binary",
+        choices=["placeholder", "skip"],
+        default="placeholder",
+        help="How to export binary files: a size/type placeholder or nothing "
+             "(default: placeholder)"
+    )
+    parser.add_argument(
+        "--max-file-bytes",
+        type=size_argument,
+        help="Truncate files larger than this many bytes (accepts k/M/G suffixes)"
+    )
+    parser.add_argument(
+        "--max-total-bytes",
+        type=size_argument,
+        help="Stop the walk once exported files would exceed this many bytes"
+    )
+    parser.add_argument(
+        "--truncate",
+        choices=["head-tail", "head"],
+        default="head-tail",
+        help="What to keep of files over --max-file-bytes (default: head-tail)"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Replace files whose content repeats an earlier file with a reference to it"
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        help="Export only the highest-priority files that fit in this many tokens"
+    )
+    parser.add_argument(
+        "--tokenizer",
+        choices=["bytes", "tiktoken", "auto"],
+        default="bytes",
+        help="Token counter: a bytes/4 estimate, tiktoken, or tiktoken when "
+             "installed (default: bytes)"
+    )
+    parser.add_argument(
+        "--chunk-bytes",
+        type=size_argument,
+        default=2048,
+        help="jsonl-chunks: maximum chunk size in bytes (default: 2048)"
+    )
+    parser.add_argument(
+        "--chunk-lines",
+        type=int,
+        help="jsonl-chunks: maximum lines per chunk (default: no limit)"
+    )
+    parser.add_argument(
+        "--chunk-overlap",
+        type=int,
+        default=2,
+        help="jsonl-chunks: lines repeated at the start of the next chunk (default: 2)"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of threads reading files concurrently (default: 1)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Keep a manifest next to the output and only re-read changed files"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Stay running and regenerate the export whenever files change"
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print a per-phase timing breakdown, counts and the slowest and "
+             "largest files"
+    )
+    parser.add_argument(
+        "--stats-top",
+        type=int,
+        default=10,
+        help="Number of slowest and largest files listed by --stats (default: 10)"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Write a cProfile profile of the export to FILE (view it with "
+             "python -m pstats FILE); reader threads are not profiled, so "
+             "combine with --jobs 1"
+    )
+    parser.add_argument(
+        "--batch-file",
+        metavar="FILE",
+        help="Export every project listed in FILE, one directory per line, "
+             "optionally followed by a tab and its output path"
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="Batch mode: write all exports into this directory instead of "
+             "each project's own"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Batch mode: number of projects exported in parallel (default: "
+             "number of CPUs)"
+    )
+    parser.add_argument(
+        "--batch-report",
+        metavar="FILE",
+        help="Batch mode: also write the summary report to FILE as JSON"
+    )
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=DEFAULT_ADDRESS,
+        metavar="ADDRESS",
+        help="Run a local export daemon on ADDRESS (host:port on localhost, or "
+             f"unix:/path/to/socket; default: {DEFAULT_ADDRESS})"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Daemon: exports served at once (default: {DEFAULT_CONCURRENCY})"
+    )
+    parser.add_argument(
+        "--connect",
+        metavar="ADDRESS",
+        help="Have the daemon at ADDRESS run this export and write what it "
+             "streams back to --output, or to stdout"
+    )
+    parser.add_argument(
+        "--gui",
+        action="store_true",
+        help="Start in GUI mode regardless of other arguments"
+    )
+    args = parser.parse_args(argv)
+    for flag, name, smallest in ((args.chunk_bytes, "--chunk-bytes", 1),
+                                 (args.chunk_lines, "--chunk-lines", 1),
+                                 (args.chunk_overlap, "--chunk-overlap", 0)):
+        if flag is not None and flag < smallest:
+            parser.error(f"{name} must be at least {smallest}")
+    args.batch = bool(args.batch_file) or len(args.directories) > 1
+    if args.batch:
+        for flag, name in ((args.output, "--output"), (args.watch, "--watch"),
+                           (args.profile, "--profile"), (args.gui, "--gui")):
+            if flag:
+                parser.error(f"{name} cannot be used with several directories; "
+                             f"use --output-dir or a batch file")
+        if args.stats:
+            parser.error("--stats cannot be used with several directories; "
+                         "--batch-report saves per-project timings")
+    args.directory = args.directories[0] if args.directories else None
+    return args
+
+
+def build_options(args) -> ExportOptions:
+    """ExportOptions for the export flags of parsed command line arguments."""
+    return ExportOptions(
+        export_format=args.format,
+        structure_only=args.structure_only,
+        llm_optimize=args.llm_optimize,
+        use_gitignore=not args.no_gitignore,
+        file_source=args.source,
+        git_untracked=args.untracked,
+        jobs=args.jobs,
+        incremental=args.incremental,
+        binary_policy=args.binary,
+        max_file_bytes=args.max_file_bytes,
+        max_total_bytes=args.max_total_bytes,
+        truncate_mode=args.truncate,
+        dedup=args.dedup,
+        compress=args.compress,
+        compress_level=args.compress_level,
+        token_budget=args.token_budget,
+        tokenizer=args.tokenizer,
+        chunk_bytes=args.chunk_bytes,
+        chunk_lines=args.chunk_lines,
+        chunk_overlap=args.chunk_overlap,
+    )
+
+
+def run_watch(directory: str, output_file: Optional[str], options: ExportOptions):
+    """Keep the export up to date until interrupted."""
+    from exporter.watch import watch_project
+
+    output_file = output_file or default_output_path(directory, options)
+
+    def report(path, changed):
+        if changed:
+            print(f"Re-exported {path} ({len(changed)} changed path(s))")
+        else:
+            print(f"Export completed successfully: {path}")
+            print("Watching for changes, press Ctrl+C to stop")
+
+    try:
+        watch_project(directory, output_file, options, on_export=report)
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def run_profiled(profile_file: str, func, *args):
+    """Run ``func(*args)`` under cProfile and dump the profile to ``profile_file``."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        profiler.dump_stats(profile_file)
+        print(f"Profile written to {profile_file}")
+
+
+def run_batch_cli(args, options: ExportOptions):
+    """Export every project given on the command line or in a batch file."""
+    import json
+    from time import perf_counter
+
+    from exporter.batch import (
+        BatchJob,
+        format_report,
+        plan_jobs,
+        read_batch_file,
+        report_dict,
+        run_batch,
+    )
+
+    try:
+        jobs = [BatchJob(os.path.normpath(d), "") for d in args.directories]
+        if args.batch_file:
+            jobs += read_batch_file(args.batch_file)
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+        jobs = plan_jobs(jobs, options, args.output_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    results = []
+    start = perf_counter()
+    for result in run_batch(jobs, options, args.processes):
+        results.append(result)
+        status = "done" if result.ok else "FAILED"
+        print(f"[{len(results)}/{len(jobs)}] {status} {result.directory} "
+              f"({result.seconds:.2f}s)", flush=True)
+    wall_seconds = perf_counter() - start
+
+    print()
+    print(format_report(results, wall_seconds))
+    if args.batch_report:
+        with open(args.batch_report, "w", encoding="utf-8") as f:
+            json.dump(report_dict(results, wall_seconds), f, indent=2)
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+def parse_request(argv):
+    """Turn a daemon request's command line into (directory, output name, options)."""
+    args = parse_args(argv, RequestArgumentParser)
+    for flag, name in ((args.batch, "batch mode"), (args.watch, "--watch"),
+                       (args.serve, "--serve"), (args.gui, "--gui"),
+                       (args.profile, "--profile")):
+        if flag:
+            raise ValueError(f"{name} is not available through the daemon")
+    return args.directory, args.output, build_options(args)
+
+
+def run_client(args):
+    """Send this command line to a running daemon and save what it streams back."""
+    from exporter.daemon import DaemonError, request_export
+
+    argv = sys.argv[1:]
+    try:
+        if not args.output:
+            request_export(args.connect, argv, sys.stdout.buffer)
+            return
+        # Replaced only once the whole export has arrived, like a local export
+        target = args.output + ".partial"
+        try:
+            with open(target, "wb") as f:
+                request_export(args.connect, argv, f)
+            os.replace(target, args.output)
+        except BaseException:
+            if os.path.exists(target):
+                os.remove(target)
+            raise
+        print(f"Export completed successfully: {args.output}", file=sys.stderr)
+    except (DaemonError, OSError, ValueError) as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def report_selection(selection):
+    """Summarize which files a token budget left out."""
+    print(
+        f"Token budget: ~{selection.used} of {selection.budget} tokens used, "
+        f"{len(selection.kept)} file(s) kept"
+    )
+    if selection.dropped:
+        print(
+            f"Dropped {len(selection.dropped)} file(s), "
+            f"~{selection.dropped_tokens} tokens:"
+        )
+        for path, tokens in selection.dropped:
+            print(f"  {path} (~{tokens} tokens)")
+
+
+def main():
+    """Main entry point supporting both GUI and CLI modes."""
+    args = parse_args()
+
+    if args.serve:
+        from exporter.daemon import serve
+
+        try:
+            serve(args.serve, parse_request, args.concurrency)
+        except (OSError, ValueError) as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+    elif args.connect:
+        run_client(args)
+    elif args.batch:
+        run_batch_cli(args, build_options(args))
+    elif args.gui or not args.directory:
+        # Start GUI mode; PyQt5 is only imported on this path
+        from exporter.gui import run_gui
+
+        sys.exit(run_gui(args.directory))
+    else:
+        # CLI mode
+        options = build_options(args)
+        if args.watch:
+            run_watch(args.directory, args.output, options)
+            return
+        try:
+            output_file = args.output or default_output_path(args.directory, options)
+            engine = ExportEngine(options)
+            stats = ExportStats(args.stats_top) if args.stats else None
+            if args.profile:
+                run_profiled(args.profile, engine.generate_file_structure,
+                             args.directory, output_file, stats)
+            else:
+                engine.generate_file_structure(args.directory, output_file, stats)
+            print(f"Export completed successfully: {output_file}")
+            if engine.selection is not None:
+                report_selection(engine.selection)
+            if stats is not None:
+                print()
+                print(stats.format_report())
+        except Exception as e:
+            print(f"Error: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()